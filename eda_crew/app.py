@@ -1,9 +1,127 @@
 import streamlit as st
 import os
-import pandas as pd
-from tempfile import NamedTemporaryFile
 import time
-from main import run_eda_on_file
+from eda_crew.tools.dataset import get_dataset_handle, release_dataset_handle
+from eda_crew.tools.sampling import DEFAULT_SAMPLE_ROWS, block_sample
+from eda_crew.tools.sources import as_csv_path, source_exists
+from eda_crew.tools.report_writer import load_report_index, read_report_section
+from eda_crew.jobs import FAILED, IN_FLIGHT, get_job_queue
+
+# Report sections rendered per page of the report view
+SECTIONS_PER_PAGE = 3
+
+# Seconds between status checks of a running job
+JOB_POLL_SECONDS = 1.0
+
+REPORT_MIME_TYPES = {".md": "text/markdown", ".html": "text/html", ".json": "application/json"}
+
+
+def register_upload(uploaded_file):
+    """
+    Register the upload as an in-memory CSV once per upload and return its path.
+
+    The bytes are handed over from the upload without a temporary file or a
+    copy (``getvalue()`` returns the uploaded bytes themselves), and the preview
+    and the analysis parse them through the same dataset handle. The path is
+    kept in the session so Streamlit reruns reuse it; the previous upload is
+    released when a new one arrives.
+    """
+    upload_id = getattr(uploaded_file, 'file_id', None) or f"{uploaded_file.name}:{uploaded_file.size}"
+    if st.session_state.get('upload_id') == upload_id and source_exists(st.session_state.get('upload_path', '')):
+        return st.session_state.upload_path
+
+    previous_path = st.session_state.get('upload_path')
+    if previous_path:
+        release_dataset_handle(previous_path)
+
+    st.session_state.upload_id = upload_id
+    st.session_state.upload_path = as_csv_path(uploaded_file, name=uploaded_file.name)
+    return st.session_state.upload_path
+
+
+def show_report(report_path):
+    """
+    Render a report one page of sections at a time.
+
+    Only the sections on the current page are read from disk (via the report's
+    section index), so memory and render time do not grow with the column count.
+    """
+    st.subheader("EDA Report")
+    index = load_report_index(report_path)
+    if not index or index.get("format") != "markdown":
+        with open(report_path, 'r') as f:
+            st.markdown(f.read(), unsafe_allow_html=True)
+    else:
+        sections = index["sections"]
+        pages = max(1, -(-len(sections) // SECTIONS_PER_PAGE))
+        page = 1
+        if pages > 1:
+            page = int(st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1))
+            start = (page - 1) * SECTIONS_PER_PAGE
+            st.caption(" · ".join(section["title"] for section in sections[start:start + SECTIONS_PER_PAGE]))
+        start = (page - 1) * SECTIONS_PER_PAGE
+        for section in sections[start:start + SECTIONS_PER_PAGE]:
+            st.markdown(read_report_section(report_path, section), unsafe_allow_html=True)
+
+    # Download button for the report
+    extension = os.path.splitext(report_path)[1] or ".md"
+    with open(report_path, 'rb') as f:
+        st.download_button(
+            label="Download Report",
+            data=f,
+            file_name=f"eda_report_{time.strftime('%Y%m%d_%H%M%S')}{extension}",
+            mime=REPORT_MIME_TYPES.get(extension, "text/plain")
+        )
+
+
+def show_job(job_id):
+    """Show the status of a job, polling until it finishes, then its report."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        st.warning(f"Unknown analysis job: {job_id}")
+        return
+
+    st.subheader(f"Analysis of {job['name']}")
+    if job["status"] in IN_FLIGHT:
+        stage = job["stage"] or "waiting for a worker"
+        st.progress(job["progress"], text=f"{job['status'].capitalize()}: {stage}")
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+    elif job["status"] == FAILED:
+        st.error(f"Error during analysis: {job['error']}")
+    else:
+        st.success(f"Analysis completed in {job['finished_at'] - job['started_at']:.2f} seconds!")
+        st.caption("Stage timings: " + ", ".join(
+            f"{stage} {seconds:.2f}s" for stage, seconds in job["timings"].items()))
+        if os.path.exists(job["report_path"] or ""):
+            show_report(job["report_path"])
+        else:
+            st.warning("The report file of this job no longer exists.")
+
+
+def remember_job(job_id):
+    """Add a job to the ones this session may list; the queue is shared with other users."""
+    job_ids = st.session_state.setdefault('job_ids', [])
+    if job_id not in job_ids:
+        job_ids.append(job_id)
+
+
+def show_recent_jobs():
+    """List the jobs of this session, so results can be reopened."""
+    job_ids = st.session_state.get('job_ids')
+    if not job_ids:
+        return
+    jobs = get_job_queue().list_jobs(job_ids=job_ids)
+    if not jobs:
+        return
+    with st.expander("Recent analyses"):
+        for job in jobs:
+            created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(job["created_at"]))
+            label = f"{created} · {job['name']} · {job['status']}"
+            if st.button(label, key=f"job-{job['id']}"):
+                st.query_params["job"] = job["id"]
+                st.rerun()
+
 
 def main():
     st.set_page_config(page_title="EDA Tool", page_icon="📊", layout="wide")
@@ -22,68 +140,72 @@ def main():
     if uploaded_file is not None:
         # Create a preview of the data
         try:
-            df_preview = pd.read_csv(uploaded_file)
+            upload_path = register_upload(uploaded_file)
+            handle = get_dataset_handle(upload_path)
+
+            # Sampled mode never parses the whole file: fast answers with error bounds
+            sampled = st.checkbox("Sampled analysis (faster on very large files)")
+            sample_rows = None
+            if sampled:
+                sample_rows = int(st.number_input("Rows to sample", min_value=1_000,
+                                                  value=DEFAULT_SAMPLE_ROWS, step=10_000))
+
             st.subheader("Data Preview")
-            st.dataframe(df_preview.head(5))
-            
+            # Computed once per upload and sample size; reruns (e.g. while a job is polled) reuse them
+            preview_key = (st.session_state.upload_id, sample_rows)
+            if st.session_state.get('preview_key') != preview_key:
+                if sampled:
+                    preview = handle.sample(5)
+                    sample, sample_info = block_sample(upload_path, sample_rows)
+                    scale = sample_info["estimated_total_rows"] / len(sample) if len(sample) else 0
+                    metrics = {
+                        "rows": sample_info["estimated_total_rows"],
+                        "columns": sample.shape[1],
+                        "missing": int(round(sample.isnull().sum().sum() * scale)),
+                    }
+                else:
+                    # Parse once; the analysis reuses this frame through the same handle
+                    preview = handle.dataframe().head(5)
+                    metrics = handle.metrics()
+                st.session_state.preview = preview
+                st.session_state.preview_metrics = metrics
+                st.session_state.preview_key = preview_key
+            st.dataframe(st.session_state.preview)
+            metrics = st.session_state.preview_metrics
+
             # Display basic info
-            st.subheader("Basic Information")
+            st.subheader("Basic Information" + (" (estimated from sample)" if sampled else ""))
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Rows", df_preview.shape[0])
+                st.metric("Rows", metrics["rows"])
             with col2:
-                st.metric("Columns", df_preview.shape[1])
+                st.metric("Columns", metrics["columns"])
             with col3:
-                st.metric("Missing Values", df_preview.isna().sum().sum())
-            
-            # Reset file pointer
-            uploaded_file.seek(0)
+                st.metric("Missing Values", metrics["missing"])
             
-            # Button to start analysis
+            fast_path = st.checkbox("Fast path (statistics computed directly; the crew writes only the recommendations)",
+                                    value=True)
+
+            # Button to start analysis; the work runs in the shared job queue, not in this script
             if st.button("Run Exploratory Data Analysis"):
-                with st.spinner("Running analysis... This may take a few minutes."):
-                    # Create a temporary file from the uploaded file
-                    with NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-                        tmp_file.write(uploaded_file.getvalue())
-                        tmp_path = tmp_file.name
-                    
-                    # Run the EDA pipeline
-                    try:
-                        start_time = time.time()
-                        result = run_eda_on_file(tmp_path)
-                        elapsed_time = time.time() - start_time
-                        
-                        st.success(f"Analysis completed in {elapsed_time:.2f} seconds!")
-                        
-                        # Get the report file path from the result and convert to absolute path
-                        report_path = os.path.abspath(result.strip())
-                        
-                        # Read the report content from the file
-                        with open(report_path, 'r') as f:
-                            report_content = f.read()
-                        
-                        # Display the report content
-                        st.subheader("EDA Report")
-                        st.markdown(report_content, unsafe_allow_html=True)
-                        
-                        # Download button for the report
-                        st.download_button(
-                            label="Download Report",
-                            data=report_content,
-                            file_name=f"eda_report_{time.strftime('%Y%m%d_%H%M%S')}.md",
-                            mime="text/markdown"
-                        )
-                    
-                    except Exception as e:
-                        st.error(f"Error during analysis: {str(e)}")
-                    
-                    finally:
-                        # Clean up the temporary file
-                        if os.path.exists(tmp_path):
-                            os.unlink(tmp_path)
-        
+                try:
+                    profile_options = {"sample_rows": sample_rows} if sampled else None
+                    st.query_params["job"] = get_job_queue().submit(
+                        upload_path, profile_options=profile_options, fast_path=fast_path, name=uploaded_file.name)
+                    remember_job(st.query_params["job"])
+                except Exception as e:
+                    st.error(f"Error submitting the analysis: {str(e)}")
+
         except Exception as e:
             st.error(f"Error reading the CSV file: {str(e)}")
 
+    # The job id is kept in the URL, so a reload picks up the same job
+    job_id = st.query_params.get("job")
+    if job_id:
+        remember_job(job_id)
+    show_recent_jobs()
+    if job_id:
+        show_job(job_id)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
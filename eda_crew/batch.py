@@ -0,0 +1,175 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+
+from eda_crew.crew import create_eda_crew, create_recommendation_crew
+from eda_crew.main import run_eda_on_file
+from eda_crew.tools.profile_cache import file_fingerprint
+
+# Where the per-file status of a batch run is recorded unless told otherwise
+DEFAULT_INDEX_PATH = os.path.join("reports", "batch_index.json")
+
+# Files analyzed at once
+DEFAULT_BATCH_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+
+
+def find_csv_files(targets: List[str]) -> List[str]:
+    """
+    Expand directories (searched recursively), glob patterns and plain paths into CSV files.
+
+    Returns:
+        List[str]: Absolute paths, sorted and without duplicates.
+    """
+    files = set()
+    for target in targets:
+        if os.path.isdir(target):
+            matches = glob.glob(os.path.join(target, "**", "*.csv"), recursive=True)
+        elif glob.has_magic(target):
+            matches = glob.glob(target, recursive=True)
+        else:
+            matches = [target]
+        files.update(os.path.abspath(path) for path in matches if os.path.isfile(path))
+    return sorted(files)
+
+
+def load_index(index_path: str) -> Dict[str, Any]:
+    """The batch index at ``index_path``, or an empty one."""
+    try:
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    index.setdefault("files", {})
+    return index
+
+
+def _write_index(index_path: str, index: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def _is_done(entry: Optional[Dict[str, Any]], csv_path: str) -> bool:
+    """True if the file was analyzed successfully, is unchanged since, and its report still exists."""
+    return (
+        entry is not None
+        and entry.get("status") == "done"
+        and entry.get("fingerprint") == file_fingerprint(csv_path)
+        and os.path.exists(entry.get("report_path") or "")
+    )
+
+
+# Per-process state of the pool workers, built once by ``_init_worker``
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(profile_options: Optional[Dict[str, Any]], fast_path: bool) -> None:
+    """Build the crew once per worker process; every file of the worker gets a copy of it."""
+    _worker["profile_options"] = profile_options
+    _worker["fast_path"] = fast_path
+    _worker["crew"] = (create_recommendation_crew() if fast_path
+                       else create_eda_crew(profile_options=profile_options))
+
+
+def _analyze_file(csv_path: str) -> Dict[str, Any]:
+    timings: Dict[str, float] = {}
+    entry: Dict[str, Any] = {"fingerprint": file_fingerprint(csv_path), "started_at": time.time()}
+    try:
+        # A fresh copy per file, so task outputs and agent state do not carry over between files
+        crew = _worker["crew"].copy()
+        entry["report_path"] = os.path.abspath(run_eda_on_file(
+            csv_path, profile_options=_worker["profile_options"], fast_path=_worker["fast_path"],
+            timings=timings, return_path=True, crew=crew))
+        entry["status"] = "done"
+    except Exception as e:
+        entry["status"] = "failed"
+        entry["error"] = str(e)
+    entry["timings"] = timings
+    entry["finished_at"] = time.time()
+    return entry
+
+
+def run_batch(targets: List[str], index_path: str = DEFAULT_INDEX_PATH,
+              workers: int = DEFAULT_BATCH_WORKERS,
+              profile_options: Optional[Dict[str, Any]] = None,
+              fast_path: bool = False, resume: bool = True) -> Dict[str, Any]:
+    """
+    Analyze many CSV files across a pool of worker processes.
+
+    Each worker process builds its crew once and runs a cheap copy of it for
+    every file it gets. The index at ``index_path`` records per-file status, timings, report
+    path and error, and is rewritten after every file, so an interrupted batch
+    can be resumed: with ``resume`` files that already succeeded and have not
+    changed since are skipped.
+
+    Args:
+        targets (List[str]): Directories, glob patterns or CSV paths
+        index_path (str): Where the batch index is written
+        workers (int): Maximum number of files analyzed at once
+        profile_options (dict, optional): Options for the CSV analysis tool
+        fast_path (bool): Use the fast path of ``run_eda_on_file``
+        resume (bool): Skip files the index already records as done
+
+    Returns:
+        Dict[str, Any]: The index, with ``files`` keyed by path and a ``summary``
+        of the counts per status.
+    """
+    index = load_index(index_path) if resume else {"files": {}}
+    files = find_csv_files(targets)
+    pending = [path for path in files if not (resume and _is_done(index["files"].get(path), path))]
+    index["options"] = {"profile_options": profile_options, "fast_path": fast_path}
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(pending))), initializer=_init_worker,
+                                 initargs=(profile_options, fast_path)) as executor:
+            futures = {executor.submit(_analyze_file, path): path for path in pending}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    # The worker process itself died
+                    entry = {"status": "failed", "error": str(e), "finished_at": time.time()}
+                index["files"][path] = entry
+                _write_index(index_path, index)
+                print(f"[{entry['status']}] {path}", file=sys.stderr)
+
+    summary: Dict[str, int] = {"total": len(files), "skipped": len(files) - len(pending)}
+    for path in files:
+        status = index["files"].get(path, {}).get("status", "missing")
+        summary[status] = summary.get(status, 0) + 1
+    index["summary"] = summary
+    _write_index(index_path, index)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run exploratory data analysis on many CSV files.")
+    parser.add_argument("targets", nargs="+", help="Directories, glob patterns or CSV files")
+    parser.add_argument("--workers", type=int, default=DEFAULT_BATCH_WORKERS,
+                        help="Files analyzed at once (default: %(default)s)")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH,
+                        help="Path of the batch index (default: %(default)s)")
+    parser.add_argument("--fast", action="store_true", help="Use the fast path for every file")
+    parser.add_argument("--no-resume", action="store_true", help="Analyze files the index records as done")
+    parser.add_argument("--sample-rows", type=int, help="Profile a sample of about this many rows per file")
+    args = parser.parse_args()
+
+    profile_options = {"sample_rows": args.sample_rows} if args.sample_rows else None
+    index = run_batch(args.targets, index_path=args.index, workers=args.workers,
+                      profile_options=profile_options, fast_path=args.fast, resume=not args.no_resume)
+    print(", ".join(f"{status}: {count}" for status, count in index["summary"].items()))
+    print(f"Index written to {args.index}")
+    sys.exit(1 if index["summary"].get("failed") else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from eda_crew.main import run_eda_on_file
+from eda_crew.test_csv import validate_csv_path
+from eda_crew.tools.artifacts import get_artifact_store
+from eda_crew.tools.csv_tool import analyze_csv
+from eda_crew.tools.dataset import release_dataset_handle
+from eda_crew.tools.report_tool import ReportGenerationTool
+
+BENCHMARK_VERSION = 1
+
+# Rows written per call when generating synthetic files
+GENERATE_CHUNK_ROWS = 100_000
+
+# Seconds between RSS samples while a stage runs
+RSS_POLL_SECONDS = 0.005
+
+# Relative slowdown (or memory growth) that counts as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# Absolute changes below these are timer or allocator noise, never regressions
+MIN_REGRESSION_DELTA = {"seconds": 0.05, "rss_growth_mb": 10.0}
+
+# Stages that parse the whole file, so MB/s and rows/s describe them; validation
+# reads a bounded sample and the report works from the stored profile
+THROUGHPUT_STAGES = ("analyze", "end_to_end")
+
+# Parameters of the synthetic files; ``--scale`` multiplies the row counts
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "small": {"rows": 10_000, "numeric_cols": 5, "categorical_cols": 3, "text_cols": 1},
+    "tall": {"rows": 500_000, "numeric_cols": 8, "categorical_cols": 3, "text_cols": 1},
+    "wide": {"rows": 5_000, "numeric_cols": 500, "categorical_cols": 20, "text_cols": 0},
+    "text_heavy": {"rows": 100_000, "numeric_cols": 2, "categorical_cols": 4, "text_cols": 6,
+                   "cardinality": 5_000},
+    "sparse": {"rows": 200_000, "numeric_cols": 10, "categorical_cols": 2, "text_cols": 0,
+               "missing_rate": 0.4},
+}
+
+def generate_csv(path: str, rows: int, numeric_cols: int = 5, categorical_cols: int = 2,
+                 text_cols: int = 1, missing_rate: float = 0.05, cardinality: int = 20,
+                 seed: int = 0) -> str:
+    """
+    Write a synthetic CSV with a controlled shape and dtype mix.
+
+    Numeric columns alternate between integers and floats, categorical columns
+    draw from ``cardinality`` labels with a skewed (Zipf-like) frequency, and
+    text columns hold random, mostly unique strings. Every column except the
+    first loses ``missing_rate`` of its values. Rows are generated and written
+    in chunks, so files larger than memory can be produced.
+
+    Returns:
+        str: ``path``
+    """
+    rng = np.random.default_rng(seed)
+    labels = np.array([f"cat_{idx}" for idx in range(max(1, cardinality))], dtype=object)
+    weights = 1.0 / np.arange(1, len(labels) + 1)
+    weights /= weights.sum()
+    alphabet = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+
+    with open(path, 'w', newline='') as f:
+        for start in range(0, max(rows, 1), GENERATE_CHUNK_ROWS):
+            count = min(GENERATE_CHUNK_ROWS, rows - start)
+            columns: Dict[str, Any] = {}
+            for idx in range(numeric_cols):
+                if idx % 2 == 0:
+                    columns[f"num_{idx}"] = rng.integers(-1_000, 1_000_000, count).astype(float)
+                else:
+                    columns[f"num_{idx}"] = rng.normal(idx * 10.0, idx + 1.0, count)
+            for idx in range(categorical_cols):
+                columns[f"cat_{idx}"] = rng.choice(labels, count, p=weights)
+            for idx in range(text_cols):
+                lengths = rng.integers(5, 40, count)
+                letters = rng.choice(alphabet, int(lengths.sum()))
+                columns[f"text_{idx}"] = np.array(
+                    ["".join(word) for word in np.split(letters, np.cumsum(lengths)[:-1])], dtype=object)
+
+            chunk = pd.DataFrame(columns)
+            for col in list(chunk.columns)[1:]:
+                mask = rng.random(count) < missing_rate
+                chunk[col] = chunk[col].mask(mask)
+            # Whole numbers without missing values are written as integers
+            for col in columns:
+                if col.startswith("num_") and int(col.split("_")[1]) % 2 == 0 and not chunk[col].isna().any():
+                    chunk[col] = chunk[col].astype(np.int64)
+            chunk.to_csv(f, index=False, header=start == 0)
+    return path
+
+
+def _current_rss() -> int:
+    """Resident set size of this process in bytes (Linux), or the peak so far elsewhere."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _PeakRSS:
+    """Sample the RSS on a background thread while the block runs and keep the peak."""
+
+    def __enter__(self) -> "_PeakRSS":
+        self.start = self.peak = _current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def _poll(self) -> None:
+        while not self._stop.wait(RSS_POLL_SECONDS):
+            self.peak = max(self.peak, _current_rss())
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss())
+
+
+class _StubOutput:
+    output = "- Stub recommendation: no LLM was called."
+
+
+class _StubCrew:
+    """Stands in for the recommendation crew so benchmarks run offline and deterministically."""
+
+    def kickoff(self, inputs=None):
+        return _StubOutput()
+
+
+def _measure(fn: Callable[[], Any], file_bytes: Optional[int], rows: Optional[int]) -> Dict[str, Optional[float]]:
+    """Time and memory of one call; throughput only when ``file_bytes`` and ``rows`` are given."""
+    with _PeakRSS() as rss:
+        started = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - started
+    throughput = file_bytes is not None and rows is not None
+    return {
+        "seconds": seconds,
+        "peak_rss_mb": rss.peak / (1024 * 1024),
+        "rss_growth_mb": (rss.peak - rss.start) / (1024 * 1024),
+        "mb_per_s": (file_bytes / (1024 * 1024) / seconds if seconds else float('inf')) if throughput else None,
+        "rows_per_s": (rows / seconds if seconds else float('inf')) if throughput else None,
+    }
+
+
+def benchmark_file(csv_path: str, rows: int, output_dir: str, repeat: int = 1) -> Dict[str, Dict[str, float]]:
+    """
+    Time each stage of the pipeline on one file, starting every run from a cold dataset handle.
+
+    Stages are ``validate`` (``validate_csv_path``), ``analyze`` (``analyze_csv``
+    without the profile cache), ``report`` (``ReportGenerationTool`` from an
+    artifact handle) and ``end_to_end`` (the fast path of ``run_eda_on_file``
+    with a stub crew). With ``repeat`` > 1 the fastest run is kept for time and
+    throughput and the largest for memory.
+
+    ``rss_growth_mb`` is what the stage itself added on top of the RSS it
+    started from; ``peak_rss_mb`` is the whole process and includes whatever
+    earlier stages and scenarios left allocated, so only the growth is
+    comparable between runs. Throughput is only reported for the stages in
+    ``THROUGHPUT_STAGES``.
+    """
+    file_bytes = os.path.getsize(csv_path)
+    profile = analyze_csv(csv_path, use_cache=False)
+    if "error" in profile:
+        raise ValueError(profile["error"])
+    handle = get_artifact_store().put(profile)
+
+    def validate():
+        is_valid, message = validate_csv_path(csv_path)
+        if not is_valid:
+            raise ValueError(message)
+
+    stage_functions = {
+        "validate": validate,
+        "analyze": lambda: analyze_csv(csv_path, use_cache=False),
+        "report": lambda: ReportGenerationTool()._run(analysis_handle=handle, output_dir=output_dir),
+        "end_to_end": lambda: run_eda_on_file(csv_path, profile_options={"use_cache": False}, fast_path=True,
+                                              return_path=True, crew=_StubCrew()),
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for stage, fn in stage_functions.items():
+        runs = []
+        for _ in range(repeat):
+            release_dataset_handle(csv_path)
+            if stage in THROUGHPUT_STAGES:
+                runs.append(_measure(fn, file_bytes, rows))
+            else:
+                runs.append(_measure(fn, None, None))
+        fastest = min(runs, key=lambda run: run["seconds"])
+        results[stage] = {**fastest, "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+                          "rss_growth_mb": max(run["rss_growth_mb"] for run in runs)}
+    release_dataset_handle(csv_path)
+    return results
+
+
+def run_benchmarks(scenarios: Optional[List[str]] = None, scale: float = 1.0, repeat: int = 1,
+                   data_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Generate (or reuse) the synthetic files of ``scenarios`` and benchmark each.
+
+    Args:
+        scenarios (List[str], optional): Names from ``SCENARIOS``; all by default
+        scale (float): Multiplier applied to every scenario's row count
+        repeat (int): Runs per stage; the best is kept
+        data_dir (str, optional): Where generated files are kept between runs;
+            a temporary directory by default
+
+    Returns:
+        Dict[str, Any]: ``environment`` details and per-scenario ``results``.
+    """
+    data_dir = data_dir or tempfile.mkdtemp(prefix="eda-bench-")
+    os.makedirs(data_dir, exist_ok=True)
+    results = {}
+    for name in scenarios or list(SCENARIOS):
+        params = {"missing_rate": 0.05, "cardinality": 20, **SCENARIOS[name]}
+        params["rows"] = max(1, int(params["rows"] * scale))
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:12]
+        csv_path = os.path.join(data_dir, f"{name}-{digest}.csv")
+        if not os.path.exists(csv_path):
+            generate_csv(csv_path, **params)
+        results[name] = {
+            "params": params,
+            "file_mb": os.path.getsize(csv_path) / (1024 * 1024),
+            "stages": benchmark_file(csv_path, params["rows"], os.path.join(data_dir, "reports"), repeat),
+        }
+        print(f"{name}: " + ", ".join(f"{stage} {values['seconds']:.3f}s"
+                                      for stage, values in results[name]["stages"].items()), file=sys.stderr)
+    return {
+        "version": BENCHMARK_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Stages that got slower, or grew the RSS more, than in the baseline by more than ``threshold``.
+
+    Memory is compared by ``rss_growth_mb``, which does not depend on what ran
+    before the stage. Changes smaller than ``MIN_REGRESSION_DELTA`` in
+    absolute terms are ignored.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per regression with ``scenario``, ``stage``,
+        ``metric``, ``baseline``, ``current`` and the relative ``change``.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or base.get("params") != result["params"]:
+            continue
+        for stage, values in result["stages"].items():
+            for metric in MIN_REGRESSION_DELTA:
+                before = base["stages"].get(stage, {}).get(metric)
+                if not before:
+                    continue
+                change = values[metric] / before - 1
+                if change > threshold and values[metric] - before >= MIN_REGRESSION_DELTA[metric]:
+                    regressions.append({"scenario": name, "stage": stage, "metric": metric,
+                                        "baseline": before, "current": values[metric], "change": change})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the EDA pipeline on synthetic CSV files.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every scenario's row count")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage; the best is kept")
+    parser.add_argument("--data-dir", help="Keep generated files here between runs")
+    parser.add_argument("--save", help="Write the results as a JSON baseline")
+    parser.add_argument("--compare", help="Compare against a saved baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="Relative change counted as a regression (default: %(default)s)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scenario, args.scale, args.repeat, args.data_dir)
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.save}")
+
+    for name, result in results["results"].items():
+        for stage, values in result["stages"].items():
+            throughput = (f"{values['mb_per_s']:9.1f} MB/s {values['rows_per_s']:12.0f} rows/s"
+                          if values.get('mb_per_s') is not None else " " * 34)
+            print(f"{name:<12} {stage:<11} {values['seconds']:8.3f}s {throughput} "
+                  f"{values['rss_growth_mb']:8.1f} MB growth {values['peak_rss_mb']:8.1f} MB peak")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        for item in regressions:
+            print(f"REGRESSION {item['scenario']} {item['stage']} {item['metric']}: "
+                  f"{item['baseline']:.3f} -> {item['current']:.3f} ({item['change']:+.0%})")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
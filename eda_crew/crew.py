@@ -1,11 +1,33 @@
 import os
 from crewai import Crew, Agent, Task
-from .tools.csv_tool import csv_analysis_tool
+from .tools.csv_tool import create_csv_analysis_tool
 from .tools.report_tool import ReportGenerationTool
 
-def create_eda_crew(csv_path):
-    # Initialize tools
-    csv_tool = csv_analysis_tool
+def _create_data_consultant(tools, allow_delegation=True):
+    return Agent(
+        role="Data Consultant",
+        goal="Provide strategic recommendations based on data analysis",
+        backstory="""You are a seasoned data consultant who specializes in
+        providing actionable recommendations based on data analysis. You have
+        helped many organizations improve their data quality and extract value
+        from their datasets.""",
+        verbose=True,
+        allow_delegation=allow_delegation,
+        tools=tools
+    )
+
+
+def create_eda_crew(csv_path=None, profile_options=None):
+    """
+    Two-agent crew that profiles a CSV file and writes the report.
+
+    The task text takes the file from the ``csv_path`` kickoff input, so one
+    crew can be kicked off for many files; ``csv_path`` is accepted for
+    compatibility and not used.
+    """
+    # Initialize tools; the full profile stays in the artifact store and only a
+    # handle plus a compact summary enters the conversation
+    csv_tool = create_csv_analysis_tool(**{"artifact_handle": True, **(profile_options or {})})
     report_tool = ReportGenerationTool()
     
     # Create agents
@@ -20,44 +42,38 @@ def create_eda_crew(csv_path):
         tools=[csv_tool]
     )
     
-    data_consultant = Agent(
-        role="Data Consultant",
-        goal="Provide strategic recommendations based on data analysis",
-        backstory="""You are a seasoned data consultant who specializes in
-        providing actionable recommendations based on data analysis. You have
-        helped many organizations improve their data quality and extract value
-        from their datasets.""",
-        verbose=True,
-        allow_delegation=True,
-        tools=[report_tool]
-    )
+    data_consultant = _create_data_consultant(tools=[report_tool])
     
     # Create tasks
     analyze_task = Task(
-        description=f"""
+        description="""
         Analyze the CSV file located at {csv_path}.
         Perform comprehensive exploratory data analysis including:
         1. Basic statistics (mean, median, mode, std, etc.)
         2. Data distribution analysis
-        3. Identify missing values and outliers
+        3. Identify missing values, outliers and duplicate rows (the tool reports
+           IQR, z-score and MAD outlier counts and exact duplicate rows)
         4. Correlation analysis between features
         
-        Return the analysis results as a properly formatted JSON string.
+        The tool stores the full results and returns an artifact handle with a
+        compact summary. Base your findings on the summary and return the artifact
+        handle together with your findings; do not try to reproduce the full results.
         """,
         agent=data_analyst,
-        expected_output="A JSON string containing the complete analysis results"
+        expected_output="The artifact handle (profile-...) followed by the key findings"
     )
     
     recommend_task = Task(
         description="""
-        Based on the analysis results (provided as a JSON string), generate comprehensive recommendations:
+        Based on the analysis summary and artifact handle from the previous task, generate comprehensive recommendations:
         1. Data cleaning steps (handling missing values, outliers, etc.)
         2. Feature engineering suggestions
         3. Potential analysis directions
         4. Data quality improvement recommendations
         
         Use the ReportGenerationTool to create a final markdown report incorporating both the analysis results 
-        and your recommendations. The analysis_results parameter should be the JSON string from the previous task.
+        and your recommendations. Pass the artifact handle from the previous task (it looks like
+        profile-0123456789abcdef) as the analysis_handle parameter; the tool loads the full results itself.
         
         Save this report to a file in the 'reports' directory and return the file path.
         """,
@@ -73,4 +89,39 @@ def create_eda_crew(csv_path):
         verbose=True
     )
     
-    return crew
\ No newline at end of file
+    return crew
+
+
+def create_recommendation_crew():
+    """
+    Single-agent crew that only writes the narrative recommendations.
+
+    Used by the fast path of ``run_eda_on_file``: the statistics are computed and
+    rendered without the LLM, so the consultant gets the compact summary directly
+    (as the ``analysis_summary`` kickoff input) and needs no tools.
+    """
+    data_consultant = _create_data_consultant(tools=[], allow_delegation=False)
+
+    recommend_task = Task(
+        description="""
+        Here is a compact summary of an exploratory analysis of a CSV file:
+
+        {analysis_summary}
+
+        Based on it, write concise recommendations in markdown:
+        1. Data cleaning steps (handling missing values, outliers, duplicates, etc.)
+        2. Feature engineering suggestions
+        3. Potential analysis directions
+        4. Data quality improvement recommendations
+
+        Return only the recommendations text.
+        """,
+        agent=data_consultant,
+        expected_output="Markdown recommendations for the dataset"
+    )
+
+    return Crew(
+        agents=[data_consultant],
+        tasks=[recommend_task],
+        verbose=True
+    )
@@ -0,0 +1,278 @@
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional
+
+from eda_crew.tools.profile_cache import DEFAULT_CACHE_DIR, _json_default, file_fingerprint
+from eda_crew.tools.sources import BUFFER_PREFIX, CsvSource, as_csv_path, is_buffer_path, pin_buffer, unpin_buffer
+
+# Job table and staged inputs live next to the profile cache
+DEFAULT_JOB_DB = os.path.join(DEFAULT_CACHE_DIR, "jobs.sqlite3")
+DEFAULT_JOB_INPUT_DIR = os.path.join(DEFAULT_CACHE_DIR, "jobs", "inputs")
+
+# Analyses running at once; further jobs wait in the queue
+DEFAULT_MAX_WORKERS = int(os.getenv("EDA_JOB_WORKERS", "2"))
+
+# Finished jobs are deleted after this long, together with the staged inputs only they used
+DEFAULT_JOB_RETENTION_SECONDS = int(os.getenv("EDA_JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+# Job states; queued and running jobs count as in flight for deduplication
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+IN_FLIGHT = (QUEUED, RUNNING)
+
+# Share of the progress bar reached when each stage of ``run_eda_on_file`` starts
+STAGE_PROGRESS = {
+    "validate": 0.05,
+    "crew": 0.1,
+    "profile": 0.1,
+    "recommendations": 0.5,
+    "report": 0.9,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    dedup_key TEXT NOT NULL,
+    csv_path TEXT NOT NULL,
+    name TEXT,
+    options TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    progress REAL NOT NULL DEFAULT 0,
+    report_path TEXT,
+    error TEXT,
+    timings TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_dedup ON jobs (dedup_key, status);
+"""
+
+
+def _default_runner(csv_path: str, **kwargs) -> str:
+    from eda_crew.main import run_eda_on_file
+    return run_eda_on_file(csv_path, return_path=True, **kwargs)
+
+
+class JobQueue:
+    """
+    Bounded worker pool for EDA runs, backed by a persistent SQLite job table.
+
+    ``submit`` stages the input under a content-addressed name and returns a job
+    id immediately; callers poll ``get`` for status, progress and the report
+    path. An identical job (same file content and options) that is still queued
+    or running is reused instead of starting a second run. Because the table is
+    on disk, finished jobs survive page reloads and process restarts; jobs that
+    were running when the process stopped are marked failed on the next start,
+    as are queued jobs whose input was an in-memory CSV. Finished jobs older
+    than ``retention_seconds``, and the staged inputs only they used, are
+    pruned on start and after every job.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_JOB_DB, input_dir: str = DEFAULT_JOB_INPUT_DIR,
+                 max_workers: int = DEFAULT_MAX_WORKERS, runner: Optional[Callable[..., str]] = None,
+                 retention_seconds: float = DEFAULT_JOB_RETENTION_SECONDS):
+        self.db_path = os.path.abspath(db_path)
+        self.input_dir = os.path.abspath(input_dir)
+        self.runner = runner or _default_runner
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="eda-job")
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+        self._recover()
+        self.prune()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _update(self, job_id: str, **fields) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def _recover(self) -> None:
+        """Fail jobs interrupted by a restart and re-queue the ones that never started."""
+        with self._connect() as conn:
+            conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                         (FAILED, "Interrupted by a restart", time.time(), RUNNING))
+            # In-memory inputs did not survive the restart
+            conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status = ? AND csv_path LIKE ?",
+                         (FAILED, "In-memory input lost in a restart", time.time(), QUEUED, f"{BUFFER_PREFIX}%"))
+            queued = [row["id"] for row in conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,))]
+        for job_id in queued:
+            self._executor.submit(self._run, job_id)
+
+    def _stage_input(self, csv_path: str, fingerprint: str) -> str:
+        """Give the job its own copy of the input, so the caller may delete theirs."""
+        if is_buffer_path(csv_path):
+            # In-memory CSVs are immutable and pinned while the job needs them (see ``submit``);
+            # copying them would defeat the point
+            return csv_path
+        os.makedirs(self.input_dir, exist_ok=True)
+        staged = os.path.join(self.input_dir, f"{fingerprint}.csv")
+        if not os.path.exists(staged):
+            tmp_path = f"{staged}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                try:
+                    os.link(csv_path, tmp_path)
+                except OSError:
+                    shutil.copyfile(csv_path, tmp_path)
+                os.replace(tmp_path, staged)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        return staged
+
+    def submit(self, csv_path: CsvSource, profile_options: Optional[Dict[str, Any]] = None,
+               fast_path: bool = False, name: Optional[str] = None) -> str:
+        """
+        Queue an analysis of ``csv_path`` and return its job id.
+
+        Args:
+            csv_path (CsvSource): Path to the CSV file, or in-memory CSV data (see ``as_csv_path``)
+            profile_options (dict, optional): Options passed to ``run_eda_on_file``
+            fast_path (bool): Use the fast path of ``run_eda_on_file``
+            name (str, optional): Display name of the input, e.g. the uploaded file name
+
+        Returns:
+            str: The id of the new job, or of an identical job already in flight
+        """
+        csv_path = as_csv_path(csv_path, name)
+        fingerprint = file_fingerprint(csv_path, content_hash=True)
+        options = {"profile_options": profile_options or {}, "fast_path": bool(fast_path)}
+        encoded = json.dumps(options, default=_json_default, sort_keys=True)
+        dedup_key = hashlib.sha256(f"{fingerprint}:{encoded}".encode()).hexdigest()
+        staged = self._stage_input(csv_path, fingerprint)
+        if is_buffer_path(staged):
+            # Keep the buffer registered until the job is done, however many uploads follow
+            pin_buffer(staged)
+
+        with self._connect() as conn:
+            # Check and insert in one write transaction so concurrent submits cannot both miss
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    f"SELECT id FROM jobs WHERE dedup_key = ? AND status IN ({','.join('?' * len(IN_FLIGHT))}) "
+                    "ORDER BY created_at LIMIT 1", (dedup_key, *IN_FLIGHT)).fetchone()
+                if row is not None:
+                    conn.execute("COMMIT")
+                    if is_buffer_path(staged):
+                        unpin_buffer(staged)
+                    return row["id"]
+                job_id = uuid.uuid4().hex[:12]
+                conn.execute(
+                    "INSERT INTO jobs (id, dedup_key, csv_path, name, options, status, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, dedup_key, staged, name or os.path.basename(csv_path), encoded, QUEUED, time.time()))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                if is_buffer_path(staged):
+                    unpin_buffer(staged)
+                raise
+
+        self._executor.submit(self._run, job_id)
+        return job_id
+
+    def _run(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is None or job["status"] != QUEUED:
+            return
+        try:
+            self._execute(job)
+        finally:
+            if is_buffer_path(job["csv_path"]):
+                unpin_buffer(job["csv_path"])
+        self.prune()
+
+    def prune(self) -> None:
+        """
+        Delete finished jobs older than the retention period, and the staged inputs no job refers to.
+
+        Inputs are only deleted once they were staged longer ago than the
+        retention period too (by inode change time: hard-linked copies keep the
+        mtime of the original), so one staged for a job being submitted right
+        now is left alone.
+        """
+        cutoff = time.time() - self.retention_seconds
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM jobs WHERE status NOT IN ({','.join('?' * len(IN_FLIGHT))}) "
+                         "AND finished_at < ?", (*IN_FLIGHT, cutoff))
+            referenced = {row["csv_path"] for row in conn.execute("SELECT DISTINCT csv_path FROM jobs")}
+        try:
+            names = os.listdir(self.input_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.input_dir, name)
+            try:
+                if path not in referenced and os.stat(path).st_ctime < cutoff:
+                    os.unlink(path)
+            except OSError:
+                pass
+
+    def _execute(self, job: Dict[str, Any]) -> None:
+        job_id = job["id"]
+        self._update(job_id, status=RUNNING, started_at=time.time())
+
+        def progress(stage: str) -> None:
+            self._update(job_id, stage=stage, progress=STAGE_PROGRESS.get(stage, 0.0))
+
+        timings: Dict[str, float] = {}
+        try:
+            report_path = self.runner(job["csv_path"], profile_options=job["options"]["profile_options"] or None,
+                                      fast_path=job["options"]["fast_path"], timings=timings, progress=progress)
+            self._update(job_id, status=DONE, progress=1.0, report_path=report_path,
+                         timings=json.dumps(timings), finished_at=time.time())
+        except Exception as e:
+            self._update(job_id, status=FAILED, error=str(e), timings=json.dumps(timings),
+                         finished_at=time.time())
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["options"] = json.loads(job["options"])
+        job["timings"] = json.loads(job["timings"]) if job["timings"] else {}
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Status, stage, progress (0-1), report path or error and timings of one job."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row(row) if row is not None else None
+
+    def list_jobs(self, limit: int = 20, job_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """The most recently submitted jobs, newest first; only those in ``job_ids`` if given."""
+        with self._connect() as conn:
+            if job_ids is None:
+                rows = conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT * FROM jobs WHERE id IN ({','.join('?' * len(job_ids))}) "
+                    "ORDER BY created_at DESC LIMIT ?", (*job_ids, limit)).fetchall()
+        return [self._row(row) for row in rows]
+
+
+_default_queue: Optional[JobQueue] = None
+_default_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, shared by every app session."""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = JobQueue()
+    return _default_queue
@@ -1,36 +1,106 @@
 from crewai import Crew
-from eda_crew.crew import create_eda_crew
+from eda_crew.crew import create_eda_crew, create_recommendation_crew
 import json
+import os
+import time
 
 from eda_crew.test_csv import validate_csv_path
+from eda_crew.tools.artifacts import compact_summary, get_artifact_store
+from eda_crew.tools.csv_tool import analyze_csv
+from eda_crew.tools.report_tool import ReportGenerationTool
+from eda_crew.tools.sources import as_csv_path
 
-def run_eda_on_file(csv_path):
+
+def _crew_output_text(result):
+    return str(result.output if hasattr(result, 'output') else result.raw_output if hasattr(result, 'raw_output') else result).strip()
+
+
+def _run_fast_path(csv_path, profile_options, timings, progress, crew):
+    """Profile and render the statistics without the LLM; the crew only writes recommendations."""
+    progress("profile")
+    started = time.perf_counter()
+    profile = analyze_csv(csv_path, **(profile_options or {}))
+    if "error" in profile:
+        raise ValueError(profile["error"])
+    handle = get_artifact_store().put(profile)
+    timings["profile"] = time.perf_counter() - started
+
+    progress("recommendations")
+    started = time.perf_counter()
+    summary = json.dumps(compact_summary(profile))
+    crew = crew or create_recommendation_crew()
+    recommendations = _crew_output_text(crew.kickoff(inputs={"analysis_summary": summary}))
+    timings["recommendations"] = time.perf_counter() - started
+
+    progress("report")
+    started = time.perf_counter()
+    report_path = ReportGenerationTool()._run(analysis_handle=handle, recommendations=recommendations)
+    timings["report"] = time.perf_counter() - started
+    return report_path
+
+
+def run_eda_on_file(csv_path, profile_options=None, fast_path=False, timings=None,
+                    return_path=False, progress=None, crew=None):
     """
     Run exploratory data analysis on the provided CSV file.
-    
+
     Args:
-        csv_path (str): Path to the CSV file
-        
+        csv_path (str): Path to the CSV file, or the CSV itself as bytes, a memoryview
+            or a binary file object; in-memory data is parsed without a temporary file
+        profile_options (dict, optional): Options for the CSV analysis tool, e.g.
+            ``{"sample_rows": 100000}`` for a fast sampled analysis of a large file
+        fast_path (bool): Run the profiler directly and render the statistical
+            sections without the LLM; only the recommendations come from the crew
+        timings (dict, optional): Filled with the seconds spent in each stage
+            (``validate``, then ``crew`` or ``profile`` / ``recommendations`` /
+            ``report`` on the fast path, and ``total``)
+        return_path (bool): Return the report's file path instead of its content, so
+            callers can load it section by section
+        progress (callable, optional): Called with the name of each stage as it starts
+        crew (Crew, optional): Crew to reuse instead of building one for this call:
+            one from ``create_eda_crew`` (built with the same ``profile_options``),
+            or from ``create_recommendation_crew`` on the fast path
+
     Returns:
-        str: The generated report content as a string
-        
+        str: The generated report content as a string (or its path with ``return_path``)
+
     Raises:
         ValueError: If the CSV file is invalid or not found
     """
+    timings = {} if timings is None else timings
+    progress = progress or (lambda stage: None)
+    run_started = time.perf_counter()
+
     # Validate the CSV file
+    progress("validate")
+    started = time.perf_counter()
+    csv_path = as_csv_path(csv_path)
     is_valid, message = validate_csv_path(csv_path)
+    timings["validate"] = time.perf_counter() - started
     if not is_valid:
         raise ValueError(message)
-        
-    # Create the EDA crew
-    crew = create_eda_crew(csv_path=csv_path)
-    
-    # Run the crew with the CSV path as input
-    result = crew.kickoff(inputs={"csv_path": csv_path})
-    
-    # Extract the report file path from the task output
-    report_path = str(result.output if hasattr(result, 'output') else result.raw_output if hasattr(result, 'raw_output') else result).strip()
-    
+
+    if fast_path:
+        report_path = _run_fast_path(csv_path, profile_options, timings, progress, crew)
+    else:
+        progress("crew")
+        started = time.perf_counter()
+        # Create the EDA crew
+        crew = crew or create_eda_crew(csv_path=csv_path, profile_options=profile_options)
+
+        # Run the crew with the CSV path as input
+        result = crew.kickoff(inputs={"csv_path": csv_path})
+        timings["crew"] = time.perf_counter() - started
+
+        # Extract the report file path from the task output
+        report_path = _crew_output_text(result)
+    timings["total"] = time.perf_counter() - run_started
+
+    if return_path:
+        if not os.path.isfile(report_path):
+            raise ValueError(f"Failed to read report file: {report_path}")
+        return report_path
+
     # Read and return the report content
     try:
         with open(report_path, 'r') as f:
@@ -41,18 +111,21 @@ def run_eda_on_file(csv_path):
 
 def main():
     import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python main.py <path_to_csv>")
+
+    args = [arg for arg in sys.argv[1:] if arg != "--fast"]
+    if len(args) < 1:
+        print("Usage: python main.py [--fast] <path_to_csv>")
         sys.exit(1)
-        
-    csv_path = sys.argv[1]
+
+    csv_path = args[0]
+    timings = {}
     try:
-        report_content = run_eda_on_file(csv_path)
+        report_content = run_eda_on_file(csv_path, fast_path="--fast" in sys.argv, timings=timings)
         print(report_content)
+        print("\n" + ", ".join(f"{stage}: {seconds:.2f}s" for stage, seconds in timings.items()), file=sys.stderr)
     except ValueError as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,24 +1,34 @@
 import os
-import pandas as pd
 
-def validate_csv_path(file_path: str) -> tuple[bool, str]:
+from .tools.dataset import get_dataset_handle
+from .tools.sources import CsvSource, as_csv_path, is_buffer_path, source_exists
+
+def validate_csv_path(file_path: CsvSource, sidecar: bool = False) -> tuple[bool, str]:
     """
     Validates if the given file path exists and is a valid CSV file.
     
     Args:
-        file_path (str): Path to the CSV file to validate
+        file_path (CsvSource): Path to the CSV file to validate, or the CSV itself as
+            bytes, a memoryview or a binary file object (see ``as_csv_path``)
+        sidecar (bool): Also convert a valid file into its columnar sidecar so the
+            following analysis can memory-map it instead of parsing the CSV
         
     Returns:
         tuple[bool, str]: A tuple containing:
             - bool: True if the file exists and is a valid CSV, False otherwise
             - str: Error message if validation fails, empty string if successful
     """
+    try:
+        file_path = as_csv_path(file_path)
+    except TypeError as e:
+        return False, str(e)
+
     # Check if file exists
-    if not os.path.exists(file_path):
+    if not source_exists(file_path):
         return False, f"File not found: {file_path}"
         
     # Check if it's a file (not a directory)
-    if not os.path.isfile(file_path):
+    if not is_buffer_path(file_path) and not os.path.isfile(file_path):
         return False, f"Path is not a file: {file_path}"
         
     # Check if file has .csv extension
@@ -26,8 +36,14 @@ def validate_csv_path(file_path: str) -> tuple[bool, str]:
         return False, f"File is not a CSV file: {file_path}"
         
     try:
-        # Try to read the CSV file
-        pd.read_csv(file_path)
+        # Sniff the header and parse a bounded sample instead of the whole file;
+        # the full parse is left to the shared dataset handle used by the analysis
+        handle = get_dataset_handle(file_path)
+        if not handle.sniff()["columns"]:
+            return False, f"Error reading CSV file: no header found in {file_path}"
+        handle.sample()
+        if sidecar:
+            handle.ensure_sidecar()
         return True, ""
     except Exception as e:
         # If there's any error reading the CSV file
@@ -0,0 +1,5 @@
+# The EDA crew is imported as a package (``eda_crew.tools...``) from the repository root
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -0,0 +1,47 @@
+from eda_crew.tools.incremental import profile_incremental
+from eda_crew.tools.profiler import profile_csv
+
+
+def write_rows(path, start, stop, mode='a', terminated=True):
+    lines = [f"{index};{index * 1.5};label {index % 3}" for index in range(start, stop)]
+    with open(path, mode) as f:
+        f.write("\n".join(lines) + ("\n" if terminated else ""))
+
+
+def test_semicolon_log_is_resumed_with_its_delimiter(tmp_path):
+    path = str(tmp_path / "log.csv")
+    with open(path, 'w') as f:
+        f.write("id;value;label\n")
+    write_rows(path, 0, 100)
+
+    first = profile_incremental(path, chunksize=30, state_dir=str(tmp_path / "state"))
+    assert first["basic_info"]["column_names"] == ["id", "value", "label"]
+    assert first["incremental"]["resumed"] is False
+
+    write_rows(path, 100, 150)
+    # An unterminated last line is profiled through the tail parse
+    write_rows(path, 150, 151, terminated=False)
+    second = profile_incremental(path, chunksize=30, state_dir=str(tmp_path / "state"))
+
+    assert second["incremental"]["resumed"] is True
+    assert second["incremental"]["new_rows"] == 51
+    assert second["basic_info"]["num_rows"] == 151
+    assert second["basic_info"]["column_names"] == ["id", "value", "label"]
+
+    streaming = profile_csv(path, streaming=True, chunksize=30)
+    assert second["basic_info"]["column_dtypes"] == streaming["basic_info"]["column_dtypes"]
+    for column in ("id", "value"):
+        for statistic in ("mean", "min", "max"):
+            assert second["numeric_stats"]["statistics"][column][statistic] == \
+                streaming["numeric_stats"]["statistics"][column][statistic]
+
+
+def test_header_only_file_uses_its_delimiter(tmp_path):
+    path = str(tmp_path / "empty.csv")
+    with open(path, 'w') as f:
+        f.write("id;value;label\n")
+
+    profile = profile_incremental(path, state_dir=str(tmp_path / "state"))
+
+    assert profile["basic_info"]["num_rows"] == 0
+    assert profile["basic_info"]["column_names"] == ["id", "value", "label"]
@@ -0,0 +1,26 @@
+import os
+
+from eda_crew.tools.profile_cache import ProfileCache
+
+
+def test_profile_with_an_evicted_matrix_is_a_miss(tmp_path):
+    cache = ProfileCache(str(tmp_path / "profiles"))
+    matrix_path = str(tmp_path / "matrix.npy")
+    with open(matrix_path, 'wb') as f:
+        f.write(b"matrix")
+    profile = {"basic_info": {"num_rows": 3}, "correlation": {"pairs": [], "matrix_path": matrix_path}}
+    cache.put("key", profile)
+
+    assert cache.get("key") == profile
+
+    os.unlink(matrix_path)
+    assert cache.get("key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_profile_without_a_matrix_is_served(tmp_path):
+    cache = ProfileCache(str(tmp_path / "profiles"))
+    profile = {"basic_info": {"num_rows": 3}, "correlation": {"pairs": [], "matrix_path": None}}
+    cache.put("key", profile)
+
+    assert cache.get("key") == profile
@@ -0,0 +1,15 @@
+from eda_crew.tools.profiler import profile_csv
+
+
+def test_streaming_reports_the_dtypes_of_a_full_parse(tmp_path):
+    path = str(tmp_path / "mixed.csv")
+    with open(path, 'w') as f:
+        f.write("id,code,flag\n")
+        # ``code`` is numeric in the first chunks and text later; ``flag`` misses values in one chunk
+        f.writelines(f"{index},{index},{'true' if index % 2 else 'false'}\n" for index in range(100))
+        f.writelines(f"{index},x{index},\n" for index in range(100, 150))
+
+    streaming = profile_csv(path, streaming=True, chunksize=50)
+    full = profile_csv(path)
+
+    assert streaming["basic_info"]["column_dtypes"] == full["basic_info"]["column_dtypes"]
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from typing import Dict, Any, Optional
+
+from .profile_cache import DEFAULT_CACHE_DIR, _json_default
+
+# Where full profiles are stored for lookup by handle
+DEFAULT_ARTIFACT_DIR = os.path.join(DEFAULT_CACHE_DIR, "artifacts")
+
+# Newest artifacts kept on disk; older ones are pruned on write
+MAX_ARTIFACTS = 100
+
+# Token budget of the compact summary handed to the LLM, and the rough
+# characters-per-token ratio of JSON used to enforce it
+DEFAULT_SUMMARY_TOKENS = 1_500
+CHARS_PER_TOKEN = 4
+
+# Caps on the list-like parts of the compact summary
+SUMMARY_TOP_CORRELATIONS = 10
+SUMMARY_TOP_MISSING = 10
+
+HANDLE_PREFIX = "profile-"
+_HANDLE_PATTERN = re.compile(r"profile-[0-9a-f]{16}")
+
+
+class ArtifactStore:
+    """
+    Content-addressed store of full profiles, referenced by short handles.
+
+    Agents pass the handle (``profile-<16 hex digits>``) instead of the profile
+    itself, and tools that need the full data load it from here.
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARTIFACT_DIR, max_artifacts: int = MAX_ARTIFACTS):
+        self.directory = os.path.abspath(directory)
+        self.max_artifacts = max_artifacts
+        self._lock = threading.Lock()
+
+    def _path(self, handle: str) -> str:
+        return os.path.join(self.directory, f"{handle}.json")
+
+    def put(self, profile: Dict[str, Any]) -> str:
+        """Store a profile and return its handle; identical profiles share one handle."""
+        # Hash a key-sorted dump, but store the profile in its own (column) order
+        canonical = json.dumps(profile, default=_json_default, sort_keys=True)
+        handle = HANDLE_PREFIX + hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        path = self._path(handle)
+        os.makedirs(self.directory, exist_ok=True)
+        if os.path.exists(path):
+            os.utime(path)
+            return handle
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(profile, f, default=_json_default)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        self._prune()
+        return handle
+
+    def get(self, handle: str) -> Optional[Dict[str, Any]]:
+        """Load the profile stored under ``handle``, or None if it is unknown."""
+        if not _HANDLE_PATTERN.fullmatch(handle or ""):
+            return None
+        try:
+            with open(self._path(handle), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _prune(self) -> None:
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.directory):
+                if name.startswith(HANDLE_PREFIX) and name.endswith('.json'):
+                    try:
+                        entries.append((os.stat(os.path.join(self.directory, name)).st_mtime, name))
+                    except OSError:
+                        continue
+            for _, name in sorted(entries)[:max(0, len(entries) - self.max_artifacts)]:
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+
+
+_default_store: Optional[ArtifactStore] = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the process-wide artifact store."""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArtifactStore()
+    return _default_store
+
+
+def find_handle(text: Optional[str]) -> Optional[str]:
+    """Pull an artifact handle out of free text or a JSON string written by an agent."""
+    match = _HANDLE_PATTERN.search(text or "")
+    return match.group(0) if match else None
+
+
+def _round(value: Any, digits: int = 4) -> Any:
+    """Round floats to a few significant digits to save tokens."""
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value) or value == 0:
+            return value
+        return round(value, max(0, digits - 1 - int(math.floor(math.log10(abs(value))))))
+    return value
+
+
+def _size(summary: Dict[str, Any]) -> int:
+    return len(json.dumps(summary, default=_json_default))
+
+
+def compact_summary(profile: Dict[str, Any], max_tokens: int = DEFAULT_SUMMARY_TOKENS) -> Dict[str, Any]:
+    """
+    Shrink a profile into a summary that fits a token budget.
+
+    Dataset-level facts come first, then the strongest correlations and the
+    columns with the most missing values, then one short entry per column in
+    file order until the budget runs out. Columns that did not fit are counted
+    in ``omitted_columns``; the full profile stays available through the handle.
+    """
+    budget = max_tokens * CHARS_PER_TOKEN
+    basic_info = profile.get("basic_info", {})
+    missing = profile.get("missing_values", {})
+    statistics = profile.get("numeric_stats", {}).get("statistics", {})
+    categorical = profile.get("categorical_stats", {})
+    outliers = profile.get("outliers", {})
+
+    missing_pct = missing.get("missing_percentage", {})
+    most_missing = sorted(((pct, col) for col, pct in missing_pct.items() if pct), reverse=True)
+    summary: Dict[str, Any] = {
+        "rows": basic_info.get("num_rows"),
+        "columns": basic_info.get("num_columns"),
+        "memory_mb": basic_info.get("memory_usage"),
+        "total_missing": missing.get("total_missing"),
+        "duplicate_rows": profile.get("duplicates", {}).get("duplicate_rows"),
+        "most_missing_pct": {col: pct for pct, col in most_missing[:SUMMARY_TOP_MISSING]},
+        "top_correlations": [
+            [pair["var1"], pair["var2"], _round(pair["correlation"], 3)]
+            for pair in profile.get("correlation", {}).get("pairs", [])[:SUMMARY_TOP_CORRELATIONS]
+        ],
+        "numeric": {},
+        "categorical": {},
+    }
+    if "sampling" in profile:
+        summary["sampled_rows"] = profile["sampling"].get("sample_rows")
+
+    column_names = basic_info.get("column_names") or list(statistics) + list(categorical)
+    # Track the size incrementally so wide profiles do not re-serialize per column
+    used = _size(summary) + len('"omitted_columns": 0, ')
+    omitted = 0
+    for col in column_names:
+        if col in statistics:
+            stats = statistics[col]
+            entry = {key: _round(stats.get(key)) for key in ("mean", "std", "min", "median", "max")}
+            if col in outliers:
+                entry["outliers_iqr"] = outliers[col].get("iqr", {}).get("count")
+            section = "numeric"
+        elif col in categorical:
+            stats = categorical[col]
+            top = stats.get("top_values", [])
+            entry = {"distinct": stats.get("distinct"), "top": top[0]["value"] if top else None}
+            section = "categorical"
+        else:
+            continue
+        cost = len(json.dumps({col: entry}, default=_json_default))
+        if used + cost > budget:
+            omitted += 1
+            continue
+        summary[section][col] = entry
+        used += cost
+    summary["omitted_columns"] = omitted
+    return summary
@@ -0,0 +1,211 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+from .stats import is_numeric_like
+
+# HyperLogLog registers are 2**precision bytes per column (~0.8% error at 14)
+DEFAULT_HLL_PRECISION = 14
+
+# Counters kept per column by the Misra-Gries heavy-hitter summary
+DEFAULT_HEAVY_HITTER_CAPACITY = 100
+
+# Most frequent values reported per column
+DEFAULT_TOP_VALUES = 10
+
+# Rows fed into the sketches per update when profiling an in-memory frame
+CATEGORICAL_SLICE_ROWS = 100_000
+
+
+def categorical_columns(df: pd.DataFrame) -> List[str]:
+    """Names of the columns of ``df`` that are not profiled as numeric, in column order."""
+    return [col for col, dtype in df.dtypes.items() if not is_numeric_like(dtype)]
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact bit length of every element of a uint64 array."""
+    values = values.copy()
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >= np.uint64(1 << shift)
+        values[high] >>= np.uint64(shift)
+        length += high * shift
+    return length + (values > 0)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count estimator over 64-bit hashes.
+
+    The top ``precision`` bits of a hash select a register, which keeps the
+    longest run of leading zeros seen in the remaining bits. Memory is fixed at
+    ``2**precision`` bytes however many values are added.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add a 1-D array of uint64 hashes."""
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.int64)
+        rest = hashes & np.uint64((1 << width) - 1)
+        rank = (width - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Fold in a sketch of the same precision built on other values."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        """Estimated number of distinct hashes added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty
+            return m * math.log(m / zeros)
+        return float(raw)
+
+
+class MisraGries:
+    """
+    Misra-Gries heavy-hitter summary with at most ``capacity`` counters.
+
+    Each chunk's value counts are added to the counters; when more than
+    ``capacity`` values are tracked, the (capacity + 1)-th largest count is
+    subtracted from every counter and the non-positive ones are dropped. Every
+    kept count underestimates the true one by at most ``error``, which never
+    exceeds ``n / (capacity + 1)``.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HEAVY_HITTER_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.error = 0
+
+    def update(self, counts: pd.Series) -> None:
+        """Add the value counts of one chunk."""
+        merged = self.counts.add(counts, fill_value=0) if len(self.counts) else counts
+        if len(merged) > self.capacity:
+            cut = int(merged.nlargest(self.capacity + 1).iloc[-1])
+            merged = merged - cut
+            merged = merged[merged > 0]
+            self.error += cut
+        self.counts = merged.astype(np.int64)
+
+    def top(self, n: int) -> pd.Series:
+        """The ``n`` largest counters, ties broken by first appearance."""
+        return self.counts.sort_values(ascending=False, kind='stable').head(n)
+
+
+def _json_value(value: Any) -> Any:
+    """Turn a column value into something JSON can hold."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _string_lengths(values: pd.Series) -> Optional[np.ndarray]:
+    """Character length of every (non-null) value of a text column, None for other dtypes."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Measure each category once and look lengths up by code
+        category_lengths = values.cat.categories.astype(str).str.len().to_numpy()
+        return category_lengths[values.cat.codes.to_numpy()]
+    if is_object_dtype(values.dtype):
+        return values.astype(str).str.len().to_numpy(dtype=np.int64)
+    if is_string_dtype(values.dtype):
+        return values.str.len().to_numpy(dtype=np.int64)
+    return None
+
+
+class CategoricalSketch:
+    """
+    Bounded-memory profile of one non-numeric column, folded in chunk by chunk.
+
+    Tracks the non-null count, a HyperLogLog distinct-count estimate, Misra-Gries
+    heavy hitters and, for text columns, the min / max / mean string length.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION,
+                 capacity: int = DEFAULT_HEAVY_HITTER_CAPACITY):
+        self.count = 0
+        self.distinct = HyperLogLog(precision)
+        self.heavy_hitters = MisraGries(capacity)
+        self.length_count = 0
+        self.length_sum = 0
+        self.length_min: Optional[int] = None
+        self.length_max: Optional[int] = None
+
+    def update(self, series: pd.Series) -> None:
+        """Add one chunk of a column."""
+        values = series.dropna()
+        if values.empty:
+            return
+        self.count += len(values)
+
+        counts = values.value_counts(sort=False)
+        counts = counts[counts > 0]
+        counts.index = pd.Index(counts.index.to_numpy(dtype=object), dtype=object)
+        self.heavy_hitters.update(counts)
+        # Hash each distinct value of the chunk once rather than every row
+        self.distinct.update(pd.util.hash_pandas_object(counts.index).to_numpy())
+
+        lengths = _string_lengths(values)
+        if lengths is not None:
+            self.length_count += len(lengths)
+            self.length_sum += int(lengths.sum())
+            low, high = int(lengths.min()), int(lengths.max())
+            self.length_min = low if self.length_min is None else min(self.length_min, low)
+            self.length_max = high if self.length_max is None else max(self.length_max, high)
+
+    def result(self, top_n: int = DEFAULT_TOP_VALUES) -> Dict[str, Any]:
+        """Summary of the column as stored in the profile."""
+        exact = self.heavy_hitters.error == 0
+        # With no counter ever dropped, the summary holds every distinct value
+        distinct = len(self.heavy_hitters.counts) if exact else int(round(min(self.distinct.estimate(), self.count)))
+        summary = {
+            "count": self.count,
+            "distinct": distinct,
+            "distinct_exact": exact,
+            "top_values": [
+                {"value": _json_value(value), "count": int(count)}
+                for value, count in self.heavy_hitters.top(top_n).items()
+            ],
+            "top_count_error": int(self.heavy_hitters.error),
+        }
+        if self.length_count:
+            summary["length"] = {
+                "min": self.length_min,
+                "max": self.length_max,
+                "mean": round(self.length_sum / self.length_count, 2),
+            }
+        return summary
+
+
+def categorical_statistics(df: pd.DataFrame, columns: List[str],
+                           top_n: int = DEFAULT_TOP_VALUES) -> Dict[str, Dict[str, Any]]:
+    """
+    Distinct counts, top values and string lengths for ``columns`` of an in-memory frame.
+
+    Rows are fed to the sketches ``CATEGORICAL_SLICE_ROWS`` at a time, so even a
+    unique ID column never materializes more than one slice of value counts.
+    """
+    statistics = {}
+    for col in columns:
+        sketch = CategoricalSketch()
+        for start in range(0, len(df), CATEGORICAL_SLICE_ROWS):
+            sketch.update(df[col].iloc[start:start + CATEGORICAL_SLICE_ROWS])
+        statistics[col] = sketch.result(top_n)
+    return statistics
@@ -0,0 +1,188 @@
+import os
+import threading
+import warnings
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Strongest pairs kept in the profile when no explicit limit is given
+DEFAULT_TOP_K = 50
+
+# Columns per block; a block pair needs a few (rows x block) temporaries
+DEFAULT_BLOCK_COLUMNS = 256
+
+
+class _TopPairs:
+    """Running selection of the strongest pairs by absolute correlation."""
+
+    def __init__(self, top_k: Optional[int], threshold: Optional[float]):
+        self.top_k = top_k
+        self.threshold = threshold
+        self.rows = np.empty(0, dtype=np.int64)
+        self.cols = np.empty(0, dtype=np.int64)
+        self.values = np.empty(0)
+
+    def add(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray) -> None:
+        keep = ~np.isnan(values)
+        if self.threshold is not None:
+            keep &= np.abs(values) >= self.threshold
+        self.rows = np.concatenate([self.rows, rows[keep]])
+        self.cols = np.concatenate([self.cols, cols[keep]])
+        self.values = np.concatenate([self.values, values[keep]])
+        if self.top_k is not None and len(self.values) > self.top_k:
+            best = np.argpartition(-np.abs(self.values), self.top_k - 1)[:self.top_k]
+            self.rows, self.cols, self.values = self.rows[best], self.cols[best], self.values[best]
+
+    def pairs(self, columns: List[str]) -> List[Dict[str, Any]]:
+        order = np.lexsort((self.cols, self.rows, -np.abs(self.values)))
+        return [
+            {"var1": columns[self.rows[i]], "var2": columns[self.cols[i]],
+             "correlation": round(float(self.values[i]), 6)}
+            for i in order
+        ]
+
+
+def _block_correlation(a: np.ndarray, mask_a: np.ndarray,
+                       b: np.ndarray, mask_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise-complete Pearson correlation between two column blocks.
+
+    ``a`` and ``b`` are centered with NaNs replaced by zero; the masks mark the
+    observed values. Blocks without missing values take a single-matmul path.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if mask_a.all() and mask_b.all():
+            cov = a.T @ b
+            var_a = (a * a).sum(axis=0)
+            var_b = (b * b).sum(axis=0)
+            denom = np.sqrt(np.outer(var_a, var_b))
+        else:
+            ma = mask_a.astype(a.dtype)
+            mb = mask_b.astype(b.dtype)
+            count = ma.T @ mb
+            sum_a = a.T @ mb
+            sum_b = ma.T @ b
+            cov = a.T @ b - sum_a * sum_b / count
+            var_a = (a * a).T @ mb - sum_a ** 2 / count
+            var_b = ma.T @ (b * b) - sum_b ** 2 / count
+            denom = np.sqrt(var_a * var_b)
+        corr = np.where(denom > 0, cov / denom, np.nan)
+    return np.clip(corr.astype(np.float64), -1.0, 1.0)
+
+
+def _pairs_in_block(corr: np.ndarray, row_start: int, col_start: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Upper-triangle (i < j) entries of a block as global row/column indices and values."""
+    rows, cols = np.indices(corr.shape).reshape(2, -1)
+    rows = rows + row_start
+    cols = cols + col_start
+    upper = rows < cols
+    return rows[upper], cols[upper], corr.ravel()[upper]
+
+
+def _temporary_matrix_path(matrix_path: str) -> str:
+    # Concurrent runs on the same file each write their own copy, then swap it in
+    return f"{matrix_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _open_matrix_file(matrix_path: str, size: int, dtype) -> np.ndarray:
+    os.makedirs(os.path.dirname(os.path.abspath(matrix_path)), exist_ok=True)
+    return np.lib.format.open_memmap(_temporary_matrix_path(matrix_path), mode='w+', dtype=dtype,
+                                     shape=(size, size))
+
+
+def _publish_matrix_file(matrix: np.ndarray, matrix_path: str) -> None:
+    """Flush a matrix opened with ``_open_matrix_file`` and atomically move it into place."""
+    matrix.flush()
+    del matrix
+    os.replace(_temporary_matrix_path(matrix_path), matrix_path)
+
+
+def correlation_summary(df: pd.DataFrame, columns: List[str],
+                        top_k: Optional[int] = DEFAULT_TOP_K,
+                        threshold: Optional[float] = None,
+                        use_float32: bool = False,
+                        block_columns: int = DEFAULT_BLOCK_COLUMNS,
+                        matrix_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compute Pearson correlations block by block and keep only the strongest pairs.
+
+    The numeric columns are centered once, then correlated ``block_columns`` at a
+    time so every matmul works on cache-sized tiles and this function never
+    holds the dense p x p matrix in memory; with ``matrix_path`` it is written
+    to a memory-mapped file block by block.
+
+    Args:
+        df (pd.DataFrame): Data to correlate.
+        columns (List[str]): Numeric columns to include.
+        top_k (Optional[int]): Number of strongest pairs (by absolute value) to keep;
+            None keeps every pair that passes ``threshold``.
+        threshold (Optional[float]): Minimum absolute correlation for a pair to be kept.
+        use_float32 (bool): Run the matmuls in float32 (half the memory, ~1e-6 precision).
+        block_columns (int): Columns per block.
+        matrix_path (Optional[str]): Also write the full matrix as a ``.npy`` file here.
+
+    Returns:
+        Dict[str, Any]: ``method``, ``columns``, ``pairs`` (``var1``/``var2``/``correlation``
+        sorted by strength), ``top_k``, ``threshold`` and ``matrix_path``.
+    """
+    dtype = np.float32 if use_float32 else np.float64
+    values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = ~np.isnan(values)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        centered = np.nan_to_num(values - np.nanmean(values, axis=0)).astype(dtype, copy=False)
+    del values
+
+    selection = _TopPairs(top_k, threshold)
+    matrix = _open_matrix_file(matrix_path, len(columns), dtype) if matrix_path else None
+    starts = range(0, len(columns), block_columns)
+    for row_start in starts:
+        rows = slice(row_start, row_start + block_columns)
+        for col_start in starts:
+            if col_start < row_start and matrix is None:
+                continue
+            cols = slice(col_start, col_start + block_columns)
+            corr = _block_correlation(centered[:, rows], mask[:, rows], centered[:, cols], mask[:, cols])
+            if matrix is not None:
+                matrix[rows, cols] = corr
+            if col_start >= row_start:
+                selection.add(*_pairs_in_block(corr, row_start, col_start))
+    if matrix is not None:
+        _publish_matrix_file(matrix, matrix_path)
+
+    return {
+        "method": "pearson",
+        "columns": list(columns),
+        "pairs": selection.pairs(columns),
+        "top_k": top_k,
+        "threshold": threshold,
+        "matrix_path": os.path.abspath(matrix_path) if matrix_path else None,
+    }
+
+
+def summarize_correlation_matrix(corr: np.ndarray, columns: List[str],
+                                 top_k: Optional[int] = DEFAULT_TOP_K,
+                                 threshold: Optional[float] = None,
+                                 use_float32: bool = False,
+                                 matrix_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Same output as ``correlation_summary`` for an already computed dense matrix.
+
+    Used by the streaming path, whose merged co-moments are p x p arrays
+    anyway (see ``CoMomentAccumulator``).
+    """
+    selection = _TopPairs(top_k, threshold)
+    selection.add(*_pairs_in_block(corr, 0, 0))
+    if matrix_path:
+        matrix = _open_matrix_file(matrix_path, len(columns), np.float32 if use_float32 else np.float64)
+        matrix[:] = corr
+        _publish_matrix_file(matrix, matrix_path)
+    return {
+        "method": "pearson",
+        "columns": list(columns),
+        "pairs": selection.pairs(columns),
+        "top_k": top_k,
+        "threshold": threshold,
+        "matrix_path": os.path.abspath(matrix_path) if matrix_path else None,
+    }
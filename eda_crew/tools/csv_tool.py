@@ -1,75 +1,172 @@
 import pandas as pd
-import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from crewai.tools import tool
 
-@tool
-def csv_analysis_tool(csv_path: str) -> Dict[str, Any]:
+from .profiler import profile_csv, DEFAULT_CHUNKSIZE, PROFILER_VERSION
+from .correlation import DEFAULT_TOP_K
+from .profile_cache import get_profile_cache, file_fingerprint
+from .artifacts import DEFAULT_SUMMARY_TOKENS, compact_summary, get_artifact_store
+from .sources import CsvSource, as_csv_path, source_exists
+
+def _handle_result(profile: Dict[str, Any], summary_tokens: int) -> Dict[str, Any]:
+    """Store a full profile and return its handle with a token-budgeted summary."""
+    return {
+        "artifact_handle": get_artifact_store().put(profile),
+        "summary": compact_summary(profile, summary_tokens),
+    }
+
+
+def analyze_csv(csv_path: CsvSource, use_cache: bool = True, artifact_handle: bool = False,
+                summary_tokens: int = DEFAULT_SUMMARY_TOKENS, **options) -> Dict[str, Any]:
     """
-    Reads and analyzes a CSV file, performing basic Exploratory Data Analysis (EDA).
-    
+    Profile a CSV file through the profile cache, turning failures into error dicts.
+
     Args:
-        csv_path (str): Path to the CSV file.
+        csv_path (CsvSource): Path to the CSV file, or the CSV itself as bytes, a
+            memoryview or a binary file object (see ``as_csv_path``).
+        use_cache (bool): Serve and store the profile in the on-disk profile cache.
+        artifact_handle (bool): Store the full profile in the artifact store and
+            return ``{"artifact_handle", "summary"}`` with a compact summary instead.
+        summary_tokens (int): Approximate token budget of that summary.
+        **options: Keyword arguments of ``profile_csv``.
 
     Returns:
-        Dict[str, Any]: A dictionary containing CSV insights, or an error message.
+        Dict[str, Any]: The profile (or handle and summary), or ``{"error": ...}``.
     """
-    
     try:
+        csv_path = as_csv_path(csv_path)
+
         # Check if file exists
-        if not os.path.exists(csv_path):
+        if not source_exists(csv_path):
             return {"error": "File not found."}
 
-        # Load CSV into DataFrame without any row limitations
-        df = pd.read_csv(csv_path, low_memory=False)
-
-        # Basic info
-        basic_info = {
-            "num_rows": int(df.shape[0]),
-            "num_columns": int(df.shape[1]),
-            "column_names": df.columns.tolist(),
-            "column_dtypes": {col: str(df[col].dtype) for col in df.columns},
-            "memory_usage": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-        }
-
-        # Numeric statistics
-        numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-        numeric_stats = {
-            "statistics": {
-                col: {
-                    "mean": float(df[col].mean()),
-                    "median": float(df[col].median()),
-                    "std": float(df[col].std()),
-                    "min": float(df[col].min()),
-                    "max": float(df[col].max()),
-                    "q1": float(df[col].quantile(0.25)),
-                    "q3": float(df[col].quantile(0.75))
-                } for col in numeric_cols
-            }
-        }
-
-        # Correlation matrix for numeric columns
-        correlation = {
-            "matrix": df[numeric_cols].corr().to_dict()
-        }
-
-        # Missing values
-        missing_values = {
-            "total_missing": int(df.isnull().sum().sum()),
-            "missing_by_column": df.isnull().sum().to_dict(),
-            "missing_percentage": (df.isnull().sum() / len(df) * 100).round(2).to_dict()
-        }
-
-        return {
-            "basic_info": basic_info,
-            "numeric_stats": numeric_stats,
-            "correlation": correlation,
-            "missing_values": missing_values
-        }
+        # Serve repeat analyses of the same file from the profile cache
+        cache = get_profile_cache() if use_cache else None
+        if cache is not None:
+            cache_key = cache.make_key(file_fingerprint(csv_path), PROFILER_VERSION, options)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return _handle_result(cached, summary_tokens) if artifact_handle else cached
+
+        result = profile_csv(csv_path, **options)
+
+        if cache is not None:
+            try:
+                cache.put(cache_key, result)
+            except OSError:
+                # A read-only or full cache directory must not fail the analysis
+                pass
+
+        if artifact_handle:
+            return _handle_result(result, summary_tokens)
+        return result
 
     except pd.errors.EmptyDataError:
         return {"error": "The file is empty."}
     except pd.errors.ParserError:
         return {"error": "Error parsing the CSV file. Check the format."}
     except Exception as e:
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
+
+
+@tool
+def csv_analysis_tool(csv_path: str, streaming: bool = False,
+                      chunksize: int = DEFAULT_CHUNKSIZE,
+                      quantile_sketch: bool = False,
+                      use_cache: bool = True,
+                      sidecar: bool = False,
+                      workers: int = 1,
+                      correlation_top_k: Optional[int] = DEFAULT_TOP_K,
+                      correlation_threshold: Optional[float] = None,
+                      correlation_matrix: bool = False,
+                      optimize_dtypes: bool = False,
+                      usecols: Optional[List[str]] = None,
+                      sample_rows: Optional[int] = None,
+                      sample_method: str = "block",
+                      incremental: bool = False,
+                      artifact_handle: bool = False) -> Dict[str, Any]:
+    """
+    Reads and analyzes a CSV file, performing basic Exploratory Data Analysis (EDA).
+    
+    Args:
+        csv_path (str): Path to the CSV file, or the ``buffer://`` path of an
+            in-memory CSV registered by the application.
+        streaming (bool): Profile the file chunk by chunk in a single pass, keeping
+            memory bounded by the chunk size. Use this for very large files.
+        chunksize (int): Number of rows per chunk when streaming.
+        quantile_sketch (bool): Estimate median and quartiles with compact mergeable
+            sketches (about 1% rank error) instead of sorting each column.
+        use_cache (bool): Return a previously computed profile of the same file
+            content and options from the on-disk profile cache.
+        sidecar (bool): Convert the CSV into a columnar Arrow file on first use so
+            later analyses memory-map it instead of re-parsing the text.
+        workers (int): Number of processes profiling column shards in parallel.
+            Worth raising for very wide files (thousands of columns).
+        correlation_top_k (Optional[int]): Number of strongest correlation pairs to return.
+        correlation_threshold (Optional[float]): Only return pairs whose absolute
+            correlation is at least this value.
+        correlation_matrix (bool): Also save the full correlation matrix to disk and
+            return its path instead of embedding it in the result.
+        optimize_dtypes (bool): Load with narrow numeric dtypes and categoricals for
+            low-cardinality text, and report raw vs optimized memory usage.
+        usecols (Optional[List[str]]): Only load and analyze these columns.
+        sample_rows (Optional[int]): Analyze a random sample of about this many rows
+            and report 95% confidence intervals, the sample size and the estimated
+            total row count. Answers in seconds on very large files.
+        sample_method (str): ``block`` (random byte offsets, no full scan) or
+            ``reservoir`` (one uniform pass, exact row count).
+        incremental (bool): For append-only files such as logs: remember where the
+            last analysis stopped and only parse rows appended since then.
+        artifact_handle (bool): Keep the full result out of the conversation: store it
+            locally and return a short ``artifact_handle`` plus a compact ``summary``.
+            Pass the handle to the Report Generation Tool as ``analysis_handle``.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing CSV insights, or an error message.
+    """
+    return analyze_csv(
+        csv_path,
+        use_cache=use_cache,
+        artifact_handle=artifact_handle,
+        streaming=streaming,
+        chunksize=chunksize,
+        quantile_sketch=quantile_sketch,
+        sidecar=sidecar,
+        workers=workers,
+        correlation_top_k=correlation_top_k,
+        correlation_threshold=correlation_threshold,
+        correlation_matrix=correlation_matrix,
+        optimize_dtypes=optimize_dtypes,
+        usecols=usecols,
+        sample_rows=sample_rows,
+        sample_method=sample_method,
+        incremental=incremental
+    )
+
+
+def create_csv_analysis_tool(**options):
+    """
+    Build a ``csv_analysis_tool`` with fixed profiling options.
+
+    The agent only supplies the path; options such as ``sample_rows`` are chosen
+    by the caller (the CLI or the Streamlit UI) rather than left to the LLM.
+
+    Args:
+        **options: ``use_cache``, ``artifact_handle``, ``summary_tokens`` and keyword
+            arguments of ``profile_csv``.
+    """
+    @tool("csv_analysis_tool")
+    def configured_csv_analysis_tool(csv_path: str) -> Dict[str, Any]:
+        """
+        Reads and analyzes a CSV file, performing basic Exploratory Data Analysis (EDA).
+
+        Args:
+            csv_path (str): Path to the CSV file.
+
+        Returns:
+            Dict[str, Any]: A dictionary containing CSV insights (or, in artifact mode,
+            an ``artifact_handle`` and a compact ``summary``), or an error message.
+        """
+        return analyze_csv(csv_path, **options)
+
+    return configured_csv_analysis_tool
@@ -0,0 +1,255 @@
+import csv
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import pandas as pd
+
+from .sources import csv_input, get_buffer, is_buffer_path, open_binary
+from .loading import load_csv_optimized, downcast_frame, plan_categoricals
+from .sidecar import (SIDECAR_BATCH_ROWS, sidecar_available, sidecar_path, write_sidecar,
+                      write_sidecar_chunks, read_sidecar, iter_sidecar_chunks, touch_sidecar)
+
+# Bytes read when sniffing the header and dialect
+SNIFF_BYTES = 64 * 1024
+
+# Rows parsed when validating or previewing without a full parse
+DEFAULT_SAMPLE_ROWS = 1_000
+
+# Number of parsed datasets kept alive in the process-wide registry
+MAX_OPEN_HANDLES = 4
+
+
+class DatasetHandle:
+    """
+    Shared, lazily parsed view of one CSV file.
+
+    Validation, the Streamlit preview and the analysis tools all go through the
+    same handle, so cheap questions (header, dialect, a bounded sample) never
+    trigger a full parse, and the full parse happens at most once and is
+    reused by every later consumer. Once a columnar sidecar has been written
+    (see ``ensure_sidecar``), full and column-subset reads memory-map it
+    instead of re-tokenizing the CSV text.
+    """
+
+    def __init__(self, path: str):
+        self.path = _normalize(path)
+        self.size, self.mtime_ns = _stat(self.path)
+        self._dialect: Optional[Dict[str, Any]] = None
+        self._frame: Optional[pd.DataFrame] = None
+        self._sidecar: Optional[str] = None
+        self._optimized_key: Optional[Tuple] = None
+        self._optimized: Optional[pd.DataFrame] = None
+        self.footprint: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def key(self) -> Tuple[str, int, int]:
+        return (self.path, self.size, self.mtime_ns)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._frame is not None
+
+    def sniff(self) -> Dict[str, Any]:
+        """
+        Detect the delimiter and header from the first bytes of the file.
+
+        Returns:
+            Dict[str, Any]: ``delimiter``, ``quotechar`` and ``columns`` (the header fields).
+
+        Raises:
+            pd.errors.EmptyDataError: If the file has no content.
+        """
+        if self._dialect is not None:
+            return self._dialect
+
+        with io.TextIOWrapper(open_binary(self.path), newline='', encoding='utf-8', errors='replace') as f:
+            head = f.read(SNIFF_BYTES)
+        if not head.strip():
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        # Only consider complete lines so a truncated last row does not confuse the sniffer
+        lines = head.splitlines(keepends=True)
+        if len(lines) > 1 and len(head) == SNIFF_BYTES:
+            lines = lines[:-1]
+        try:
+            dialect = csv.Sniffer().sniff(''.join(lines), delimiters=',;\t|')
+        except csv.Error:
+            dialect = csv.excel
+        header = next(csv.reader(lines[:1], dialect), [])
+        if len(header) <= 1 and dialect.delimiter != ',':
+            # A single-column file gives the sniffer nothing to go on; keep the default
+            dialect = csv.excel
+            header = next(csv.reader(lines[:1], dialect), [])
+
+        self._dialect = {
+            "delimiter": dialect.delimiter,
+            "quotechar": dialect.quotechar,
+            "columns": header,
+        }
+        return self._dialect
+
+    def read_options(self) -> Dict[str, Any]:
+        """Keyword arguments that make ``pd.read_csv`` use the sniffed dialect."""
+        dialect = self.sniff()
+        return {"sep": dialect["delimiter"], "quotechar": dialect["quotechar"]}
+
+    def find_sidecar(self) -> Optional[str]:
+        """Path of an existing sidecar for this file content, if one was written before."""
+        if self._sidecar is not None and not os.path.exists(self._sidecar):
+            # Evicted to keep the sidecar directory within its disk budget
+            self._sidecar = None
+        if self._sidecar is None and sidecar_available():
+            path = sidecar_path(self.path)
+            if os.path.exists(path):
+                self._sidecar = path
+                touch_sidecar(path)
+        return self._sidecar
+
+    def ensure_sidecar(self) -> Optional[str]:
+        """
+        Convert the CSV into a columnar sidecar on first touch and return its path.
+
+        The CSV is streamed into the sidecar chunk by chunk, so creating it
+        costs one parse with bounded memory rather than a full in-memory load;
+        only files whose dtypes change part way through are parsed whole.
+        Returns None when pyarrow is not installed or the data cannot be stored
+        in Arrow; callers then keep working from the CSV.
+        """
+        if self.find_sidecar() is None and sidecar_available():
+            path = sidecar_path(self.path)
+            if self._frame is None:
+                chunks = pd.read_csv(csv_input(self.path), chunksize=SIDECAR_BATCH_ROWS, low_memory=False,
+                                     **self.read_options())
+                self._sidecar = write_sidecar_chunks(chunks, path)
+            if self._sidecar is None:
+                self._sidecar = write_sidecar(self.dataframe(), path)
+        return self._sidecar
+
+    def sample(self, nrows: int = DEFAULT_SAMPLE_ROWS) -> pd.DataFrame:
+        """Return the first ``nrows`` rows, reusing the full frame when it is already parsed."""
+        if self._frame is not None:
+            return self._frame.head(nrows)
+        sidecar = self.find_sidecar()
+        if sidecar is not None:
+            return next(iter_sidecar_chunks(sidecar)).head(nrows)
+        return pd.read_csv(csv_input(self.path), nrows=nrows, low_memory=False, **self.read_options())
+
+    def dataframe(self) -> pd.DataFrame:
+        """Return the full DataFrame, loading it on first use only."""
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    sidecar = self.find_sidecar()
+                    if sidecar is not None:
+                        self._frame = read_sidecar(sidecar)
+                    else:
+                        self._frame = pd.read_csv(csv_input(self.path), low_memory=False, **self.read_options())
+        return self._frame
+
+    def optimized_dataframe(self, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Return the data with narrow dtypes and categoricals, restricted to ``usecols``.
+
+        Categoricals are planned from the bounded sample. If the full frame is
+        already in memory it is downcast directly; otherwise the file (or its
+        sidecar) is loaded chunk by chunk so the default-dtype representation is
+        never materialized as a whole. ``footprint`` records the raw and
+        optimized sizes in bytes. The last optimized frame is memoized.
+        """
+        key = tuple(usecols) if usecols is not None else None
+        with self._lock:
+            if self._optimized is not None and self._optimized_key == key:
+                return self._optimized
+
+            if self._frame is not None or self.find_sidecar() is not None:
+                raw = self._frame if self._frame is not None else read_sidecar(self._sidecar, columns=usecols)
+                if usecols is not None:
+                    raw = raw[usecols]
+                df = downcast_frame(raw, plan_categoricals(raw.head(DEFAULT_SAMPLE_ROWS)))
+                footprint = {
+                    "raw_bytes": int(raw.memory_usage(deep=True).sum()),
+                    "optimized_bytes": int(df.memory_usage(deep=True).sum()),
+                }
+            else:
+                df, footprint = load_csv_optimized(self.path, self.sample(), usecols=usecols,
+                                                   read_options=self.read_options())
+
+            self._optimized_key = key
+            self._optimized = df
+            self.footprint = footprint
+            return df
+
+    def read_columns(self, columns: List[str]) -> pd.DataFrame:
+        """Read a subset of columns without materializing the rest of the file."""
+        if self._frame is not None:
+            return self._frame[columns]
+        sidecar = self.find_sidecar()
+        if sidecar is not None:
+            return read_sidecar(sidecar, columns=columns)
+        return pd.read_csv(csv_input(self.path), usecols=columns, low_memory=False,
+                           **self.read_options())[columns]
+
+    def metrics(self) -> Dict[str, int]:
+        """Row, column and missing-value counts from the parsed frame."""
+        df = self.dataframe()
+        return {
+            "rows": int(df.shape[0]),
+            "columns": int(df.shape[1]),
+            "missing": int(df.isna().sum().sum()),
+        }
+
+    def release(self) -> None:
+        """Drop the parsed frames so their memory can be reclaimed."""
+        self._frame = None
+        self._optimized = None
+        self._optimized_key = None
+
+
+def _normalize(path: str) -> str:
+    return path if is_buffer_path(path) else os.path.abspath(path)
+
+
+def _stat(path: str) -> Tuple[int, int]:
+    """Size and mtime of a file; registered buffers never change, so their mtime is 0."""
+    if is_buffer_path(path):
+        return get_buffer(path).size, 0
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+_handles: "OrderedDict[str, DatasetHandle]" = OrderedDict()
+_handles_lock = threading.Lock()
+
+
+def get_dataset_handle(path: str) -> DatasetHandle:
+    """
+    Return the shared handle for ``path``.
+
+    Handles are looked up by absolute path and replaced when the file's size or
+    mtime changes. Only the ``MAX_OPEN_HANDLES`` most recently used handles are
+    kept, so parsed frames of old uploads do not pile up in memory.
+    """
+    abs_path = _normalize(path)
+    size, mtime_ns = _stat(abs_path)
+    with _handles_lock:
+        handle = _handles.get(abs_path)
+        if handle is None or handle.key != (abs_path, size, mtime_ns):
+            handle = DatasetHandle(abs_path)
+            _handles[abs_path] = handle
+        _handles.move_to_end(abs_path)
+        while len(_handles) > MAX_OPEN_HANDLES:
+            _, evicted = _handles.popitem(last=False)
+            evicted.release()
+    return handle
+
+
+def release_dataset_handle(path: str) -> None:
+    """Forget the handle for ``path`` and free its parsed frame, if any."""
+    with _handles_lock:
+        handle = _handles.pop(_normalize(path), None)
+    if handle is not None:
+        handle.release()
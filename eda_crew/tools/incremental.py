@@ -0,0 +1,283 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import zipfile
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .categorical import CategoricalSketch, HyperLogLog, MisraGries
+from .dataset import get_dataset_handle
+from .profile_cache import DEFAULT_CACHE_DIR
+from .profiler import (ChunkProfiler, CoMomentAccumulator, MomentsAccumulator, ReservoirSampler,
+                       DEFAULT_CHUNKSIZE, DEFAULT_QUANTILE_SAMPLE_SIZE, PROFILER_VERSION, _profile_dataframe)
+from .quality import DuplicateCounter
+from .sketches import DEFAULT_QUANTILE_ERROR, KLLSketch
+
+# Saved profile state of append-only files, one file per CSV and option set
+DEFAULT_STATE_DIR = os.getenv("EDA_INCREMENTAL_DIR", os.path.join(DEFAULT_CACHE_DIR, "incremental"))
+
+# Bytes at the start of the file, and just before the saved offset, that must
+# be unchanged for the saved state to be resumed
+PREFIX_HASH_BYTES = 1024 * 1024
+BOUNDARY_HASH_BYTES = 64 * 1024
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Layout of the saved state files; states of another version are ignored
+STATE_FORMAT_VERSION = 1
+
+# The only classes a saved state may contain; loading never runs other code
+_STATE_CLASSES = {cls.__name__: cls for cls in (
+    ChunkProfiler, MomentsAccumulator, CoMomentAccumulator, ReservoirSampler, KLLSketch,
+    CategoricalSketch, HyperLogLog, MisraGries, DuplicateCounter,
+)}
+
+
+class _RangeReader(io.RawIOBase):
+    """Read ``prefix`` followed by ``length`` bytes of ``f`` from its current position."""
+
+    def __init__(self, f, prefix: bytes, length: int):
+        self._f = f
+        self._prefix = prefix
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if self._prefix:
+            count = min(len(b), len(self._prefix))
+            b[:count] = self._prefix[:count]
+            self._prefix = self._prefix[count:]
+            return count
+        if self._remaining <= 0:
+            return 0
+        data = self._f.read(min(len(b), self._remaining))
+        b[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+def _hash_range(f, start: int, end: int) -> str:
+    digest = hashlib.sha256()
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(READ_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _checksums(f, offset: int) -> Dict[str, str]:
+    return {
+        "prefix": _hash_range(f, 0, min(offset, PREFIX_HASH_BYTES)),
+        "boundary": _hash_range(f, max(0, offset - BOUNDARY_HASH_BYTES), offset),
+    }
+
+
+def _last_line_end(f, start: int, size: int) -> int:
+    """Offset just past the last line break in ``[start, size)``, or ``start`` if there is none."""
+    position = size
+    while position > start:
+        block_start = max(start, position - READ_BLOCK_SIZE)
+        f.seek(block_start)
+        block = f.read(position - block_start)
+        index = block.rfind(b"\n")
+        if index >= 0:
+            return block_start + index + 1
+        position = block_start
+    return start
+
+
+def _encode(value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """JSON-friendly form of a profile state value; arrays are moved into ``arrays``."""
+    if isinstance(value, (bytes, np.ndarray)):
+        array = np.frombuffer(value, dtype=np.uint8) if isinstance(value, bytes) else value
+        if array.dtype == object:
+            raise TypeError("Object arrays cannot be saved in a profile state")
+        key = f"array_{len(arrays)}"
+        arrays[key] = array
+        return {"__bytes__" if isinstance(value, bytes) else "__array__": key}
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_encode(item, arrays) for item in value]
+    if isinstance(value, set):
+        return {"__set__": [_encode(item, arrays) for item in value]}
+    if isinstance(value, dict):
+        return {"__dict__": [[_encode(key, arrays), _encode(item, arrays)] for key, item in value.items()]}
+    if isinstance(value, pd.Series):
+        return {"__series__": {"index": [_encode(key, arrays) for key in value.index],
+                               "values": _encode(value.to_numpy(), arrays)}}
+    if isinstance(value, np.random.Generator):
+        return {"__rng__": value.bit_generator.state}
+    if _STATE_CLASSES.get(type(value).__name__) is type(value):
+        return {"__object__": type(value).__name__, "fields": _encode(vars(value), arrays)}
+    raise TypeError(f"Cannot save {type(value).__name__} in a profile state")
+
+
+def _decode(value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    """Inverse of ``_encode``."""
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__array__" in value:
+        return arrays[value["__array__"]]
+    if "__bytes__" in value:
+        return arrays[value["__bytes__"]].tobytes()
+    if "__set__" in value:
+        return {_decode(item, arrays) for item in value["__set__"]}
+    if "__dict__" in value:
+        return {_decode(key, arrays): _decode(item, arrays) for key, item in value["__dict__"]}
+    if "__series__" in value:
+        series = value["__series__"]
+        return pd.Series(_decode(series["values"], arrays),
+                         index=pd.Index(_decode(series["index"], arrays), dtype=object))
+    if "__rng__" in value:
+        if value["__rng__"].get("bit_generator") != "PCG64":
+            raise ValueError("Unsupported random generator in profile state")
+        generator = np.random.Generator(np.random.PCG64())
+        generator.bit_generator.state = value["__rng__"]
+        return generator
+    if "__object__" in value:
+        obj = _STATE_CLASSES[value["__object__"]].__new__(_STATE_CLASSES[value["__object__"]])
+        obj.__dict__.update(_decode(value["fields"], arrays))
+        return obj
+    raise ValueError("Unknown value in profile state")
+
+
+def state_path(csv_path: str, options: Dict[str, Any], state_dir: str = DEFAULT_STATE_DIR) -> str:
+    key = json.dumps({"path": os.path.abspath(csv_path), "version": PROFILER_VERSION, **options}, sort_keys=True)
+    return os.path.join(os.path.abspath(state_dir), f"{hashlib.sha256(key.encode()).hexdigest()}.npz")
+
+
+def _load_state(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a state saved by ``_save_state``, or None if it is missing or unusable.
+
+    The file is an ``.npz`` archive of plain arrays plus the JSON description
+    of the state; it is read without pickle, so a tampered file cannot run code.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        document = json.loads(arrays.pop("state").tobytes().decode("utf-8"))
+        if document.get("format") != STATE_FORMAT_VERSION:
+            return None
+        return _decode(document["state"], arrays)
+    except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile):
+        return None
+
+
+def _save_state(path: str, state: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    arrays: Dict[str, np.ndarray] = {}
+    document = json.dumps({"format": STATE_FORMAT_VERSION, "state": _encode(state, arrays)})
+    arrays["state"] = np.frombuffer(document.encode("utf-8"), dtype=np.uint8)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def profile_incremental(csv_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                        quantile_sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE,
+                        quantile_sketch: bool = False,
+                        quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                        correlation_options: Optional[Dict[str, Any]] = None,
+                        usecols: Optional[List[str]] = None,
+                        state_dir: str = DEFAULT_STATE_DIR) -> Dict[str, Any]:
+    """
+    Profile an append-only CSV, parsing only the bytes added since the last run.
+
+    The streaming profile state is saved after the last complete line together
+    with its byte offset, the header and hashes of the file's first bytes and of
+    the bytes just before the offset. The next run resumes from that state if
+    the header and both hashes still match, and profiles the whole file again
+    otherwise (the file was truncated, rotated or rewritten). Edits in the
+    middle of the file, outside the hashed ranges, are not detected. An
+    unterminated last line is included in the result but not in the saved
+    state, so it is read again once it is complete.
+
+    Returns:
+        Dict[str, Any]: The profile, as in streaming mode, plus an ``incremental``
+        entry with ``resumed``, ``new_bytes``, ``new_rows`` and ``offset``.
+    """
+    options = {
+        "usecols": usecols,
+        "quantile_sketch": quantile_sketch,
+        "quantile_error": quantile_error,
+        "quantile_sample_size": quantile_sample_size,
+    }
+    path = state_path(csv_path, options, state_dir)
+    size = os.path.getsize(csv_path)
+    # Parse with the sniffed delimiter and quote character, as every other read of the file does
+    read_options = get_dataset_handle(csv_path).read_options()
+
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+        if not header.strip():
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        state = _load_state(path)
+        resumed = (
+            state is not None
+            and state.get("header") == header
+            and len(header) <= state.get("offset", -1) <= size
+            and _checksums(f, state["offset"]) == state.get("checksums")
+        )
+        if resumed:
+            profiler, start = state["profiler"], state["offset"]
+        else:
+            profiler, start = ChunkProfiler(quantile_sample_size, quantile_sketch, quantile_error, usecols), len(header)
+        rows_before = profiler.num_rows
+
+        end = _last_line_end(f, start, size)
+        if end > start:
+            f.seek(start)
+            reader = io.BufferedReader(_RangeReader(f, header, end - start), buffer_size=READ_BLOCK_SIZE)
+            for chunk in pd.read_csv(reader, usecols=usecols, chunksize=chunksize, low_memory=False,
+                                     **read_options):
+                profiler.update(chunk)
+        if end > start or not resumed:
+            _save_state(path, {
+                "header": header,
+                "offset": end,
+                "checksums": _checksums(f, end),
+                "profiler": profiler,
+            })
+
+        f.seek(end)
+        tail = f.read(size - end)
+
+    if tail.strip():
+        profiler.update(pd.read_csv(io.BytesIO(header + tail), usecols=usecols, low_memory=False,
+                                    **read_options))
+
+    if profiler.num_rows == 0:
+        # Header-only file: let pandas infer the (empty) frame from the header
+        empty = pd.read_csv(io.BytesIO(header), usecols=usecols, nrows=0, **read_options)
+        profile = _profile_dataframe(empty if usecols is None else empty[usecols],
+                                     quantile_sketch, quantile_error, correlation_options)
+    else:
+        profile = profiler.result(correlation_options)
+    profile["incremental"] = {
+        "resumed": resumed,
+        "new_bytes": size - start,
+        "new_rows": profiler.num_rows - rows_before,
+        "offset": end,
+    }
+    return profile
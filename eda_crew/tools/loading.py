@@ -0,0 +1,131 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype, is_object_dtype, is_string_dtype
+from pandas.api.types import union_categoricals
+
+from .sources import csv_input
+
+# String columns become categoricals when the sampled distinct ratio is at most this
+CATEGORY_MAX_RATIO = 0.5
+
+# ... and they have at most this many distinct values in the sample
+CATEGORY_MAX_UNIQUE = 10_000
+
+# Rows per chunk when parsing with dtype optimization
+OPTIMIZED_CHUNKSIZE = 100_000
+
+
+def plan_categoricals(sample: pd.DataFrame) -> List[str]:
+    """Pick the low-cardinality string columns of a sample that should load as categoricals."""
+    columns = []
+    for col in sample.columns:
+        series = sample[col]
+        if not (is_object_dtype(series.dtype) or is_string_dtype(series.dtype)) or is_bool_dtype(series.dtype):
+            continue
+        non_null = series.dropna()
+        if non_null.empty:
+            continue
+        unique = non_null.nunique()
+        if unique <= CATEGORY_MAX_UNIQUE and unique / len(non_null) <= CATEGORY_MAX_RATIO:
+            columns.append(col)
+    return columns
+
+
+def downcast_frame(df: pd.DataFrame, categorical_columns: List[str]) -> pd.DataFrame:
+    """
+    Shrink a frame's dtypes without changing any value.
+
+    Integers move to the narrowest signed type that holds their range, floats
+    move to float32 only when every value survives the round trip, and the
+    planned string columns become categoricals.
+    """
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if col in categorical_columns and not is_bool_dtype(series.dtype):
+            series = series.astype('category')
+        elif is_integer_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+            series = pd.to_numeric(series, downcast='integer')
+        elif is_float_dtype(series.dtype) and series.dtype != np.float32:
+            values = series.to_numpy()
+            narrowed = values.astype(np.float32)
+            with np.errstate(over='ignore', invalid='ignore'):
+                lossless = np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True)
+            if lossless:
+                series = pd.Series(narrowed, index=series.index, name=col)
+        columns[col] = series
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _concat_chunks(chunks: List[pd.DataFrame], categorical_columns: List[str]) -> pd.DataFrame:
+    """Concatenate optimized chunks column by column, unioning categorical categories."""
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if col in categorical_columns and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            try:
+                columns[col] = pd.Series(union_categoricals(parts), name=col)
+            except TypeError:
+                # Categories of different dtypes (e.g. a chunk where the column is all empty)
+                columns[col] = pd.concat([part.astype(object) for part in parts],
+                                         ignore_index=True).astype('category')
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(columns)
+
+
+def load_csv_optimized(path: str, sample: pd.DataFrame, usecols: Optional[List[str]] = None,
+                       chunksize: int = OPTIMIZED_CHUNKSIZE,
+                       read_options: Optional[Dict[str, Any]] = None) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    Parse a CSV with narrow numeric dtypes and categoricals for low-cardinality strings.
+
+    The categorical columns are planned from ``sample`` (a bounded pre-pass). The
+    file is then parsed chunk by chunk and every chunk is downcast right away, so
+    the default-dtype representation only ever exists for one chunk at a time.
+
+    Args:
+        path (str): Path to the CSV file.
+        sample (pd.DataFrame): Leading rows of the file used to plan categoricals.
+        usecols (Optional[List[str]]): Only load these columns.
+        chunksize (int): Rows parsed per chunk.
+        read_options (Optional[Dict[str, Any]]): Extra ``pd.read_csv`` arguments,
+            such as the sniffed ``sep``.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, int]]: The optimized frame and a footprint report
+        with ``raw_bytes`` (default dtypes) and ``optimized_bytes``.
+    """
+    if usecols is not None:
+        sample = sample[usecols]
+    categorical_columns = plan_categoricals(sample)
+
+    read_options = read_options or {}
+    chunks = []
+    raw_bytes = 0
+    # Parse the planned columns as text, so a chunk where one is all numbers or all
+    # empty still yields string categories that union with the other chunks'
+    for chunk in pd.read_csv(csv_input(path), usecols=usecols, chunksize=chunksize, low_memory=False,
+                             dtype={col: str for col in categorical_columns}, **read_options):
+        if usecols is not None:
+            chunk = chunk[usecols]
+        raw_bytes += int(chunk.memory_usage(deep=True, index=False).sum())
+        chunks.append(downcast_frame(chunk, categorical_columns))
+
+    if not chunks:
+        df = pd.read_csv(csv_input(path), usecols=usecols, nrows=0, **read_options)
+    else:
+        df = _concat_chunks(chunks, categorical_columns)
+        del chunks
+        # Chunks that disagreed on an integer width were widened again by the concat
+        df = downcast_frame(df, [])
+
+    index_bytes = int(df.index.memory_usage())
+    return df, {
+        "raw_bytes": raw_bytes + index_bytes,
+        "optimized_bytes": int(df.memory_usage(deep=True).sum()),
+    }
@@ -0,0 +1,118 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .sketches import DEFAULT_QUANTILE_ERROR
+from .sidecar import read_sidecar
+from .stats import numeric_columns, numeric_statistics
+from .categorical import categorical_columns, categorical_statistics
+from .quality import combine_row_hashes, outlier_statistics, row_hashes
+
+
+def default_workers() -> int:
+    """Worker count used when parallel profiling is requested without an explicit number."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def shard_columns(columns: List[str], num_shards: int) -> List[List[str]]:
+    """Split columns into at most ``num_shards`` contiguous, evenly sized shards."""
+    num_shards = max(1, min(num_shards, len(columns)))
+    return [list(shard) for shard in np.array_split(np.array(columns, dtype=object), num_shards)]
+
+
+def _profile_shard(sidecar_file: str, columns: List[str], quantile_sketch: bool,
+                   quantile_error: float) -> Dict[str, Any]:
+    """
+    Profile one shard of columns inside a worker process.
+
+    The worker memory-maps only its own columns from the Arrow sidecar, so the
+    parent never pickles the DataFrame; only the per-column results and one
+    8-byte hash per row (for duplicate detection) travel back.
+    """
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    df = read_sidecar(sidecar_file, columns=columns)
+    nulls = df.isnull().sum()
+    numeric_cols = numeric_columns(df)
+    statistics, sketches = numeric_statistics(df, numeric_cols, quantile_sketch, quantile_error)
+    return {
+        "num_rows": int(df.shape[0]),
+        "column_dtypes": {col: str(df[col].dtype) for col in columns},
+        "memory_bytes": int(df.memory_usage(deep=True, index=False).sum()),
+        "missing_by_column": {col: int(nulls[col]) for col in columns},
+        "numeric_columns": numeric_cols,
+        "statistics": statistics,
+        "quantile_sketches": {col: sketch.to_dict() for col, sketch in sketches.items()},
+        "categorical_stats": categorical_statistics(df, categorical_columns(df)),
+        "outliers": outlier_statistics(df, numeric_cols, statistics),
+        "row_hashes": row_hashes(df),
+        "seconds": time.perf_counter() - started,
+        "cpu_seconds": time.process_time() - cpu_started,
+    }
+
+
+def profile_shards(sidecar_file: str, columns: List[str], workers: Optional[int] = None,
+                   quantile_sketch: bool = False,
+                   quantile_error: float = DEFAULT_QUANTILE_ERROR) -> Dict[str, Any]:
+    """
+    Profile ``columns`` of a sidecar across a process pool and merge the shard results.
+
+    Args:
+        sidecar_file (str): Path to the Arrow sidecar of the dataset.
+        columns (List[str]): Columns to profile, in output order.
+        workers (Optional[int]): Number of worker processes; defaults to ``default_workers()``.
+        quantile_sketch (bool): Use KLL sketches for median and quartiles.
+        quantile_error (float): Target rank error of the sketches.
+
+    Returns:
+        Dict[str, Any]: Merged per-column results plus an ``execution`` entry with the
+        worker count, shard count and per-shard and wall-clock timings.
+    """
+    workers = workers or default_workers()
+    shards = shard_columns(columns, workers * 2)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_profile_shard, sidecar_file, shard, quantile_sketch, quantile_error)
+            for shard in shards
+        ]
+        results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - started
+
+    merged: Dict[str, Any] = {
+        "num_rows": results[0]["num_rows"] if results else 0,
+        "column_dtypes": {},
+        "memory_bytes": 0,
+        "missing_by_column": {},
+        "numeric_columns": [],
+        "statistics": {},
+        "quantile_sketches": {},
+        "categorical_stats": {},
+        "outliers": {},
+    }
+    for result in results:
+        for key in ("column_dtypes", "missing_by_column", "statistics", "quantile_sketches",
+                    "categorical_stats", "outliers"):
+            merged[key].update(result[key])
+        merged["numeric_columns"].extend(result["numeric_columns"])
+        merged["memory_bytes"] += result["memory_bytes"]
+    # Shards hold disjoint columns, so their row hashes combine into full-row hashes
+    merged["row_hashes"] = combine_row_hashes([result["row_hashes"] for result in results])
+
+    shard_seconds = [round(result["seconds"], 4) for result in results]
+    cpu_seconds = sum(result["cpu_seconds"] for result in results)
+    merged["execution"] = {
+        "mode": "parallel",
+        "workers": workers,
+        "shards": len(shards),
+        "wall_time_s": round(wall_time, 4),
+        "shard_time_s": shard_seconds,
+        "cpu_time_s": round(cpu_seconds, 4),
+        # Worker CPU time over wall time: how many cores were effectively busy.
+        # Not a speedup, which would need a serial run to compare against
+        "effective_cores": round(cpu_seconds / wall_time, 2) if wall_time > 0 else None,
+    }
+    return merged
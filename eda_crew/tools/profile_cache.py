@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from .sources import get_buffer, is_buffer_path
+
+# Default location and size budget of the on-disk profile cache
+DEFAULT_CACHE_DIR = os.getenv("EDA_PROFILE_CACHE_DIR", ".eda_cache")
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Bytes hashed at the start, middle and end of a file for the sampled fingerprint
+SAMPLE_BLOCK_SIZE = 64 * 1024
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy scalars and other stragglers into JSON-friendly values."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def file_fingerprint(file_path: str, content_hash: bool = False) -> str:
+    """
+    Fingerprint a file for use in cache keys.
+
+    Args:
+        file_path (str): Path to the file.
+        content_hash (bool): Hash the full file content. When False (default) the
+            fingerprint combines size, mtime and hashes of three sampled blocks,
+            which is constant-time and catches in-place rewrites.
+
+    Returns:
+        str: Hex digest identifying the file content.
+    """
+    if is_buffer_path(file_path):
+        # In-memory CSVs are immutable and already content-hashed
+        return hashlib.sha256(f"buffer={get_buffer(file_path).digest}".encode()).hexdigest()
+
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        if content_hash:
+            digest.update(f"size={stat.st_size}".encode())
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        else:
+            digest.update(f"size={stat.st_size};mtime={stat.st_mtime_ns}".encode())
+            for offset in (0, max(0, stat.st_size // 2 - SAMPLE_BLOCK_SIZE // 2),
+                           max(0, stat.st_size - SAMPLE_BLOCK_SIZE)):
+                f.seek(offset)
+                digest.update(f.read(SAMPLE_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def evict_lru(directory: str, max_bytes: int, suffixes: Tuple[str, ...],
+              keep: Optional[str] = None) -> int:
+    """
+    Delete the least recently used files of ``directory`` until it fits ``max_bytes``.
+
+    Only files ending in one of ``suffixes`` are counted and deleted, and the
+    file at ``keep`` (typically the one just written) is never deleted.
+    Recency is the file's mtime, which readers refresh with ``os.utime``.
+
+    Returns:
+        int: Number of files deleted.
+    """
+    if not os.path.isdir(directory):
+        return 0
+    keep = os.path.abspath(keep) if keep else None
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(suffixes):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) == keep:
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    return evicted
+
+
+class ProfileCache:
+    """
+    Size-bounded LRU cache of dataset profiles stored as JSON files.
+
+    Entries are keyed by the file fingerprint, the profiler version and the
+    profiling options, so a changed file, a new profiler release or different
+    options never return a stale profile. Access time is tracked through the
+    entry's mtime; the least recently used entries are evicted once the cache
+    grows past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(fingerprint: str, version: str, options: Optional[Dict[str, Any]] = None) -> str:
+        payload = json.dumps({"file": fingerprint, "version": version, "options": options or {}},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached profile for ``key``, or None on a miss.
+
+        A profile whose correlation matrix file has since been evicted counts
+        as a miss, so it is recomputed rather than served with a dangling path.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r') as f:
+                profile = json.load(f)
+            matrix_path = (profile.get("correlation") or {}).get("matrix_path")
+            if matrix_path and not os.path.exists(matrix_path):
+                raise FileNotFoundError(matrix_path)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return profile
+
+    def put(self, key: str, profile: Dict[str, Any]) -> None:
+        """Store a profile and evict least recently used entries if over budget."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(profile, f, default=_json_default)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        self._evict()
+
+    def _evict(self) -> None:
+        evicted = evict_lru(self.cache_dir, self.max_bytes, ('.json',))
+        with self._lock:
+            self.evictions += evicted
+
+    def clear(self) -> None:
+        """Remove every cached profile."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                os.unlink(os.path.join(self.cache_dir, name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the current on-disk footprint."""
+        entries = 0
+        size = 0
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    entries += 1
+                    size += os.path.getsize(os.path.join(self.cache_dir, name))
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+_default_cache: Optional[ProfileCache] = None
+
+
+def get_profile_cache() -> ProfileCache:
+    """Return the process-wide profile cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ProfileCache()
+    return _default_cache
@@ -0,0 +1,729 @@
+import hashlib
+import json
+import os
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from pandas.api.types import is_bool_dtype, pandas_dtype
+
+from .sketches import KLLSketch, DEFAULT_QUANTILE_ERROR
+from .stats import is_numeric_like, numeric_columns, numeric_statistics
+from .categorical import CategoricalSketch, categorical_columns, categorical_statistics
+from .quality import (OUTLIER_METHODS, DuplicateCounter, duplicate_rows, duplicate_summary, estimate_outliers,
+                      outlier_statistics, row_hashes)
+from .dataset import get_dataset_handle
+from .sidecar import iter_sidecar_chunks, sidecar_columns
+from .parallel import profile_shards
+from .correlation import correlation_summary, summarize_correlation_matrix, DEFAULT_TOP_K
+from .profile_cache import DEFAULT_CACHE_DIR, evict_lru, file_fingerprint
+from .sampling import sample_csv, sampling_error_bounds
+from .sources import csv_input, is_buffer_path
+
+# Bumped whenever the profile output changes so cached profiles are invalidated
+PROFILER_VERSION = "10"
+
+# Where full correlation matrices are written when requested
+DEFAULT_CORRELATION_DIR = os.path.join(DEFAULT_CACHE_DIR, "correlations")
+
+# Disk budget of the correlation matrices; older ones are deleted before a new one is written
+DEFAULT_MAX_CORRELATION_BYTES = int(os.getenv("EDA_CORRELATION_MAX_BYTES", 512 * 1024 * 1024))
+
+# Default number of rows parsed per chunk in streaming mode
+DEFAULT_CHUNKSIZE = 100_000
+
+# Maximum number of values kept per column for quantile estimation in streaming mode.
+# Columns with fewer non-null values than this get exact quantiles.
+DEFAULT_QUANTILE_SAMPLE_SIZE = 20_000
+
+# Dtype ``read_csv`` gives a text column: ``str`` with pandas 3, ``object`` before
+STRING_DTYPE = str(pd.Series([], dtype="str").dtype)
+
+
+
+class MomentsAccumulator:
+    """
+    Mergeable count / mean / M2 / min / max for a fixed set of columns.
+
+    Moments are combined with Chan's parallel variant of Welford's algorithm,
+    so chunks can be folded in one at a time (or partial results merged)
+    without keeping any raw values around.
+    """
+
+    def __init__(self, num_columns: int):
+        self.count = np.zeros(num_columns, dtype=np.int64)
+        self.mean = np.zeros(num_columns)
+        self.m2 = np.zeros(num_columns)
+        self.min = np.full(num_columns, np.inf)
+        self.max = np.full(num_columns, -np.inf)
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold a 2-D float block (rows x columns, NaN for missing) into the state."""
+        other = MomentsAccumulator(block.shape[1])
+        valid = ~np.isnan(block)
+        other.count = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            other.mean = np.where(other.count > 0, np.nansum(block, axis=0) / other.count, 0.0)
+            other.m2 = np.nansum((block - other.mean) ** 2, axis=0)
+        other.min = np.where(other.count > 0, np.fmin.reduce(block, axis=0, initial=np.inf), np.inf)
+        other.max = np.where(other.count > 0, np.fmax.reduce(block, axis=0, initial=-np.inf), -np.inf)
+        self.merge(other)
+
+    def merge(self, other: "MomentsAccumulator") -> None:
+        """Merge another accumulator over the same columns into this one."""
+        total = self.count + other.count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = other.mean - self.mean
+            ratio = np.where(total > 0, other.count / np.maximum(total, 1), 0.0)
+            self.mean = self.mean + delta * ratio
+            self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * ratio
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+    def std(self) -> np.ndarray:
+        """Sample standard deviation (ddof=1), NaN where fewer than two values were seen."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / np.maximum(self.count - 1, 1)), np.nan)
+
+
+class CoMomentAccumulator:
+    """
+    Mergeable pairwise co-moments for Pearson correlation.
+
+    Every pair keeps its own count, means and centered sums over the rows
+    where both columns are present, which reproduces the pairwise-complete
+    behaviour of ``DataFrame.corr()``.
+
+    The state is six dense p x p float64 arrays (48 * p**2 bytes, about 480 MB
+    for 1,000 numeric columns), plus the temporaries of one update, so unlike
+    ``correlation_summary`` this does hold full matrices. It is independent of
+    the number of rows.
+    """
+
+    def __init__(self, num_columns: int):
+        shape = (num_columns, num_columns)
+        self.shift: Optional[np.ndarray] = None
+        self.count = np.zeros(shape)
+        self.mean_x = np.zeros(shape)
+        self.mean_y = np.zeros(shape)
+        self.m2_x = np.zeros(shape)
+        self.m2_y = np.zeros(shape)
+        self.c_xy = np.zeros(shape)
+
+    def update(self, block: np.ndarray) -> None:
+        """Fold a 2-D float block (rows x columns, NaN for missing) into the state."""
+        # Shift every chunk by the same offset to keep the raw sums well conditioned
+        if self.shift is None:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                col_means = np.nanmean(block, axis=0) if block.shape[0] else np.zeros(block.shape[1])
+            self.shift = np.nan_to_num(col_means)
+
+        mask = (~np.isnan(block)).astype(np.float64)
+        values = np.nan_to_num(block - self.shift)
+
+        other = CoMomentAccumulator(block.shape[1])
+        other.count = mask.T @ mask
+        sum_x = values.T @ mask
+        sum_y = sum_x.T
+        with np.errstate(invalid='ignore', divide='ignore'):
+            safe_count = np.maximum(other.count, 1)
+            other.mean_x = sum_x / safe_count
+            other.mean_y = sum_y / safe_count
+            sum_xx = (values ** 2).T @ mask
+            other.m2_x = sum_xx - sum_x * other.mean_x
+            other.m2_y = sum_xx.T - sum_y * other.mean_y
+            other.c_xy = values.T @ values - sum_x * other.mean_y
+        self.merge(other)
+
+    def merge(self, other: "CoMomentAccumulator") -> None:
+        """Merge another accumulator (same columns, same shift) into this one."""
+        total = self.count + other.count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(total > 0, other.count / np.maximum(total, 1), 0.0)
+            delta_x = other.mean_x - self.mean_x
+            delta_y = other.mean_y - self.mean_y
+            self.mean_x = self.mean_x + delta_x * ratio
+            self.mean_y = self.mean_y + delta_y * ratio
+            self.m2_x = self.m2_x + other.m2_x + delta_x ** 2 * self.count * ratio
+            self.m2_y = self.m2_y + other.m2_y + delta_y ** 2 * self.count * ratio
+            self.c_xy = self.c_xy + other.c_xy + delta_x * delta_y * self.count * ratio
+        self.count = total
+
+    def correlation(self) -> np.ndarray:
+        """Pearson correlation matrix, NaN where a pair has no variance."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            denom = np.sqrt(self.m2_x * self.m2_y)
+            corr = np.where(denom > 0, self.c_xy / denom, np.nan)
+        return np.clip(corr, -1.0, 1.0)
+
+
+class ReservoirSampler:
+    """
+    Bounded uniform sample of a column's non-null values (Algorithm R).
+
+    Holds every value while the column is smaller than ``capacity``, so
+    quantiles stay exact for small and medium files.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_QUANTILE_SAMPLE_SIZE, seed: int = 0):
+        self.capacity = capacity
+        self.seen = 0
+        self.values = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        free = self.capacity - len(self.values)
+        if free > 0:
+            self.values = np.concatenate([self.values, values[:free]])
+            self.seen += min(free, len(values))
+            values = values[free:]
+        if len(values) == 0:
+            return
+
+        positions = self.seen + np.arange(len(values))
+        slots = self._rng.integers(0, positions + 1)
+        keep = slots < self.capacity
+        # Later items overwrite earlier ones in the same slot, as in the serial algorithm
+        slots, picked = slots[keep][::-1], values[keep][::-1]
+        slots, first = np.unique(slots, return_index=True)
+        self.values[slots] = picked[first]
+        self.seen += len(values)
+
+    def quantile(self, q: float) -> float:
+        if len(self.values) == 0:
+            return float('nan')
+        return float(np.quantile(self.values, q))
+
+    def weighted_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The sampled values, each standing for ``seen / len(values)`` column values."""
+        weight = self.seen / len(self.values) if len(self.values) else 1.0
+        return self.values, np.full(len(self.values), weight)
+
+    @property
+    def is_exact(self) -> bool:
+        """True while the column is smaller than the reservoir and every value is held."""
+        return self.seen == len(self.values)
+
+
+def _merge_chunk_dtypes(dtypes: List[str], has_missing: bool) -> str:
+    """Reconcile per-chunk dtypes into the dtype a full ``read_csv`` would infer."""
+    if not dtypes:
+        return 'float64'
+    unique = set(dtypes)
+    if len(unique) == 1:
+        dtype = dtypes[0]
+    elif all(is_numeric_like(pandas_dtype(d)) and not is_bool_dtype(pandas_dtype(d)) for d in unique):
+        return 'float64'
+    elif unique & {'str', 'string'}:
+        # Text in any chunk makes the whole column text
+        return STRING_DTYPE
+    else:
+        # Booleans mixed with empty chunks, as a full parse gives them
+        return 'object'
+    if has_missing and dtype == 'int64':
+        return 'float64'
+    if has_missing and dtype == 'bool':
+        return 'object'
+    return dtype
+
+
+def _profile_dataframe(df: pd.DataFrame, quantile_sketch: bool = False,
+                       quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                       correlation_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Profile a fully loaded DataFrame."""
+    # Basic info
+    basic_info = {
+        "num_rows": int(df.shape[0]),
+        "num_columns": int(df.shape[1]),
+        "column_names": df.columns.tolist(),
+        "column_dtypes": {col: str(df[col].dtype) for col in df.columns},
+        "memory_usage": round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+    }
+
+    # Numeric statistics
+    numeric_cols = numeric_columns(df)
+    statistics, sketches = numeric_statistics(df, numeric_cols, quantile_sketch, quantile_error)
+    numeric_stats = {"statistics": statistics}
+    if quantile_sketch:
+        numeric_stats["quantile_sketches"] = {col: sketch.to_dict() for col, sketch in sketches.items()}
+
+    # IQR, z-score and MAD outliers, from the statistics computed above
+    outliers = outlier_statistics(df, numeric_cols, statistics)
+
+    # Distinct counts, frequent values and string lengths of the other columns
+    categorical_stats = categorical_statistics(df, categorical_columns(df))
+
+    # Strongest correlations between numeric columns, computed block by block
+    correlation = correlation_summary(df, numeric_cols, **(correlation_options or {}))
+
+    # Missing values
+    missing_values = {
+        "total_missing": int(df.isnull().sum().sum()),
+        "missing_by_column": df.isnull().sum().to_dict(),
+        "missing_percentage": (df.isnull().sum() / len(df) * 100).round(2).to_dict()
+    }
+
+    # Exact duplicate rows, found by hashing each row once
+    duplicates = duplicate_rows(df)
+
+    return {
+        "basic_info": basic_info,
+        "numeric_stats": numeric_stats,
+        "categorical_stats": categorical_stats,
+        "correlation": correlation,
+        "missing_values": missing_values,
+        "outliers": outliers,
+        "duplicates": duplicates
+    }
+
+
+class ChunkProfiler:
+    """
+    Single-pass profile state, folded one chunk at a time.
+
+    Every part of the state (moments, co-moments, quantile samplers or sketches,
+    categorical sketches and the duplicate counter) is mergeable and bounded in
+    the number of rows, so the object can be saved after the last complete
+    chunk and resumed later with rows appended to the file (see
+    ``incremental.py``).
+    """
+
+    def __init__(self, quantile_sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE,
+                 quantile_sketch: bool = False,
+                 quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                 usecols: Optional[List[str]] = None):
+        self.quantile_sample_size = quantile_sample_size
+        self.quantile_sketch = quantile_sketch
+        self.quantile_error = quantile_error
+        self.usecols = usecols
+        self.columns: List[str] = []
+        self.chunk_dtypes: Dict[str, List[str]] = {}
+        self.null_counts: Optional[np.ndarray] = None
+        self.num_rows = 0
+        self.memory_bytes = 0
+
+        self.candidates: List[str] = []
+        self.moments: Optional[MomentsAccumulator] = None
+        self.comoments: Optional[CoMomentAccumulator] = None
+        self.samplers: Dict[str, Any] = {}
+        self.categorical: Dict[str, CategoricalSketch] = {}
+        self.duplicates = DuplicateCounter()
+        self.dropped = set()
+
+    def _start(self, chunk: pd.DataFrame) -> None:
+        self.columns = chunk.columns.tolist()
+        self.chunk_dtypes = {col: [] for col in self.columns}
+        self.null_counts = np.zeros(len(self.columns), dtype=np.int64)
+        # Columns that are not numeric in the first chunk can never end up numeric
+        self.candidates = numeric_columns(chunk)
+        self.moments = MomentsAccumulator(len(self.candidates))
+        self.comoments = CoMomentAccumulator(len(self.candidates))
+        self.samplers = {
+            col: KLLSketch(self.quantile_error) if self.quantile_sketch
+            else ReservoirSampler(self.quantile_sample_size)
+            for col in self.candidates
+        }
+        self.categorical = {col: CategoricalSketch() for col in self.columns if col not in self.candidates}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk of rows into the state."""
+        if self.usecols is not None:
+            chunk = chunk[self.usecols]
+        if self.moments is None:
+            self._start(chunk)
+        candidates, dropped = self.candidates, self.dropped
+
+        nulls = chunk.isnull().sum().to_numpy()
+        self.null_counts += nulls
+        self.num_rows += len(chunk)
+        self.memory_bytes += int(chunk.memory_usage(deep=True, index=False).sum())
+        for col, missing in zip(self.columns, nulls):
+            # All-null chunks carry no dtype information
+            if missing < len(chunk):
+                self.chunk_dtypes[col].append(str(chunk[col].dtype))
+
+        for col in candidates:
+            if col not in dropped and not is_numeric_like(chunk[col].dtype):
+                dropped.add(col)
+        block = np.column_stack([
+            np.full(len(chunk), np.nan) if col in dropped
+            else chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in candidates
+        ]) if candidates else np.empty((len(chunk), 0))
+
+        self.duplicates.update(self._row_hashes(chunk, block))
+
+        self.moments.update(block)
+        self.comoments.update(block)
+        for idx, col in enumerate(candidates):
+            if col not in dropped:
+                column = block[:, idx]
+                self.samplers[col].update(column[~np.isnan(column)])
+        for col, sketch in self.categorical.items():
+            sketch.update(chunk[col])
+
+    def _row_hashes(self, chunk: pd.DataFrame, block: np.ndarray) -> np.ndarray:
+        """
+        Row hashes that agree across chunks whatever dtype a column parsed as in each.
+
+        Numeric candidates hash as float64, also in chunks after they were
+        dropped (values that parse as numbers hash as those numbers, the rest
+        as text), and the other columns hash as text even in a chunk where
+        they happen to parse as numbers.
+        """
+        def value_hashes(values: pd.Series) -> np.ndarray:
+            return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+        # Candidates are replaced by their value hashes in every chunk, so
+        # ``row_hashes`` hashes the same uint64 column whichever way they were parsed
+        hashed = {}
+        for idx, col in enumerate(self.candidates):
+            if col not in self.dropped:
+                hashed[col] = value_hashes(pd.Series(block[:, idx]))
+                continue
+            values = chunk[col]
+            numbers = pd.to_numeric(values, errors='coerce').astype(np.float64)
+            is_number = numbers.notna().to_numpy() | values.isna().to_numpy()
+            hashed[col] = np.where(is_number, value_hashes(numbers), value_hashes(values.astype(str)))
+        for col in self.categorical:
+            values = chunk[col]
+            if is_numeric_like(values.dtype):
+                hashed[col] = values.astype(str).where(values.notna())
+        return row_hashes(chunk.assign(**hashed)) if hashed else row_hashes(chunk)
+
+    def result(self, correlation_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """The profile of all rows folded so far; needs at least one row."""
+        columns, candidates, dropped = self.columns, self.candidates, self.dropped
+        null_counts, num_rows, moments, samplers = self.null_counts, self.num_rows, self.moments, self.samplers
+
+        column_dtypes = {
+            col: _merge_chunk_dtypes(self.chunk_dtypes[col], bool(null_counts[idx]))
+            for idx, col in enumerate(columns)
+        }
+
+        # Basic info
+        basic_info = {
+            "num_rows": num_rows,
+            "num_columns": len(columns),
+            "column_names": columns,
+            "column_dtypes": column_dtypes,
+            "memory_usage": round(self.memory_bytes / (1024 * 1024), 2),
+        }
+
+        # Numeric statistics
+        numeric_idx = [idx for idx, col in enumerate(candidates)
+                       if col not in dropped and is_numeric_like(pandas_dtype(column_dtypes[col]))]
+        std = moments.std()
+        statistics = {}
+        for idx in numeric_idx:
+            col = candidates[idx]
+            has_values = moments.count[idx] > 0
+            statistics[col] = {
+                "mean": float(moments.mean[idx]) if has_values else float('nan'),
+                "median": samplers[col].quantile(0.5),
+                "std": float(std[idx]),
+                "min": float(moments.min[idx]) if has_values else float('nan'),
+                "max": float(moments.max[idx]) if has_values else float('nan'),
+                "q1": samplers[col].quantile(0.25),
+                "q3": samplers[col].quantile(0.75)
+            }
+        numeric_stats = {"statistics": statistics}
+        if self.quantile_sketch:
+            numeric_stats["quantile_sketches"] = {
+                candidates[idx]: samplers[candidates[idx]].to_dict() for idx in numeric_idx
+            }
+
+        # IQR, z-score and MAD outliers, estimated from the retained quantile values
+        outliers = {
+            candidates[idx]: estimate_outliers(*samplers[candidates[idx]].weighted_values(),
+                                               statistics[candidates[idx]],
+                                               samplers[candidates[idx]].is_exact)
+            for idx in numeric_idx
+        }
+
+        # Distinct counts, frequent values and string lengths of the other columns
+        categorical_stats = {col: sketch.result() for col, sketch in self.categorical.items()}
+
+        # Strongest correlations between numeric columns, from the merged co-moments
+        corr = self.comoments.correlation()[np.ix_(numeric_idx, numeric_idx)]
+        correlation = summarize_correlation_matrix(corr, [candidates[idx] for idx in numeric_idx],
+                                                   **(correlation_options or {}))
+
+        # Missing values
+        missing_values = {
+            "total_missing": int(null_counts.sum()),
+            "missing_by_column": {col: int(null_counts[idx]) for idx, col in enumerate(columns)},
+            "missing_percentage": {
+                col: round(float(null_counts[idx]) / num_rows * 100, 2) if num_rows else float('nan')
+                for idx, col in enumerate(columns)
+            }
+        }
+
+        # Duplicate rows across all chunks, estimated once there are too many distinct rows to keep
+        duplicates = self.duplicates.result()
+
+        return {
+            "basic_info": basic_info,
+            "numeric_stats": numeric_stats,
+            "categorical_stats": categorical_stats,
+            "correlation": correlation,
+            "missing_values": missing_values,
+            "outliers": outliers,
+            "duplicates": duplicates
+        }
+
+
+def _profile_chunks(chunks: Iterable[pd.DataFrame], csv_path: str, quantile_sample_size: int,
+                    quantile_sketch: bool = False,
+                    quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                    correlation_options: Optional[Dict[str, Any]] = None,
+                    usecols: Optional[List[str]] = None,
+                    read_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Profile a CSV in a single pass over bounded-size chunks."""
+    profiler = ChunkProfiler(quantile_sample_size, quantile_sketch, quantile_error, usecols)
+    for chunk in chunks:
+        profiler.update(chunk)
+
+    if profiler.num_rows == 0:
+        # Header-only file: let pandas infer the (empty) frame from the header
+        header = pd.read_csv(csv_input(csv_path), usecols=usecols, nrows=0, **(read_options or {}))
+        return _profile_dataframe(header if usecols is None else header[usecols],
+                                  quantile_sketch, quantile_error, correlation_options)
+    return profiler.result(correlation_options)
+
+
+def _profile_parallel(handle, sidecar_file: str, workers: int,
+                      quantile_sketch: bool = False,
+                      quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                      correlation_options: Optional[Dict[str, Any]] = None,
+                      usecols: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Profile column shards in worker processes that memory-map the sidecar."""
+    columns = list(usecols) if usecols is not None else sidecar_columns(sidecar_file)
+    shards = profile_shards(sidecar_file, columns, workers, quantile_sketch, quantile_error)
+    num_rows = shards["num_rows"]
+    index_bytes = pd.RangeIndex(num_rows).memory_usage()
+
+    # Basic info
+    basic_info = {
+        "num_rows": num_rows,
+        "num_columns": len(columns),
+        "column_names": columns,
+        "column_dtypes": shards["column_dtypes"],
+        "memory_usage": round((shards["memory_bytes"] + index_bytes) / (1024 * 1024), 2),
+    }
+
+    # Numeric statistics
+    numeric_stats = {"statistics": shards["statistics"]}
+    if quantile_sketch:
+        numeric_stats["quantile_sketches"] = shards["quantile_sketches"]
+
+    # Distinct counts, frequent values and string lengths of the other columns
+    categorical_stats = shards["categorical_stats"]
+
+    # Strongest correlations, from numeric columns read straight off the memory-mapped sidecar
+    numeric_cols = shards["numeric_columns"]
+    correlation = correlation_summary(handle.read_columns(numeric_cols), numeric_cols,
+                                      **(correlation_options or {}))
+
+    # Missing values
+    missing = shards["missing_by_column"]
+    missing_values = {
+        "total_missing": int(sum(missing.values())),
+        "missing_by_column": missing,
+        "missing_percentage": {
+            col: round(count / num_rows * 100, 2) if num_rows else float('nan')
+            for col, count in missing.items()
+        }
+    }
+
+    return {
+        "basic_info": basic_info,
+        "numeric_stats": numeric_stats,
+        "categorical_stats": categorical_stats,
+        "correlation": correlation,
+        "missing_values": missing_values,
+        "outliers": shards["outliers"],
+        "duplicates": duplicate_summary(shards["row_hashes"], num_rows),
+        "execution": shards["execution"]
+    }
+
+
+def _profile_sample(sample: pd.DataFrame, info: Dict[str, Any], quantile_sketch: bool = False,
+                    quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                    correlation_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Profile a row sample and scale counts up to the estimated file size."""
+    profile = _profile_dataframe(sample, quantile_sketch, quantile_error, correlation_options)
+    total_rows = info["estimated_total_rows"]
+    scale = total_rows / len(sample) if len(sample) else 0.0
+
+    basic_info = profile["basic_info"]
+    basic_info["num_rows"] = total_rows
+    basic_info["memory_usage"] = round(float(basic_info["memory_usage"]) * scale, 2)
+
+    missing_values = profile["missing_values"]
+    missing_values["missing_by_column"] = {
+        col: int(round(count * scale)) for col, count in missing_values["missing_by_column"].items()
+    }
+    missing_values["total_missing"] = int(sum(missing_values["missing_by_column"].values()))
+
+    for summary in profile["outliers"].values():
+        summary["exact"] = False
+        for method in OUTLIER_METHODS:
+            summary[method]["count"] = int(round(summary[method]["count"] * scale))
+
+    # Duplicates are only counted among the sampled rows and are not scaled
+    profile["duplicates"]["within_sample"] = True
+
+    # Value counts scale with the file; distinct counts describe the sample
+    for summary in profile["categorical_stats"].values():
+        summary["count"] = int(round(summary["count"] * scale))
+        for item in summary["top_values"]:
+            item["count"] = int(round(item["count"] * scale))
+
+    profile["sampling"] = {
+        **info,
+        **sampling_error_bounds(sample, list(profile["numeric_stats"]["statistics"]), total_rows)
+    }
+    return profile
+
+
+def correlation_matrix_path(csv_path: str, **options: Any) -> str:
+    """
+    Where the full correlation matrix of ``csv_path`` is written.
+
+    The name covers the file fingerprint and every option that changes the
+    matrix (dtype, columns, sampling), so runs with different options on the
+    same file do not overwrite each other's artifact.
+    """
+    key = json.dumps({"file": file_fingerprint(csv_path), "version": PROFILER_VERSION, **options},
+                     sort_keys=True, default=str)
+    return os.path.join(DEFAULT_CORRELATION_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.npy")
+
+
+def profile_csv(csv_path: str, streaming: bool = False,
+                chunksize: int = DEFAULT_CHUNKSIZE,
+                quantile_sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE,
+                quantile_sketch: bool = False,
+                quantile_error: float = DEFAULT_QUANTILE_ERROR,
+                sidecar: bool = False,
+                workers: int = 1,
+                correlation_top_k: Optional[int] = DEFAULT_TOP_K,
+                correlation_threshold: Optional[float] = None,
+                correlation_float32: bool = False,
+                correlation_matrix: bool = False,
+                optimize_dtypes: bool = False,
+                usecols: Optional[List[str]] = None,
+                sample_rows: Optional[int] = None,
+                sample_method: str = "block",
+                incremental: bool = False) -> Dict[str, Any]:
+    """
+    Profile a CSV file and return the EDA dictionary used by the tools.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+        streaming (bool): Read the file in chunks of ``chunksize`` rows and fold each
+            chunk into mergeable accumulators, so peak memory is bounded by the chunk
+            size instead of the file size.
+        chunksize (int): Rows per chunk in streaming mode.
+        quantile_sample_size (int): Values kept per column for median/quartiles in
+            streaming mode. Quantiles are exact for columns with fewer values.
+        quantile_sketch (bool): Estimate median and quartiles with mergeable KLL
+            sketches built in one pass. The serialized sketches are added to
+            ``numeric_stats["quantile_sketches"]``.
+        quantile_error (float): Target normalized rank error of the sketches.
+        sidecar (bool): Convert the CSV into a memory-mapped Arrow sidecar on first
+            use (requires pyarrow; falls back to the CSV). An existing sidecar is
+            always preferred over the CSV, in streaming mode as well.
+        workers (int): Profile column shards in this many worker processes. The
+            workers memory-map their columns from the sidecar (which is created if
+            needed), and the result gains an ``execution`` entry with timings.
+            Ignored in streaming mode or when no sidecar can be written.
+        correlation_top_k (Optional[int]): Keep only this many of the strongest
+            correlation pairs; None keeps all pairs passing the threshold.
+        correlation_threshold (Optional[float]): Keep only pairs with an absolute
+            correlation of at least this value.
+        correlation_float32 (bool): Compute correlations in float32.
+        correlation_matrix (bool): Also write the full correlation matrix as a
+            ``.npy`` artifact; its path is returned as ``correlation["matrix_path"]``.
+        optimize_dtypes (bool): Load with the narrowest numeric dtypes and categoricals
+            for low-cardinality strings. ``basic_info`` then reports both
+            ``memory_usage_raw`` and ``memory_usage_optimized`` (MB). In-memory mode only.
+        usecols (Optional[List[str]]): Only load and profile these columns.
+        sample_rows (Optional[int]): Profile a sample of about this many rows instead
+            of the whole file. Row and missing counts are scaled to the estimated
+            total, and a ``sampling`` section carries the sample size, the estimated
+            row count and 95% confidence intervals for every statistic. Files with
+            fewer rows are profiled exactly.
+        sample_method (str): ``block`` reads blocks at random byte offsets (no full
+            scan, estimated row count); ``reservoir`` scans once for a uniform
+            sample and an exact row count.
+        incremental (bool): Treat the file as append-only: save the streaming
+            state after each run and on the next run parse only the appended
+            bytes (see ``incremental.profile_incremental``). Takes precedence over
+            the other modes; in-memory CSVs are profiled in streaming mode.
+
+    Returns:
+        Dict[str, Any]: ``basic_info``, ``numeric_stats``, ``categorical_stats``
+        (distinct counts, top values and string lengths of non-numeric columns),
+        ``correlation``, ``missing_values``, ``outliers`` (IQR, z-score and MAD
+        bounds and counts per numeric column) and ``duplicates`` sections.
+    """
+    handle = get_dataset_handle(csv_path)
+    correlation_options = {
+        "top_k": correlation_top_k,
+        "threshold": correlation_threshold,
+        "use_float32": correlation_float32,
+        "matrix_path": correlation_matrix_path(csv_path, use_float32=correlation_float32, usecols=usecols,
+                                               sample_rows=sample_rows, sample_method=sample_method)
+        if correlation_matrix else None,
+    }
+    if correlation_matrix:
+        evict_lru(os.path.abspath(DEFAULT_CORRELATION_DIR), DEFAULT_MAX_CORRELATION_BYTES, ('.npy',))
+
+    if incremental:
+        if not is_buffer_path(csv_path):
+            # Imported here: the incremental module builds on this one
+            from .incremental import profile_incremental
+            return profile_incremental(csv_path, chunksize, quantile_sample_size, quantile_sketch,
+                                       quantile_error, correlation_options, usecols)
+        streaming = True
+
+    if sample_rows:
+        sample, info = sample_csv(csv_path, sample_rows, sample_method)
+        if usecols is not None:
+            sample = sample[usecols]
+        if info["estimated_total_rows"] > info["sample_rows"]:
+            return _profile_sample(sample, info, quantile_sketch, quantile_error, correlation_options)
+
+    # Writing a sidecar needs one full parse, so streaming only reuses existing ones
+    sidecar_file = handle.ensure_sidecar() if sidecar and not streaming else handle.find_sidecar()
+
+    if streaming:
+        if sidecar_file is not None:
+            # Record batches of the sidecar are already typed; no text parsing needed
+            chunks = iter_sidecar_chunks(sidecar_file, columns=usecols)
+        else:
+            chunks = pd.read_csv(csv_input(csv_path), usecols=usecols, chunksize=chunksize, low_memory=False,
+                                 **handle.read_options())
+        return _profile_chunks(chunks, csv_path, quantile_sample_size,
+                               quantile_sketch, quantile_error, correlation_options, usecols,
+                               handle.read_options())
+
+    if workers > 1:
+        sidecar_file = sidecar_file or handle.ensure_sidecar()
+        if sidecar_file is not None and handle.sniff()["columns"]:
+            return _profile_parallel(handle, sidecar_file, workers, quantile_sketch, quantile_error,
+                                     correlation_options, usecols)
+
+    if optimize_dtypes:
+        df = handle.optimized_dataframe(usecols)
+        profile = _profile_dataframe(df, quantile_sketch, quantile_error, correlation_options)
+        profile["basic_info"]["memory_usage_raw"] = round(handle.footprint["raw_bytes"] / (1024 * 1024), 2)
+        profile["basic_info"]["memory_usage_optimized"] = round(handle.footprint["optimized_bytes"] / (1024 * 1024), 2)
+        return profile
+
+    # Reuse the frame already parsed for validation or preview, if any
+    df = handle.dataframe() if usecols is None else handle.read_columns(usecols)
+    return _profile_dataframe(df, quantile_sketch, quantile_error, correlation_options)
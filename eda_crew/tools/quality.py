@@ -0,0 +1,231 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional
+
+from .stats import block_width, numeric_columns
+from .categorical import HyperLogLog
+
+# Tukey fences: values beyond q1 - 1.5 * IQR or q3 + 1.5 * IQR
+IQR_MULTIPLIER = 1.5
+
+# Values more than this many standard deviations from the mean
+Z_SCORE_THRESHOLD = 3.0
+
+# Modified z-score 0.6745 * |x - median| / MAD above this (Iglewicz and Hoaglin)
+MAD_THRESHOLD = 3.5
+MAD_SCALE = 0.6745
+
+OUTLIER_METHODS = ("iqr", "zscore", "mad")
+
+# Distinct row hashes kept for an exact duplicate count in streaming mode (8 bytes
+# each); past this the count is estimated from a HyperLogLog of the hashes
+DEFAULT_EXACT_DUPLICATE_HASHES = 1_000_000
+DUPLICATE_HLL_PRECISION = 16
+
+
+def _bounds(statistics: Dict[str, float], mad: float) -> Dict[str, List[float]]:
+    """Lower and upper outlier bounds of every method for one column."""
+    iqr = statistics["q3"] - statistics["q1"]
+    spread = Z_SCORE_THRESHOLD * statistics["std"]
+    mad_spread = MAD_THRESHOLD * mad / MAD_SCALE
+    return {
+        "iqr": [statistics["q1"] - IQR_MULTIPLIER * iqr, statistics["q3"] + IQR_MULTIPLIER * iqr],
+        "zscore": [statistics["mean"] - spread, statistics["mean"] + spread],
+        "mad": [statistics["median"] - mad_spread, statistics["median"] + mad_spread],
+    }
+
+
+def _summary(bounds: Dict[str, List[float]], counts: Dict[str, float], mad: float,
+             exact: bool) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {
+        method: {
+            "lower": float(bounds[method][0]),
+            "upper": float(bounds[method][1]),
+            "count": int(round(counts[method])),
+        }
+        for method in OUTLIER_METHODS
+    }
+    summary["mad_value"] = float(mad)
+    summary["exact"] = exact
+    return summary
+
+
+def outlier_statistics(df: pd.DataFrame, columns: List[str],
+                       statistics: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, Any]]:
+    """
+    IQR, z-score and MAD outlier bounds and counts for numeric ``columns``.
+
+    Reuses the mean, std and quartiles already in ``statistics``; the only new
+    per-column work is one median of absolute deviations and a comparison pass,
+    both done for blocks of about ``STATS_BLOCK_BYTES`` at a time.
+    """
+    outliers: Dict[str, Dict[str, Any]] = {}
+    block_columns = block_width(len(df))
+    for start in range(0, len(columns), block_columns):
+        block_cols = columns[start:start + block_columns]
+        block = df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        median = np.array([statistics[col]["median"] for col in block_cols])
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mad = np.nanmedian(np.abs(block - median), axis=0) if len(block) else np.full(len(block_cols), np.nan)
+
+        for idx, col in enumerate(block_cols):
+            bounds = _bounds(statistics[col], mad[idx])
+            column = block[:, idx]
+            counts = {
+                method: np.count_nonzero((column < low) | (column > high))
+                for method, (low, high) in bounds.items()
+            }
+            outliers[col] = _summary(bounds, counts, mad[idx], exact=True)
+    return outliers
+
+
+def estimate_outliers(values: np.ndarray, weights: np.ndarray,
+                      statistics: Dict[str, float], exact: bool) -> Dict[str, Any]:
+    """
+    Outlier bounds and counts of one column from a weighted summary of its values.
+
+    Used in streaming mode, where only a reservoir sample or quantile sketch of
+    the column survives the pass: every retained value stands for ``weight``
+    values of the column.
+    """
+    if len(values) == 0:
+        return _summary(_bounds(statistics, np.nan), dict.fromkeys(OUTLIER_METHODS, 0), np.nan, exact)
+    deviations = np.abs(values - statistics["median"])
+    if exact:
+        mad = float(np.median(deviations))
+    else:
+        # Weighted median of the absolute deviations
+        order = np.argsort(deviations, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        middle = min(int(np.searchsorted(cumulative, cumulative[-1] / 2)), len(values) - 1)
+        mad = float(deviations[order][middle])
+
+    bounds = _bounds(statistics, mad)
+    counts = {
+        method: float(weights[(values < low) | (values > high)].sum())
+        for method, (low, high) in bounds.items()
+    }
+    return _summary(bounds, counts, mad, exact)
+
+
+def _combine(combined: np.ndarray, part: np.ndarray) -> np.ndarray:
+    with np.errstate(over='ignore'):
+        return combined * np.uint64(1_000_003) ^ part
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """One 64-bit hash per row, built column by column without comparing rows."""
+    combined = np.zeros(len(df), dtype=np.uint64)
+    for col in df.columns:
+        combined = _combine(combined, pd.util.hash_pandas_object(df[col], index=False).to_numpy())
+    return combined
+
+
+def combine_row_hashes(hashes: List[np.ndarray]) -> np.ndarray:
+    """Combine per-shard row hashes of disjoint column groups into one hash per row."""
+    combined = np.zeros(len(hashes[0]) if hashes else 0, dtype=np.uint64)
+    for part in hashes:
+        combined = _combine(combined, part)
+    return combined
+
+
+def duplicate_rows(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Count duplicate rows of an in-memory frame, hashing text columns only where needed.
+
+    Numeric columns hash at memory speed, text columns are far slower. Rows are
+    first hashed on the numeric columns alone; only rows that collide there can
+    be duplicates, so the text columns are hashed for those rows only.
+    """
+    numeric = numeric_columns(df)
+    other = [col for col in df.columns if col not in numeric]
+    if not numeric or not other:
+        return duplicate_summary(row_hashes(df), len(df))
+
+    partial = row_hashes(df[numeric])
+    _, inverse, counts = np.unique(partial, return_inverse=True, return_counts=True)
+    candidates = np.flatnonzero(counts[inverse] > 1)
+    full = _combine(partial[candidates], row_hashes(df[other].iloc[candidates]))
+    return duplicate_summary(full, len(df))
+
+
+def duplicate_summary(hashes: np.ndarray, num_rows: int) -> Dict[str, Any]:
+    """
+    Count rows whose hash was already seen among ``num_rows`` rows.
+
+    The expected number of hash collisions between distinct rows is about
+    ``n**2 / 2**65`` (0.03 for a billion rows), so this matches
+    ``df.duplicated().sum()`` without comparing rows or building per-row tuples.
+    """
+    duplicates = len(hashes) - len(np.unique(hashes))
+    return {
+        "duplicate_rows": int(duplicates),
+        "duplicate_percentage": round(duplicates / num_rows * 100, 2) if num_rows else 0.0,
+        "estimated": False,
+    }
+
+
+class DuplicateCounter:
+    """
+    Bounded, mergeable duplicate-row count over a stream of row hashes.
+
+    The distinct hashes are kept, sorted, while there are at most
+    ``max_exact`` of them, and the count is exact. Past that they move into a
+    HyperLogLog of ``2**precision`` bytes and the count becomes the number of
+    rows minus the estimated number of distinct rows, reported with
+    ``estimated: true``. The error is relative to the distinct count (~0.4% at
+    precision 16), so on a large file with few duplicates the estimate is
+    mostly noise.
+    """
+
+    def __init__(self, max_exact: int = DEFAULT_EXACT_DUPLICATE_HASHES,
+                 precision: int = DUPLICATE_HLL_PRECISION):
+        self.max_exact = max_exact
+        self.precision = precision
+        self.rows = 0
+        self.unique = np.empty(0, dtype=np.uint64)
+        self.sketch: Optional[HyperLogLog] = None
+
+    def _spill(self) -> None:
+        self.sketch = HyperLogLog(self.precision)
+        self.sketch.update(self.unique)
+        self.unique = np.empty(0, dtype=np.uint64)
+
+    def _add_unique(self, hashes: np.ndarray) -> None:
+        if self.sketch is not None:
+            self.sketch.update(hashes)
+            return
+        self.unique = np.union1d(self.unique, hashes)
+        if len(self.unique) > self.max_exact:
+            self._spill()
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add the hashes of one chunk of rows."""
+        self.rows += len(hashes)
+        self._add_unique(np.asarray(hashes, dtype=np.uint64))
+
+    def merge(self, other: "DuplicateCounter") -> None:
+        """Fold in a counter built on other rows of the same columns."""
+        self.rows += other.rows
+        if other.sketch is None:
+            self._add_unique(other.unique)
+            return
+        if self.sketch is None:
+            self._spill()
+        self.sketch.merge(other.sketch)
+
+    @property
+    def estimated(self) -> bool:
+        return self.sketch is not None
+
+    def result(self) -> Dict[str, Any]:
+        """Duplicate summary in the same shape as ``duplicate_summary``."""
+        distinct = len(self.unique) if self.sketch is None else min(self.rows, int(round(self.sketch.estimate())))
+        duplicates = self.rows - distinct
+        return {
+            "duplicate_rows": int(duplicates),
+            "duplicate_percentage": round(duplicates / self.rows * 100, 2) if self.rows else 0.0,
+            "estimated": self.estimated,
+        }
@@ -1,33 +1,50 @@
-from typing import Dict, Any, Optional
+from typing import Optional
 from pydantic import BaseModel
 from crewai.tools import BaseTool
 import os
 from datetime import datetime
 import json
 
+from .artifacts import find_handle, get_artifact_store
+from .report_writer import RENDERERS, StreamingReportWriter, bullets, heading, table, text
+
+# Numeric columns rendered per report section, so viewers can page through wide datasets
+REPORT_COLUMNS_PER_SECTION = 50
+
 class ReportGenerationSchema(BaseModel):
     analysis_results: Optional[str] = None
+    analysis_handle: Optional[str] = None
     recommendations: Optional[str] = ""
     dataset_quality: Optional[str] = ""
     potential_uses: Optional[str] = ""
     output_dir: Optional[str] = "reports"
+    output_format: Optional[str] = "markdown"
 
 class ReportGenerationTool(BaseTool):
     name: str = "Report Generation Tool"
-    description: str = "Generates a markdown EDA report."
+    description: str = ("Generates an EDA report (markdown, html or json). Pass the artifact handle returned by "
+                        "csv_analysis_tool as analysis_handle instead of re-sending the analysis JSON.")
     args_schema: type[ReportGenerationSchema] = ReportGenerationSchema
 
     def _run(self, analysis_results: str = None, recommendations: str = "", 
              dataset_quality: str = "", potential_uses: str = "",
-             output_dir: str = "reports") -> str:
+             output_dir: str = "reports", analysis_handle: str = None,
+             output_format: str = "markdown") -> str:
         try:
             # Create output directory with absolute path
             output_dir = os.path.abspath(output_dir)
             os.makedirs(output_dir, exist_ok=True)
-            report_path = os.path.join(output_dir, f"eda_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md")
+            extension = RENDERERS[output_format].extension if output_format in RENDERERS else ".md"
+            report_path = os.path.join(output_dir, f"eda_report_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}{extension}")
             
+            # Load the full profile by handle when given one (directly or inside the results)
+            handle = analysis_handle or find_handle(analysis_results)
+            stored = get_artifact_store().get(handle) if handle else None
+
             # Parse analysis results
-            if isinstance(analysis_results, str):
+            if stored is not None:
+                analysis_data = stored
+            elif isinstance(analysis_results, str):
                 try:
                     analysis_data = json.loads(analysis_results)
                 except json.JSONDecodeError:
@@ -39,6 +56,9 @@ class ReportGenerationTool(BaseTool):
             basic_info = analysis_data.get("basic_info", {})
             missing_values = analysis_data.get("missing_values", {})
             numeric_stats = analysis_data.get("numeric_stats", {})
+            categorical_stats = analysis_data.get("categorical_stats", {})
+            outliers = analysis_data.get("outliers", {})
+            duplicates = analysis_data.get("duplicates", {})
             correlation = analysis_data.get("correlation", {})
             
             def format_number(value, decimals=2):
@@ -62,107 +82,131 @@ class ReportGenerationTool(BaseTool):
             if not potential_uses:
                 potential_uses = "Based on the dataset structure, it could be suitable for descriptive analytics and exploratory visualizations. Further domain knowledge is required to determine specific use cases."
             
-            # Build report content with enhanced formatting
-            report_content = [
-                "# 📊 Exploratory Data Analysis Report",
-                f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*",
-                "",
-                "## 📋 Executive Summary",
-                "This report provides a comprehensive analysis of the dataset, including basic statistics, missing value analysis, and correlation patterns.",
-                "",
-                "## 1️⃣ Dataset Overview",
-                "### 📊 Basic Information",
-                f"- **Total Records**: {basic_info.get('num_rows', 'N/A')}",
-                f"- **Total Features**: {basic_info.get('num_columns', 'N/A')}",
-                f"- **Memory Usage**: {format_number(basic_info.get('memory_usage', 0))} MB",
-                "",
-                "### 🏷 Column Information",
-                "The following table shows the data types of each column in the dataset:",
-                "",
-                "| Column | Data Type | Description |",
-                "|--------|-----------|-------------|"]
-            
-            # Add column information
-            for col, dtype in basic_info.get("column_dtypes", {}).items():
-                report_content.append(f"| {col} | {dtype} |")
-            
-            # Add dataset quality summary section
-            report_content.extend([
-                "",
-                "### 🔍 Dataset Quality Summary",
-                dataset_quality,
-                ""
-            ])
-            
-            # Add missing values section
-            report_content.extend([
-                "## 2️⃣ Missing Values Analysis",
-                f"- **Total Missing**: {missing_values.get('total_missing', 'N/A')}",
-                "",
-                "| Column | Missing Count | Missing % |",
-                "|--------|---------------|------------|"]
-            )
-            
-            for col in missing_values.get("missing_by_column", {}):
-                count = missing_values["missing_by_column"][col]
-                percentage = missing_values.get("missing_percentage", {}).get(col, 0)
-                report_content.append(
-                    f"| {col} | {count} | {format_number(percentage)}% |")
-            
-            # Add numeric statistics section
-            report_content.extend([
-                "",
-                "## 3️⃣ Numeric Column Analysis"])
-            
-            for col, stats in numeric_stats.get("statistics", {}).items():
-                report_content.extend([
-                    f"### {col}",
-                    f"- **Mean**: {format_number(stats.get('mean'))}",
-                    f"- **Median**: {format_number(stats.get('median'))}",
-                    f"- **Std Dev**: {format_number(stats.get('std'))}",
-                    f"- **Min**: {format_number(stats.get('min'))}",
-                    f"- **Max**: {format_number(stats.get('max'))}",
-                    f"- **Q1**: {format_number(stats.get('q1'))}",
-                    f"- **Q3**: {format_number(stats.get('q3'))}",
-                    ""])
-            
-            # Add correlation matrix section
-            if correlation and "matrix" in correlation:
-                report_content.extend([
-                    "## 4️⃣ Correlation Analysis",
-                    "| Variable 1 | Variable 2 | Correlation |",
-                    "|------------|------------|-------------|"]
-                )
-                
-                matrix = correlation["matrix"]
-                for var1 in matrix:
-                    for var2 in matrix[var1]:
-                        if var1 != var2:  # Skip self-correlations
-                            corr_value = matrix[var1][var2]
-                            report_content.append(
-                                f"| {var1} | {var2} | {format_number(corr_value)} |")
-            
-            # Add potential use cases section
-            report_content.extend([
-                "",
-                "## 5️⃣ Potential Use Cases",
-                potential_uses,
-                ""
-            ])
-            
-            # Add recommendations section
-            report_content.extend([
-                "## 6️⃣ Recommendations",
-                recommendations or "No specific recommendations provided."])
-            
-            # Save report
-            with open(report_path, 'w') as f:
-                f.write("\n".join(report_content))
+            sections = self._sections(basic_info, missing_values, numeric_stats, categorical_stats,
+                                      outliers, duplicates, correlation, dataset_quality,
+                                      potential_uses, recommendations, format_number)
+
+            # Write each section to disk as soon as it is rendered
+            with StreamingReportWriter(report_path, output_format) as writer:
+                for title, blocks in sections:
+                    writer.write_section(title, blocks)
             
             return report_path
         
         except Exception as e:
+            # Written like any other report, so viewers find its section index too
             error_report_path = os.path.join(output_dir, "error_report.md")
-            with open(error_report_path, 'w') as f:
-                f.write(f"# ❌ Error in Report Generation\n\n{str(e)}")
-            return error_report_path
\ No newline at end of file
+            with StreamingReportWriter(error_report_path) as writer:
+                writer.write_section("Error", [heading("❌ Error in Report Generation", 1), text(str(e))])
+            return error_report_path
+
+    @staticmethod
+    def _sections(basic_info, missing_values, numeric_stats, categorical_stats, outliers,
+                  duplicates, correlation, dataset_quality, potential_uses, recommendations,
+                  format_number):
+        """Yield the report as (title, blocks) sections, one at a time."""
+        yield "Overview", [
+            heading("📊 Exploratory Data Analysis Report", 1),
+            text(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"),
+            heading("📋 Executive Summary"),
+            text("This report provides a comprehensive analysis of the dataset, including basic statistics, missing value analysis, and correlation patterns."),
+            heading("1️⃣ Dataset Overview"),
+            heading("📊 Basic Information", 3),
+            bullets([
+                ("Total Records", basic_info.get('num_rows', 'N/A')),
+                ("Total Features", basic_info.get('num_columns', 'N/A')),
+                ("Memory Usage", f"{format_number(basic_info.get('memory_usage', 0))} MB"),
+                ("Duplicate Rows", f"{'~' if duplicates.get('estimated') else ''}"
+                                   f"{duplicates.get('duplicate_rows', 'N/A')} "
+                                   f"({format_number(duplicates.get('duplicate_percentage'))}%)"),
+            ]),
+            heading("🔍 Dataset Quality Summary", 3),
+            text(dataset_quality),
+        ]
+
+        column_dtypes = basic_info.get("column_dtypes", {})
+        yield "Column Information", [
+            heading("🏷 Column Information", 3),
+            text("The following table shows the data types of each column in the dataset:"),
+            table(["Column", "Data Type"], ([col, dtype] for col, dtype in column_dtypes.items())),
+        ]
+
+        missing_by_column = missing_values.get("missing_by_column", {})
+        missing_percentage = missing_values.get("missing_percentage", {})
+        yield "Missing Values", [
+            heading("2️⃣ Missing Values Analysis"),
+            bullets([("Total Missing", missing_values.get('total_missing', 'N/A'))]),
+            table(["Column", "Missing Count", "Missing %"], (
+                [col, count, f"{format_number(missing_percentage.get(col, 0))}%"]
+                for col, count in missing_by_column.items())),
+        ]
+
+        # Numeric statistics, paged so wide datasets become many small sections
+        statistics = list(numeric_stats.get("statistics", {}).items())
+        for start in range(0, max(len(statistics), 1), REPORT_COLUMNS_PER_SECTION):
+            page = statistics[start:start + REPORT_COLUMNS_PER_SECTION]
+            blocks = [heading("3️⃣ Numeric Column Analysis")] if start == 0 else []
+            for col, stats in page:
+                items = [(label, format_number(stats.get(key))) for label, key in (
+                    ("Mean", "mean"), ("Median", "median"), ("Std Dev", "std"), ("Min", "min"),
+                    ("Max", "max"), ("Q1", "q1"), ("Q3", "q3"))]
+                if col in outliers:
+                    column_outliers = outliers[col]
+                    items.append(("Outliers",
+                                  f"{column_outliers.get('iqr', {}).get('count', 'N/A')} (IQR), "
+                                  f"{column_outliers.get('zscore', {}).get('count', 'N/A')} (z-score), "
+                                  f"{column_outliers.get('mad', {}).get('count', 'N/A')} (MAD)"))
+                blocks.extend([heading(col, 3), bullets(items)])
+            title = "Numeric Columns" if len(statistics) <= REPORT_COLUMNS_PER_SECTION else \
+                f"Numeric Columns {start + 1}-{start + len(page)}"
+            yield title, blocks
+
+        if categorical_stats:
+            def categorical_rows():
+                for col, stats in categorical_stats.items():
+                    distinct = stats.get("distinct", "N/A")
+                    if not stats.get("distinct_exact", True):
+                        distinct = f"~{distinct}"
+                    top = ", ".join(f"{item.get('value')} ({item.get('count')})"
+                                    for item in stats.get("top_values", [])[:3])
+                    yield [col, distinct, top or 'N/A', format_number(stats.get('length', {}).get('mean'))]
+
+            yield "Categorical and Text Columns", [
+                heading("🔤 Categorical and Text Columns", 3),
+                table(["Column", "Distinct", "Most Frequent", "Avg Length"], categorical_rows()),
+            ]
+
+        # Correlation section from the sparse top pairs
+        if correlation and "pairs" in correlation:
+            blocks = [
+                heading("4️⃣ Correlation Analysis"),
+                text(f"Strongest correlations among {len(correlation.get('columns', []))} numeric columns "
+                     f"(top {correlation.get('top_k') or 'all'} pairs by absolute value):"),
+                table(["Variable 1", "Variable 2", "Correlation"], (
+                    [pair.get('var1'), pair.get('var2'), format_number(pair.get('correlation'))]
+                    for pair in correlation["pairs"])),
+            ]
+            if correlation.get("matrix_path"):
+                blocks.append(text(f"The full correlation matrix is available at `{correlation['matrix_path']}`."))
+            yield "Correlation Analysis", blocks
+
+        # Legacy dense correlation matrix
+        elif correlation and "matrix" in correlation:
+            matrix = correlation["matrix"]
+            yield "Correlation Analysis", [
+                heading("4️⃣ Correlation Analysis"),
+                table(["Variable 1", "Variable 2", "Correlation"], (
+                    [var1, var2, format_number(matrix[var1][var2])]
+                    for var1 in matrix for var2 in matrix[var1]
+                    if var1 != var2)),  # Skip self-correlations
+            ]
+
+        yield "Potential Use Cases", [
+            heading("5️⃣ Potential Use Cases"),
+            text(potential_uses),
+        ]
+
+        yield "Recommendations", [
+            heading("6️⃣ Recommendations"),
+            text(recommendations or "No specific recommendations provided."),
+        ]
@@ -0,0 +1,197 @@
+import html
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Type
+
+# A report is a sequence of sections, each a title plus a list of blocks:
+#   {"type": "heading", "level": 2, "text": "..."}
+#   {"type": "text", "text": "..."}
+#   {"type": "bullets", "items": [("Label", "value"), ...]}
+#   {"type": "table", "headers": [...], "rows": <iterable of lists>}
+# Table rows may be a generator, so a section never has to exist in memory as text.
+
+
+def heading(text: str, level: int = 2) -> Dict[str, Any]:
+    return {"type": "heading", "level": level, "text": text}
+
+
+def text(content: str) -> Dict[str, Any]:
+    return {"type": "text", "text": content}
+
+
+def bullets(items: Iterable) -> Dict[str, Any]:
+    return {"type": "bullets", "items": list(items)}
+
+
+def table(headers: List[str], rows: Iterable[List[Any]]) -> Dict[str, Any]:
+    return {"type": "table", "headers": headers, "rows": rows}
+
+
+class ReportRenderer(ABC):
+    """Turns report sections into text chunks for one output format."""
+
+    extension = ".txt"
+
+    def begin(self) -> str:
+        return ""
+
+    @abstractmethod
+    def section(self, title: str, blocks: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the text of one section, block by block."""
+
+    def end(self) -> str:
+        return ""
+
+
+class MarkdownRenderer(ReportRenderer):
+    extension = ".md"
+
+    def section(self, title: str, blocks: List[Dict[str, Any]]) -> Iterator[str]:
+        for block in blocks:
+            kind = block["type"]
+            if kind == "heading":
+                yield f"{'#' * block['level']} {block['text']}\n"
+            elif kind == "text":
+                yield f"{block['text']}\n"
+            elif kind == "bullets":
+                yield "".join(f"- **{label}**: {value}\n" for label, value in block["items"])
+            elif kind == "table":
+                headers = block["headers"]
+                yield "| " + " | ".join(headers) + " |\n"
+                yield "|" + "|".join("-" * (len(header) + 2) for header in headers) + "|\n"
+                for row in block["rows"]:
+                    yield "| " + " | ".join(str(cell) for cell in row) + " |\n"
+            yield "\n"
+
+
+class HtmlRenderer(ReportRenderer):
+    extension = ".html"
+
+    def begin(self) -> str:
+        return ("<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>EDA Report</title></head>\n"
+                "<body>\n")
+
+    def section(self, title: str, blocks: List[Dict[str, Any]]) -> Iterator[str]:
+        yield f"<section data-title=\"{html.escape(title)}\">\n"
+        for block in blocks:
+            kind = block["type"]
+            if kind == "heading":
+                level = min(block["level"], 6)
+                yield f"<h{level}>{html.escape(block['text'])}</h{level}>\n"
+            elif kind == "text":
+                yield "".join(f"<p>{html.escape(line)}</p>\n" for line in block["text"].split("\n") if line)
+            elif kind == "bullets":
+                yield "<ul>\n" + "".join(
+                    f"<li><strong>{html.escape(str(label))}</strong>: {html.escape(str(value))}</li>\n"
+                    for label, value in block["items"]) + "</ul>\n"
+            elif kind == "table":
+                yield "<table>\n<tr>" + "".join(f"<th>{html.escape(h)}</th>" for h in block["headers"]) + "</tr>\n"
+                for row in block["rows"]:
+                    yield "<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>\n"
+                yield "</table>\n"
+        yield "</section>\n"
+
+    def end(self) -> str:
+        return "</body>\n</html>\n"
+
+
+class JsonRenderer(ReportRenderer):
+    """Writes ``{"sections": [{"title", "blocks"}, ...]}`` one section at a time."""
+
+    extension = ".json"
+
+    def __init__(self):
+        self._first = True
+
+    def begin(self) -> str:
+        return '{"sections": [\n'
+
+    def section(self, title: str, blocks: List[Dict[str, Any]]) -> Iterator[str]:
+        yield ("" if self._first else ",\n") + '{"title": ' + json.dumps(title) + ', "blocks": ['
+        self._first = False
+        for idx, block in enumerate(blocks):
+            prefix = ", " if idx else ""
+            if block["type"] == "table":
+                yield prefix + '{"type": "table", "headers": ' + json.dumps(block["headers"]) + ', "rows": ['
+                for row_idx, row in enumerate(block["rows"]):
+                    yield ("" if row_idx == 0 else ", ") + json.dumps([str(cell) for cell in row])
+                yield "]}"
+            else:
+                yield prefix + json.dumps(block, default=str)
+        yield "]}"
+
+    def end(self) -> str:
+        return "\n]}\n"
+
+
+RENDERERS: Dict[str, Type[ReportRenderer]] = {
+    "markdown": MarkdownRenderer,
+    "html": HtmlRenderer,
+    "json": JsonRenderer,
+}
+
+
+def register_renderer(name: str, renderer: Type[ReportRenderer]) -> None:
+    """Make another output format available to the report writer."""
+    RENDERERS[name] = renderer
+
+
+def index_path(report_path: str) -> str:
+    return f"{report_path}.index.json"
+
+
+class StreamingReportWriter:
+    """
+    Write a report section by section, flushing each one to disk as it is rendered.
+
+    Next to the report an index (``<report>.index.json``) records the byte offset
+    and length of every section, so viewers can load one section at a time.
+    """
+
+    def __init__(self, path: str, output_format: str = "markdown"):
+        if output_format not in RENDERERS:
+            raise ValueError(f"Unknown report format '{output_format}', expected one of {sorted(RENDERERS)}")
+        self.path = path
+        self.output_format = output_format
+        self.renderer = RENDERERS[output_format]()
+        self.sections: List[Dict[str, Any]] = []
+        self._file = None
+
+    def __enter__(self) -> "StreamingReportWriter":
+        self._file = open(self.path, 'wb')
+        self._write(self.renderer.begin())
+        return self
+
+    def _write(self, chunk: str) -> None:
+        if chunk:
+            self._file.write(chunk.encode('utf-8'))
+
+    def write_section(self, title: str, blocks: List[Dict[str, Any]]) -> None:
+        """Render one section straight into the file and record where it landed."""
+        offset = self._file.tell()
+        for chunk in self.renderer.section(title, blocks):
+            self._write(chunk)
+        self._file.flush()
+        self.sections.append({"title": title, "offset": offset, "length": self._file.tell() - offset})
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._write(self.renderer.end())
+        self._file.close()
+        with open(index_path(self.path), 'w') as f:
+            json.dump({"format": self.output_format, "sections": self.sections}, f)
+
+
+def load_report_index(report_path: str) -> Optional[Dict[str, Any]]:
+    """Section index of a report written by ``StreamingReportWriter``, or None."""
+    try:
+        with open(index_path(report_path), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_report_section(report_path: str, section: Dict[str, Any]) -> str:
+    """Read a single section of a report using its index entry."""
+    with open(report_path, 'rb') as f:
+        f.seek(section["offset"])
+        return f.read(section["length"]).decode('utf-8')
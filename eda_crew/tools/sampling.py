@@ -0,0 +1,200 @@
+import io
+import math
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .dataset import get_dataset_handle
+from .sources import csv_input, open_binary, source_size
+
+# Rows profiled in sampled mode when no explicit size is given
+DEFAULT_SAMPLE_ROWS = 100_000
+
+# Consecutive lines read at each random byte offset of a block sample. Small
+# blocks keep sorted or clustered files close to a simple random sample.
+DEFAULT_BLOCK_ROWS = 16
+
+# Two-sided z score of the reported confidence intervals
+CONFIDENCE_LEVEL = 0.95
+Z_SCORE = 1.959964
+
+SAMPLE_METHODS = ("block", "reservoir")
+
+
+def _read_header(f) -> bytes:
+    f.seek(0)
+    return f.readline()
+
+
+def block_sample(path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                 block_rows: int = DEFAULT_BLOCK_ROWS,
+                 seed: int = 0) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Sample rows from blocks at random byte offsets without scanning the file.
+
+    Each block starts at the first line break after a random offset and takes
+    ``block_rows`` consecutive lines. The total row count is
+    estimated from the file size and the mean sampled line length. Rows are
+    split on line breaks, so quoted fields containing newlines can be cut, and
+    lines following long lines are slightly more likely to be picked; when line
+    length trends with a value (an increasing id, say) its estimate is biased.
+    Use the reservoir method for such files.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, Any]]: The sampled rows and a ``sampling`` info dict.
+    """
+    handle = get_dataset_handle(path)
+    size = source_size(path)
+    rng = np.random.default_rng(seed)
+    num_blocks = max(1, math.ceil(sample_rows / block_rows))
+
+    with open_binary(path) as f:
+        header = _read_header(f)
+        body_start = f.tell()
+        body_size = size - body_start
+        offsets = np.sort(rng.integers(body_start, max(body_start + 1, size), num_blocks))
+
+        lines: List[bytes] = []
+        next_free = body_start
+        for offset in offsets:
+            # Blocks never overlap: start after the previous block ended
+            if offset > next_free:
+                f.seek(int(offset))
+                f.readline()  # Skip the partial line we landed in
+            else:
+                f.seek(next_free)
+            for _ in range(block_rows):
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    lines.append(line)
+            next_free = f.tell()
+
+    sampled_bytes = sum(len(line) for line in lines)
+    mean_line = sampled_bytes / len(lines) if lines else 1
+    estimated_rows = int(round(body_size / mean_line)) if lines else 0
+    if estimated_rows <= sample_rows:
+        # The whole file fits in the sample: parse it through the shared handle,
+        # so a full profile of the same file afterwards reuses the frame
+        df = handle.dataframe()
+        return df, {
+            "method": "block",
+            "sample_rows": int(len(df)),
+            "estimated_total_rows": int(len(df)),
+            "row_count_exact": True,
+        }
+    df = pd.read_csv(io.BytesIO(header + b"".join(lines)), low_memory=False, **handle.read_options())
+    return df, {
+        "method": "block",
+        "sample_rows": int(len(df)),
+        "estimated_total_rows": max(estimated_rows, len(df)),
+        "row_count_exact": False,
+    }
+
+
+def reservoir_sample(path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                     chunksize: int = 100_000, seed: int = 0) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Uniform row sample in a single pass over the file (Algorithm R over chunks).
+
+    Memory is bounded by ``sample_rows`` plus one chunk, and the total row count
+    is exact because every row is seen.
+    """
+    read_options = get_dataset_handle(path).read_options()
+    rng = np.random.default_rng(seed)
+    reservoir: Optional[pd.DataFrame] = None
+    seen = 0
+    for chunk in pd.read_csv(csv_input(path), chunksize=chunksize, low_memory=False, **read_options):
+        chunk = chunk.reset_index(drop=True)
+        if reservoir is None:
+            reservoir = chunk.iloc[:0]
+        free = sample_rows - len(reservoir)
+        if free > 0:
+            reservoir = pd.concat([reservoir, chunk.iloc[:free]], ignore_index=True)
+            seen += min(free, len(chunk))
+            chunk = chunk.iloc[free:].reset_index(drop=True)
+        if len(chunk):
+            slots = rng.integers(0, seen + np.arange(len(chunk)) + 1)
+            keep = np.flatnonzero(slots < sample_rows)
+            if len(keep):
+                # Last write to a slot wins, as in the serial algorithm
+                slots_kept, last = np.unique(slots[keep][::-1], return_index=True)
+                rows = keep[::-1][last]
+                replacement = chunk.iloc[rows].reset_index(drop=True)
+                reservoir = pd.concat([reservoir.drop(index=slots_kept), replacement], ignore_index=True)
+            seen += len(chunk)
+
+    if reservoir is None:
+        reservoir = pd.read_csv(csv_input(path), nrows=0, **read_options)
+    return reservoir, {
+        "method": "reservoir",
+        "sample_rows": int(len(reservoir)),
+        "estimated_total_rows": seen,
+        "row_count_exact": True,
+    }
+
+
+def _interval(low: float, high: float) -> List[float]:
+    return [float(low), float(high)]
+
+
+def sampling_error_bounds(sample: pd.DataFrame, numeric_cols: List[str],
+                          total_rows: int) -> Dict[str, Any]:
+    """
+    Confidence intervals for the statistics computed on a row sample.
+
+    * mean: normal interval with the finite-population correction
+    * std: normal approximation of the chi distribution
+    * median / q1 / q3: distribution-free order-statistic interval
+    * min / max: the sample extremes only bound the true ones from one side
+    * missing percentage: Wald interval of a proportion
+    """
+    n = len(sample)
+    fpc = math.sqrt(max(0.0, (total_rows - n) / (total_rows - 1))) if total_rows > 1 else 0.0
+    numeric_bounds: Dict[str, Dict[str, Any]] = {}
+    for col in numeric_cols:
+        values = np.sort(sample[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        values = values[~np.isnan(values)]
+        m = len(values)
+        if m < 2:
+            continue
+        mean = values.mean()
+        std = values.std(ddof=1)
+        half = Z_SCORE * std / math.sqrt(m) * fpc
+        std_half = Z_SCORE * std / math.sqrt(2 * (m - 1)) * fpc
+        bounds = {
+            "mean": _interval(mean - half, mean + half),
+            "std": _interval(max(0.0, std - std_half), std + std_half),
+            "min": {"upper_bound": float(values[0])},
+            "max": {"lower_bound": float(values[-1])},
+        }
+        for name, q in (("q1", 0.25), ("median", 0.5), ("q3", 0.75)):
+            spread = Z_SCORE * math.sqrt(m * q * (1 - q))
+            low = int(max(0, math.floor(m * q - spread)))
+            high = int(min(m - 1, math.ceil(m * q + spread)))
+            bounds[name] = _interval(values[low], values[high])
+        numeric_bounds[col] = bounds
+
+    missing_bounds = {}
+    for col in sample.columns:
+        p = float(sample[col].isnull().mean()) if n else 0.0
+        half = Z_SCORE * math.sqrt(p * (1 - p) / n) * fpc if n else 0.0
+        missing_bounds[col] = _interval(round(max(0.0, p - half) * 100, 2), round(min(1.0, p + half) * 100, 2))
+
+    return {
+        "confidence_level": CONFIDENCE_LEVEL,
+        "numeric_stats": numeric_bounds,
+        "missing_percentage": missing_bounds,
+    }
+
+
+def sample_csv(path: str, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+               method: str = "block") -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Draw a row sample with the given method (``block`` or ``reservoir``)."""
+    if method == "block":
+        return block_sample(path, sample_rows)
+    if method == "reservoir":
+        return reservoir_sample(path, sample_rows)
+    raise ValueError(f"Unknown sample method '{method}', expected one of {SAMPLE_METHODS}")
@@ -0,0 +1,152 @@
+import os
+from typing import Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow is optional; sidecars are simply disabled without it
+    pa = None
+
+from .profile_cache import DEFAULT_CACHE_DIR, evict_lru, file_fingerprint
+
+# Directory holding the columnar copies of analysed CSV files
+DEFAULT_SIDECAR_DIR = os.getenv("EDA_SIDECAR_DIR", os.path.join(DEFAULT_CACHE_DIR, "sidecars"))
+
+# Disk budget of the sidecar directory; least recently used sidecars are deleted beyond it
+DEFAULT_MAX_SIDECAR_BYTES = int(os.getenv("EDA_SIDECAR_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+
+# Rows per Arrow record batch; also the chunk size when streaming from a sidecar
+SIDECAR_BATCH_ROWS = 100_000
+
+
+def sidecar_available() -> bool:
+    """True when pyarrow is installed and sidecars can be written and read."""
+    return pa is not None
+
+
+def sidecar_path(csv_path: str, sidecar_dir: str = DEFAULT_SIDECAR_DIR) -> str:
+    """Location of the sidecar for the current content of ``csv_path``."""
+    return os.path.join(os.path.abspath(sidecar_dir), f"{file_fingerprint(csv_path)}.arrow")
+
+
+def touch_sidecar(path: str) -> None:
+    """Mark a sidecar as recently used so eviction keeps it."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def evict_sidecars(keep: Optional[str] = None, sidecar_dir: str = DEFAULT_SIDECAR_DIR,
+                   max_bytes: int = DEFAULT_MAX_SIDECAR_BYTES) -> int:
+    """Delete least recently used sidecars until the directory fits ``max_bytes``."""
+    return evict_lru(os.path.abspath(sidecar_dir), max_bytes, ('.arrow',), keep=keep)
+
+
+def write_sidecar(df: pd.DataFrame, path: str) -> Optional[str]:
+    """
+    Write ``df`` as an uncompressed Arrow IPC (Feather v2) file.
+
+    Uncompressed record batches can be memory-mapped and read without copying
+    or re-tokenizing. Returns None when pyarrow is missing or the frame cannot
+    be represented in Arrow (e.g. object columns mixing ints and strings).
+    Older sidecars are evicted afterwards to keep the directory within
+    ``DEFAULT_MAX_SIDECAR_BYTES``.
+    """
+    if pa is None:
+        return None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, tmp_path, compression='uncompressed',
+                              chunksize=SIDECAR_BATCH_ROWS)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    evict_sidecars(keep=path, sidecar_dir=os.path.dirname(path))
+    return path
+
+
+def _widens(source, target) -> bool:
+    """True if ``source`` values can be stored as ``target`` the way pandas would merge them."""
+    return (source == target
+            or pa.types.is_null(source)
+            or (pa.types.is_integer(source) and pa.types.is_floating(target)))
+
+
+def write_sidecar_chunks(chunks: Iterable[pd.DataFrame], path: str) -> Optional[str]:
+    """
+    Write a CSV parsed in chunks as a sidecar, one record batch per chunk.
+
+    Only one chunk is in memory at a time. The schema comes from the first
+    chunk; later chunks may only widen into it (integers into a float column,
+    all-missing columns into any type). Returns None when a chunk does not
+    fit the schema, e.g. an integer column that turns fractional or textual
+    later in the file, or when nothing was parsed. The caller then falls back
+    to ``write_sidecar`` on the fully parsed frame, whose dtypes pandas
+    infers over the whole file.
+    """
+    if pa is None:
+        return None
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    writer = None
+    try:
+        for chunk in chunks:
+            try:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                return None
+            if writer is None:
+                schema = table.schema
+                writer = ipc.new_file(tmp_path, schema)
+            elif table.schema != schema:
+                if table.schema.names != schema.names or not all(
+                        _widens(field.type, target.type) for field, target in zip(table.schema, schema)):
+                    return None
+                table = table.cast(schema)
+            writer.write_table(table, max_chunksize=SIDECAR_BATCH_ROWS)
+        if writer is None:
+            return None
+        writer.close()
+        writer = None
+        os.replace(tmp_path, path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    evict_sidecars(keep=path, sidecar_dir=os.path.dirname(path))
+    return path
+
+
+def read_sidecar(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Memory-map a sidecar and return (a subset of) its columns as a DataFrame."""
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas(split_blocks=True)
+
+
+def sidecar_columns(path: str) -> List[str]:
+    """Column names stored in a sidecar, read from its schema without loading data."""
+    with pa.memory_map(path, 'r') as source:
+        return ipc.open_file(source).schema.names
+
+
+def iter_sidecar_chunks(path: str, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """Yield the sidecar one record batch at a time, so memory stays bounded by the batch size."""
+    with pa.memory_map(path, 'r') as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            yield batch.to_pandas(split_blocks=True)
@@ -0,0 +1,125 @@
+import math
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+
+# Default normalized rank error for quantile sketches (1% of the column length)
+DEFAULT_QUANTILE_ERROR = 0.01
+
+# Ratio between the capacities of consecutive KLL levels
+_CAPACITY_DECAY = 2.0 / 3.0
+_MIN_LEVEL_CAPACITY = 2
+
+
+def _k_for_error(error: float) -> int:
+    """Pick the KLL ``k`` parameter that gives roughly ``error`` normalized rank error."""
+    if not 0 < error < 1:
+        raise ValueError(f"Quantile error must be between 0 and 1, got {error}")
+    return max(8, int(math.ceil(2.7 / error)))
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch for a stream of floats.
+
+    Values are kept in a stack of compactors; level ``h`` holds items of weight
+    ``2**h``. When a level exceeds its capacity it is sorted and every other
+    item (random offset) is promoted to the next level. Memory stays around
+    ``3 * k`` values regardless of how many are added, sketches built on
+    different chunks or workers can be merged, and the state round-trips
+    through ``to_dict`` / ``from_dict`` so it can be stored in a profile.
+    """
+
+    def __init__(self, error: float = DEFAULT_QUANTILE_ERROR, k: Optional[int] = None,
+                 seed: int = 0):
+        self.k = k or _k_for_error(error)
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(_MIN_LEVEL_CAPACITY, int(math.ceil(self.k * _CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep one item back when the count is odd so weights stay exact
+                leftover = items[:len(items) % 2]
+                paired = items[len(items) % 2:]
+                offset = int(self._rng.integers(0, 2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], paired[offset::2]])
+                self.levels[level] = leftover
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a 1-D array of non-null floats to the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """Merge another sketch into this one, level by level."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile.
+
+        While nothing has been compacted the sketch still holds every value, and
+        the result matches ``Series.quantile`` (linear interpolation) exactly.
+        """
+        if self.count == 0:
+            return float('nan')
+        if len(self.levels) == 1:
+            return float(np.quantile(self.levels[0], q))
+
+        items, weights = self.weighted_values()
+        order = np.argsort(items, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        idx = int(np.searchsorted(cumulative, q * (cumulative[-1] - 1), side='right'))
+        return float(items[order][min(idx, len(items) - 1)])
+
+    def weighted_values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retained items and the number of input values each one stands for."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        return items, weights
+
+    @property
+    def is_exact(self) -> bool:
+        """True while nothing has been compacted and every value is still held."""
+        return len(self.levels) == 1
+
+    @property
+    def num_retained(self) -> int:
+        return sum(len(level) for level in self.levels)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the sketch into JSON-friendly primitives."""
+        return {
+            "type": "kll",
+            "k": self.k,
+            "count": int(self.count),
+            "levels": [level.tolist() for level in self.levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        """Rebuild a sketch serialized with ``to_dict``."""
+        sketch = cls(k=data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]] or [np.empty(0)]
+        return sketch
@@ -0,0 +1,184 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+# In-memory CSVs are addressed as ``buffer://<digest>/<name>`` so they can travel
+# anywhere a path can: through the crew's task inputs, cache keys and job tables
+BUFFER_PREFIX = "buffer://"
+
+# In-memory CSVs kept registered; the least recently used one is dropped first.
+# Pinned buffers (inputs of queued or running jobs) are never dropped and do
+# not count towards the limit
+MAX_BUFFERS = 4
+
+# Bytes per read of the buffered reader over an in-memory CSV
+READ_BUFFER_SIZE = 1024 * 1024
+
+CsvSource = Union[str, os.PathLike, bytes, bytearray, memoryview, Any]
+
+
+class _MemoryReader(io.RawIOBase):
+    """Seekable binary stream over a memoryview; reads slice it instead of copying it whole."""
+
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        count = min(len(b), len(self._view) - self._pos)
+        if count <= 0:
+            return 0
+        b[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class MemoryCSV:
+    """A CSV held in memory, viewed without copying the bytes it was given."""
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview], name: str = "upload.csv"):
+        view = memoryview(data)
+        self.view = view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+        self.name = os.path.basename(name) or "upload.csv"
+        self.size = len(self.view)
+        self.digest = hashlib.sha256(self.view).hexdigest()
+
+    @property
+    def path(self) -> str:
+        return f"{BUFFER_PREFIX}{self.digest[:16]}/{self.name}"
+
+    def open(self) -> io.BufferedReader:
+        return io.BufferedReader(_MemoryReader(self.view), buffer_size=READ_BUFFER_SIZE)
+
+
+_buffers: "OrderedDict[str, MemoryCSV]" = OrderedDict()
+_pins: Dict[str, int] = {}
+_buffers_lock = threading.Lock()
+
+
+def _evict_buffers() -> None:
+    """Drop least recently used unpinned buffers beyond ``MAX_BUFFERS``; call with the lock held."""
+    unpinned = [path for path in _buffers if path not in _pins]
+    for path in unpinned[:max(0, len(unpinned) - MAX_BUFFERS)]:
+        del _buffers[path]
+
+
+def is_buffer_path(path: Any) -> bool:
+    return isinstance(path, str) and path.startswith(BUFFER_PREFIX)
+
+
+def register_buffer(data: Union[bytes, bytearray, memoryview], name: str = "upload.csv") -> str:
+    """Register an in-memory CSV and return the ``buffer://`` path that refers to it."""
+    buffer = MemoryCSV(data, name)
+    with _buffers_lock:
+        _buffers[buffer.path] = _buffers.get(buffer.path, buffer)
+        _buffers.move_to_end(buffer.path)
+        _evict_buffers()
+    return buffer.path
+
+
+def pin_buffer(path: str) -> None:
+    """
+    Keep a registered in-memory CSV until ``unpin_buffer`` is called as often.
+
+    Raises:
+        FileNotFoundError: If the buffer is not registered (any more).
+    """
+    with _buffers_lock:
+        if path not in _buffers:
+            raise FileNotFoundError(f"File not found: {path}")
+        _pins[path] = _pins.get(path, 0) + 1
+
+
+def unpin_buffer(path: str) -> None:
+    """Undo one ``pin_buffer``; the buffer becomes evictable again after the last one."""
+    with _buffers_lock:
+        count = _pins.get(path, 0) - 1
+        if count > 0:
+            _pins[path] = count
+        else:
+            _pins.pop(path, None)
+            _evict_buffers()
+
+
+def get_buffer(path: str) -> MemoryCSV:
+    """
+    Look up a registered in-memory CSV.
+
+    Raises:
+        FileNotFoundError: If the buffer was never registered or has been released.
+    """
+    with _buffers_lock:
+        buffer = _buffers.get(path)
+    if buffer is None:
+        raise FileNotFoundError(f"File not found: {path}")
+    return buffer
+
+
+def release_buffer(path: str) -> None:
+    """Forget an in-memory CSV so its bytes can be reclaimed."""
+    with _buffers_lock:
+        _buffers.pop(path, None)
+        _pins.pop(path, None)
+
+
+def as_csv_path(source: CsvSource, name: Optional[str] = None) -> str:
+    """
+    Turn a path, bytes-like object or binary file object into a path the tools accept.
+
+    Bytes, bytearrays and memoryviews are registered as they are. ``BytesIO``
+    objects (including Streamlit uploads) hand over their contents through
+    ``getvalue()``, which returns the stored bytes without copying them as long
+    as the stream has not been written to. Other file objects are read once.
+
+    Returns:
+        str: The path itself, or the ``buffer://`` path of the registered data.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return register_buffer(source, name or "upload.csv")
+    name = name or os.path.basename(str(getattr(source, 'name', '') or "upload.csv"))
+    if hasattr(source, 'getvalue'):
+        return register_buffer(source.getvalue(), name)
+    if hasattr(source, 'read'):
+        return register_buffer(source.read(), name)
+    raise TypeError(f"Unsupported CSV source: {type(source).__name__}")
+
+
+def source_exists(path: str) -> bool:
+    if is_buffer_path(path):
+        with _buffers_lock:
+            return path in _buffers
+    return os.path.exists(path)
+
+
+def source_size(path: str) -> int:
+    return get_buffer(path).size if is_buffer_path(path) else os.path.getsize(path)
+
+
+def open_binary(path: str):
+    """Open a file path or registered buffer for binary reading."""
+    return get_buffer(path).open() if is_buffer_path(path) else open(path, 'rb')
+
+
+def csv_input(path: str):
+    """What to hand to ``pd.read_csv``: the path itself, or a fresh reader over the buffer."""
+    return get_buffer(path).open() if is_buffer_path(path) else path
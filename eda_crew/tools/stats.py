@@ -0,0 +1,115 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Tuple
+from pandas.api.types import is_numeric_dtype, is_complex_dtype
+
+from .sketches import KLLSketch, DEFAULT_QUANTILE_ERROR
+
+# Bytes of float64 values converted into one 2-D block at a time; the sort
+# makes a second block of the same size, so peak use is about twice this
+STATS_BLOCK_BYTES = 64 * 1024 * 1024
+
+# Values fed into a quantile sketch per update
+SKETCH_SLICE_ROWS = 100_000
+
+QUANTILES = {"median": 0.5, "q1": 0.25, "q3": 0.75}
+
+
+def is_numeric_like(dtype) -> bool:
+    """True for every dtype profiled as numeric: ints, floats, nullable Int/Float and bools."""
+    return is_numeric_dtype(dtype) and not is_complex_dtype(dtype)
+
+
+def numeric_columns(df: pd.DataFrame) -> List[str]:
+    """Names of the numeric-like columns of ``df``, in column order."""
+    return [col for col, dtype in df.dtypes.items() if is_numeric_like(dtype)]
+
+
+def _lerp(low: np.ndarray, high: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Linear interpolation with the same rounding as NumPy's (and pandas') quantiles."""
+    diff = high - low
+    return np.where(weight >= 0.5, high - diff * (1 - weight), low + diff * weight)
+
+
+def _sorted_quantiles(sorted_block: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """Per-column linear quantile of a column-wise sorted block with NaNs sorted last."""
+    position = q * np.maximum(counts - 1, 0)
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, np.maximum(counts - 1, 0))
+    cols = np.arange(sorted_block.shape[1])
+    values = _lerp(sorted_block[low, cols], sorted_block[high, cols], position - low)
+    return np.where(counts > 0, values, np.nan)
+
+
+def block_width(num_rows: int, block_bytes: int = STATS_BLOCK_BYTES) -> int:
+    """Columns of ``num_rows`` float64 values that fit in ``block_bytes``, at least one."""
+    return max(1, block_bytes // (8 * max(1, num_rows)))
+
+
+def numeric_statistics(df: pd.DataFrame, columns: List[str], quantile_sketch: bool = False,
+                        quantile_error: float = DEFAULT_QUANTILE_ERROR
+                        ) -> Tuple[Dict[str, Dict[str, float]], Dict[str, KLLSketch]]:
+    """
+    Compute moments, extrema and quartiles for ``columns`` with a few array ops per block.
+
+    Columns are converted into 2-D float blocks of about ``STATS_BLOCK_BYTES``
+    (at least one column each; nullable masks become NaN), sorted once
+    column-wise, and every statistic is read off that block for all of its
+    columns together.
+    """
+    statistics: Dict[str, Dict[str, float]] = {}
+    sketches: Dict[str, KLLSketch] = {}
+    block_columns = block_width(len(df))
+    for start in range(0, len(columns), block_columns):
+        block_cols = columns[start:start + block_columns]
+        block = df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        counts = (~np.isnan(block)).sum(axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(block, axis=0)
+            std = np.where(counts > 1, np.nanstd(block, axis=0, ddof=1), np.nan)
+
+        if quantile_sketch:
+            # One pass per column into a fixed-size sketch instead of sorting the block
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                minimum = np.nanmin(block, axis=0)
+                maximum = np.nanmax(block, axis=0)
+            for idx, col in enumerate(block_cols):
+                sketches[col] = _sketch_values(block[:, idx], quantile_error)
+            quantiles = {
+                name: np.array([sketches[col].quantile(q) for col in block_cols])
+                for name, q in QUANTILES.items()
+            }
+        elif len(block):
+            sorted_block = np.sort(block, axis=0)
+            cols = np.arange(len(block_cols))
+            minimum = np.where(counts > 0, sorted_block[0, cols], np.nan)
+            maximum = np.where(counts > 0, sorted_block[np.maximum(counts - 1, 0), cols], np.nan)
+            quantiles = {name: _sorted_quantiles(sorted_block, counts, q) for name, q in QUANTILES.items()}
+        else:
+            minimum = maximum = np.full(len(block_cols), np.nan)
+            quantiles = {name: minimum for name in QUANTILES}
+
+        for idx, col in enumerate(block_cols):
+            statistics[col] = {
+                "mean": float(mean[idx]),
+                "median": float(quantiles["median"][idx]),
+                "std": float(std[idx]),
+                "min": float(minimum[idx]),
+                "max": float(maximum[idx]),
+                "q1": float(quantiles["q1"][idx]),
+                "q3": float(quantiles["q3"][idx])
+            }
+    return statistics, sketches
+
+
+def _sketch_values(values: np.ndarray, quantile_error: float,
+                   chunksize: int = SKETCH_SLICE_ROWS) -> KLLSketch:
+    """Build a quantile sketch from a column's values, feeding it in bounded slices."""
+    sketch = KLLSketch(quantile_error)
+    for start in range(0, len(values), chunksize):
+        part = values[start:start + chunksize]
+        sketch.update(part[~np.isnan(part)])
+    return sketch
@@ -1,17 +1,8 @@
 import streamlit as st
-from crewai import Agent, Task, Crew, Process
 from dotenv import load_dotenv
-import os
-import yaml
 from datetime import datetime, timedelta
-import string
-import time
 
-
-
-# Import custom tools
-from tools.report_generator import ReportGeneratorTool
-from tools.search_tools import create_exa_tool, create_scrape_tool
+from crew_factory import get_crew_factory
 
 # Set page configuration
 st.set_page_config(
@@ -23,85 +14,30 @@ st.set_page_config(
 # Load environment variables
 load_dotenv()
 
-def load_yaml_with_env(file_path):
-    """Load YAML file and replace environment variables"""
-    with open(file_path, 'r') as file:
-        content = file.read()
-    
-    # Create template with replacements
-    template = string.Template(content)
-    
-    # Calculate date 30 days ago
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    
-    # Create replacements dictionary
-    replacements = {
-        'EXA_API_KEY': os.getenv('EXA_API_KEY'),
-        'THIRTY_DAYS_AGO': thirty_days_ago
-    }
-    
-    # Apply replacements and load as YAML
-    processed_content = template.substitute(replacements)
-    return yaml.safe_load(processed_content)
-
 def initialize_crew():
-    """Initialize the crew with agents and tools"""
-    # Load configurations
-    config = load_yaml_with_env('config.yaml')
-    agents_config = load_yaml_with_env('agents.yaml')
-    tasks_config = load_yaml_with_env('tasks.yaml')
-    
-    # Create tools
-    tools = {
-        'exa_search_tool': create_exa_tool(
-            api_key=config['exa']['api_key'],
-            content=config['exa']['content'],
-            summary=config['exa']['summary'],
-            type=config['exa']['type']
-        ),
-        'scrape_website_tool': create_scrape_tool(),
-        'report_generator_tool': ReportGeneratorTool()
-    }
-    
-    # Create agents
-    agents = {}
-    for agent_id, agent_config in agents_config.items():
-        # Get agent's tools
-        agent_tools = [tools[tool_id] for tool_id in agent_config.get('tools', [])]
-        
-        # Create agent
-        agents[agent_id] = Agent(
-            role=agent_config['role'],
-            goal=agent_config['goal'],
-            backstory=agent_config['backstory'],
-            tools=agent_tools,
-            verbose=agent_config.get('verbose', True),
-            allow_delegation=agent_config.get('allow_delegation', False)
+    """
+    A crew for one research run, and the content packer trimming its sources (None if packing is off).
+    Configs, tools and agents are built once per process and reused.
+    """
+    factory = get_crew_factory()
+    packer = factory.create_packer()
+    return factory.create_crew(packer=packer), packer
+
+def show_cache_stats():
+    """Hit counters of the search and scrape caches, shared by every session of this app process"""
+    cache_stats = get_crew_factory().cache_stats()
+    if 'search' in cache_stats:
+        search = cache_stats['search']
+        st.sidebar.caption(
+            f"Search cache: {search['hits']:,} hits, {search['misses']:,} misses "
+            f"({search['hit_rate']:.0%} hit rate)"
         )
-    
-    # Create tasks
-    tasks = []
-    for task_id, task_config in tasks_config.items():
-        # Get agent for this task
-        agent = agents[task_config['agent']]
-        
-        # Create task
-        task = Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=agent
+    if 'scrape' in cache_stats:
+        scrape = cache_stats['scrape']
+        st.sidebar.caption(
+            f"Scrape cache: {scrape['fresh']:,} fresh, {scrape['revalidated']:,} revalidated, "
+            f"{scrape['fetched']:,} fetched ({scrape['hit_rate']:.0%} hit rate)"
         )
-        tasks.append(task)
-    
-    # Create crew
-    crew = Crew(
-        agents=list(agents.values()),
-        tasks=tasks,
-        verbose=config['crew']['verbose'],
-        process=getattr(Process, config['crew']['process'])
-    )
-    
-    return crew
 
 # Title and description
 st.title("📰🔍 News Research Helper")
@@ -152,6 +88,8 @@ if 'report' not in st.session_state:
     st.session_state.report = None
 if 'search_in_progress' not in st.session_state:
     st.session_state.search_in_progress = False
+if 'packing_stats' not in st.session_state:
+    st.session_state.packing_stats = None
 
 # Handle search action
 if search_button and search_topic and not st.session_state.search_in_progress:
@@ -165,15 +103,13 @@ if search_button and search_topic and not st.session_state.search_in_progress:
         # Update status
         status_text.text("Initializing research crew...")
         progress_bar.progress(10)
-        time.sleep(0.5)
         
         # Initialize the crew
-        crew = initialize_crew()
+        crew, packer = initialize_crew()
         
         # Update status
         status_text.text("Searching for latest information...")
         progress_bar.progress(30)
-        time.sleep(0.5)
         
         # Use fixed 30-day date range (removed user selection)
         custom_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
@@ -189,7 +125,6 @@ if search_button and search_topic and not st.session_state.search_in_progress:
         # Update progress
         progress_bar.progress(100)
         status_text.text("Report ready!")
-        time.sleep(0.5)
         
         # Store the result in session state - convert CrewOutput to string
         if hasattr(result, 'raw_output'):
@@ -197,6 +132,8 @@ if search_button and search_topic and not st.session_state.search_in_progress:
         else:
             st.session_state.report = str(result)
         
+        st.session_state.packing_stats = packer.stats if packer is not None else None
+
         # Clear progress indicators
         status_text.empty()
         progress_bar.empty()
@@ -206,6 +143,9 @@ if search_button and search_topic and not st.session_state.search_in_progress:
     finally:
         st.session_state.search_in_progress = False
 
+# Show how often searches and page scrapes were answered from the caches
+show_cache_stats()
+
 # Display results if available
 # Display results if available
 if st.session_state.report:
@@ -223,6 +163,15 @@ if st.session_state.report:
     else:  # Plain Text
         st.code(report_content, language=None)
     
+    # Show how much the source packing trimmed from the report agent's context
+    stats = st.session_state.packing_stats
+    if stats:
+        st.caption(
+            f"Sources packed from ~{stats['tokens_in']:,} to ~{stats['tokens_out']:,} tokens "
+            f"(~{stats['tokens_saved']:,} saved): {stats['boilerplate_removed']} boilerplate and "
+            f"{stats['duplicates_removed']} duplicate passages removed"
+        )
+    
     # Add download button
     st.download_button(
         label="Download Report",
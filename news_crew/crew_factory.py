@@ -0,0 +1,202 @@
+# Builds the research crew once per process and hands out cheap copies of it
+import os
+import string
+import threading
+from datetime import datetime, timedelta
+
+import yaml
+from crewai import Agent, Task, Crew, Process
+
+# Import custom tools
+from tools.content_packing import ContentPacker
+from tools.report_generator import ReportGeneratorTool
+from tools.search_tools import create_batch_scrape_tool, create_exa_tool, create_scrape_tool
+
+CONFIG_FILES = ('config.yaml', 'agents.yaml', 'tasks.yaml')
+
+
+def thirty_days_ago():
+    return (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+
+
+def load_yaml_with_env(file_path):
+    """Load YAML file and replace environment variables"""
+    with open(file_path, 'r') as file:
+        content = file.read()
+
+    # Create template with replacements
+    template = string.Template(content)
+
+    # Create replacements dictionary
+    replacements = {
+        'EXA_API_KEY': os.getenv('EXA_API_KEY'),
+        'THIRTY_DAYS_AGO': thirty_days_ago()
+    }
+
+    # Apply replacements and load as YAML
+    processed_content = template.substitute(replacements)
+    return yaml.safe_load(processed_content)
+
+
+def create_tools(config):
+    """Create the tools the agents can be given, by the IDs used in agents.yaml"""
+    return {
+        'exa_search_tool': create_exa_tool(
+            api_key=config['exa']['api_key'],
+            content=config['exa']['content'],
+            summary=config['exa']['summary'],
+            type=config['exa']['type'],
+            cache=config['exa'].get('cache', True),
+            cache_ttl=config['exa'].get('cache_ttl', 3600),
+            cache_max_entries=config['exa'].get('cache_max_entries', 1000)
+        ),
+        'scrape_website_tool': create_scrape_tool(),
+        'batch_scrape_tool': create_batch_scrape_tool(**config.get('scrape', {})),
+        'report_generator_tool': ReportGeneratorTool()
+    }
+
+
+def build_crew(config, agents_config, tasks_config, tools):
+    """Create the agents and tasks described by the configs, and the crew running them"""
+    # Create agents
+    agents = {}
+    for agent_id, agent_config in agents_config.items():
+        # Get agent's tools
+        agent_tools = [tools[tool_id] for tool_id in agent_config.get('tools', [])]
+
+        # Create agent
+        agents[agent_id] = Agent(
+            role=agent_config['role'],
+            goal=agent_config['goal'],
+            backstory=agent_config['backstory'],
+            tools=agent_tools,
+            verbose=agent_config.get('verbose', True),
+            allow_delegation=agent_config.get('allow_delegation', False)
+        )
+
+    # Create tasks
+    tasks = []
+    for task_id, task_config in tasks_config.items():
+        # Get agent for this task
+        agent = agents[task_config['agent']]
+
+        # Create task
+        task = Task(
+            description=task_config['description'],
+            expected_output=task_config['expected_output'],
+            agent=agent
+        )
+        tasks.append(task)
+
+    # Create crew
+    return Crew(
+        agents=list(agents.values()),
+        tasks=tasks,
+        verbose=config['crew']['verbose'],
+        process=getattr(Process, config['crew']['process'])
+    )
+
+
+class CrewFactory:
+    """
+    Process-wide cache of the configs, tools and a template crew.
+
+    The YAML files are read and the tools (EXA client, caches) created once.
+    ``create_crew`` hands out a copy of the template crew: the agents and tasks
+    are fresh, so concurrent runs do not share state, while the tools are
+    shared. Everything is rebuilt when a YAML file changes on disk, when the
+    EXA API key changes or when the date moves on, since ``THIRTY_DAYS_AGO``
+    is substituted into the configs.
+    """
+
+    def __init__(self, config_dir='.'):
+        self.config_dir = os.path.abspath(config_dir)
+        self.builds = 0
+        self._lock = threading.Lock()
+        self._signature = None
+        self._template = None
+        self._packed_tasks = []
+        self._tools = {}
+        self.config = None
+
+    def _current_signature(self):
+        mtimes = tuple(os.stat(os.path.join(self.config_dir, name)).st_mtime_ns for name in CONFIG_FILES)
+        return mtimes, thirty_days_ago(), os.getenv('EXA_API_KEY')
+
+    def _build(self):
+        config, agents_config, tasks_config = (
+            load_yaml_with_env(os.path.join(self.config_dir, name)) for name in CONFIG_FILES
+        )
+        tools = create_tools(config)
+        self._tools = tools
+        self._template = build_crew(config, agents_config, tasks_config, tools)
+        # Tasks whose output is packed before the next task sees it
+        self._packed_tasks = [index for index, task_config in enumerate(tasks_config.values())
+                              if task_config.get('pack_output')]
+        self.config = config
+        self.builds += 1
+
+    def _refresh(self):
+        with self._lock:
+            signature = self._current_signature()
+            if signature != self._signature:
+                self._build()
+                self._signature = signature
+            return self._template, self._packed_tasks, self.config
+
+    def create_packer(self):
+        """A content packer set up from the packing section of config.yaml, or None if packing is off"""
+        _, _, config = self._refresh()
+        packing = dict(config.get('packing') or {})
+        if not packing.pop('enabled', True):
+            return None
+        return ContentPacker(**packing)
+
+    def cache_stats(self):
+        """
+        ``stats()`` of the search and scrape caches behind the current tools, by cache.
+
+        The counters cover every run since the tools were last built; a cache
+        that is turned off in config.yaml is left out.
+        """
+        with self._lock:
+            tools = dict(self._tools)
+        stats = {}
+        search_cache = getattr(tools.get('exa_search_tool'), 'search_cache', None)
+        if search_cache is not None:
+            stats['search'] = search_cache.stats()
+        scrape_cache = getattr(tools.get('batch_scrape_tool'), 'scrape_cache', None)
+        if scrape_cache is not None:
+            stats['scrape'] = scrape_cache.stats()
+        return stats
+
+    def create_crew(self, packer=None):
+        """
+        A crew ready for one kickoff, rebuilding the template first if it is out of date.
+
+        With a ``packer``, the output of every task marked ``pack_output`` in
+        tasks.yaml is packed into the packer's token budget, ranked against the
+        ``question`` input, before the next task gets it; ``packer.stats`` then
+        reports what the run saved.
+        """
+        template, packed_tasks, _ = self._refresh()
+        crew = template.copy()
+        if packer is not None:
+            for index in packed_tasks:
+                crew.tasks[index].guardrail = packer.guardrail
+                crew.tasks[index].ensure_guardrail_is_callable()
+            crew.before_kickoff_callbacks.append(packer.capture_inputs)
+        return crew
+
+
+_factories = {}
+_factories_lock = threading.Lock()
+
+
+def get_crew_factory(config_dir='.'):
+    """The crew factory of ``config_dir``, shared by every caller in the process"""
+    config_dir = os.path.abspath(config_dir)
+    with _factories_lock:
+        if config_dir not in _factories:
+            _factories[config_dir] = CrewFactory(config_dir)
+        return _factories[config_dir]
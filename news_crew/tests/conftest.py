@@ -0,0 +1,5 @@
+# The news crew imports its modules relative to the project directory (``from tools...``)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import pytest
+
+from tools.content_packing import ContentPacker, estimate_tokens, split_sources
+
+WIRE_STORY = ("The harbour authority approved the new flood barrier on Tuesday after a two year review, "
+              "citing rising sea levels and repeated storm damage along the eastern quay.")
+
+
+def page(url, *lines):
+    return "\n".join([f"URL: {url}", "Content:", *lines])
+
+
+@pytest.mark.parametrize("line", [
+    "URL: https://example.com/a",
+    "**Source:** https://example.com/a",
+    "**URL**: https://example.com/a",
+    "- Source: <https://example.com/a>",
+    "1. **Link:** https://example.com/a",
+    "https://example.com/a",
+])
+def test_source_lines_start_a_source(line):
+    assert split_sources(f"{line}\nSome text about the story.") == [
+        ("https://example.com/a", ["Some text about the story."])]
+
+
+def test_text_within_the_budget_keeps_its_boilerplate():
+    text = page("https://example.com/a", "Subscribe to our newsletter", "Home", WIRE_STORY)
+    packer = ContentPacker(token_budget=1000)
+
+    packed = packer.pack(text, "flood barrier")
+
+    assert "Subscribe to our newsletter" in packed and "Home" in packed
+    assert packer.stats["boilerplate_removed"] == 0
+
+
+def test_boilerplate_is_stripped_from_page_text_over_the_budget():
+    text = page("https://example.com/a", "Subscribe to our newsletter", "Home", "Accept all cookies", WIRE_STORY)
+    packer = ContentPacker(token_budget=estimate_tokens(text) - 1)
+
+    packed = packer.pack(text, "flood barrier")
+
+    assert WIRE_STORY in packed
+    assert "Subscribe" not in packed and "Home" not in packed and "cookies" not in packed
+    assert packer.stats["boilerplate_removed"] == 3
+
+
+def test_lines_with_query_terms_are_never_stripped():
+    on_topic = "EU cookie rules tighten"
+    text = page("https://example.com/a", on_topic, "Accept all cookies", "Cookie consent outlook", WIRE_STORY)
+    packer = ContentPacker(token_budget=estimate_tokens(text) - 1)
+
+    packed = packer.pack(text, "cookie rules (since 2026-09-18)")
+
+    assert on_topic in packed
+    # One query term is enough, whatever the rest of the line says
+    assert "Cookie consent outlook" in packed
+    assert "Accept all cookies" not in packed
+    assert packer.stats["boilerplate_removed"] == 1
+
+
+def test_agent_text_is_never_treated_as_boilerplate():
+    agent_text = "\n".join(["## Key findings", "Read more below", "- Barrier approved", "**Status:** open"])
+    text = agent_text + "\n" + page("https://example.com/a", "Sign in", WIRE_STORY)
+    packer = ContentPacker(token_budget=estimate_tokens(text) - 1)
+
+    packed = packer.pack(text, "harbour")
+
+    for line in agent_text.splitlines():
+        assert line in packed
+    assert "Sign in" not in packed
+
+
+def test_lines_repeated_across_sources_are_stripped():
+    text = "\n\n---\n\n".join(
+        page(f"https://example.com/{name}", "Top stories today", f"Story {name} covers a different event entirely.")
+        for name in "abc")
+    packer = ContentPacker(token_budget=estimate_tokens(text) - 1)
+
+    packed = packer.pack(text, "harbour")
+
+    assert "Top stories today" not in packed
+    assert packer.stats["boilerplate_removed"] == 3
+
+
+def test_near_duplicates_are_collapsed_and_attributed():
+    text = "\n\n---\n\n".join([
+        page("https://example.com/a", WIRE_STORY),
+        page("https://example.org/b", WIRE_STORY + " Reuters reported."),
+    ])
+    packer = ContentPacker(token_budget=1000)
+
+    packed = packer.pack(text, "flood barrier")
+
+    assert packed.count("flood barrier") == 1
+    assert "URL: https://example.com/a (also reported by: https://example.org/b)" in packed
+    assert packer.stats["duplicates_removed"] == 1
+
+
+def test_passages_are_kept_by_relevance_within_the_budget():
+    relevant = "The flood barrier will close during storm surges, the harbour authority said."
+    filler = [f"Unrelated paragraph number {index} about the local football season results." for index in range(20)]
+    text = page("https://example.com/a", *filler[:10], relevant, *filler[10:])
+    packer = ContentPacker(token_budget=60)
+
+    packed = packer.pack(text, "flood barrier")
+
+    assert relevant in packed
+    assert packer.stats["tokens_out"] <= 60 + estimate_tokens("URL: https://example.com/a\n")
+    assert packer.stats["passages_kept"] < packer.stats["passages"]
+
+
+def test_guardrail_packs_the_output_and_never_empties_it():
+    packer = ContentPacker(token_budget=1000)
+    packer.capture_inputs({"question": "flood barrier"})
+
+    ok, packed = packer.guardrail(SimpleNamespace(raw=page("https://example.com/a", WIRE_STORY)))
+    assert ok and WIRE_STORY in packed
+
+    ok, packed = packer.guardrail(SimpleNamespace(raw="---"))
+    assert ok and packed == "---"
@@ -0,0 +1,130 @@
+import asyncio
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools.scrape_cache import ScrapeCache
+from tools.scrape_tools import BatchScrapeTool, scrape_urls
+
+ARTICLE = "<html><body><nav>Home</nav><p>Wire story about the harbour.</p></body></html>"
+
+
+class LocalSite:
+    """Pages served by a local HTTP server; each honours If-None-Match against its ETag"""
+
+    def __init__(self):
+        self.pages = {"/a": ARTICLE, "/b": ARTICLE, "/other": "<p>Another story.</p>"}
+        # Paths answering 304 whatever the request, and paths failing with a 500
+        self.not_modified = set()
+        self.failing = set()
+        self.requests = []
+        self.port = None
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.port}{path}"
+
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            site.requests.append((self.path, self.headers.get("If-None-Match")))
+            if self.path in site.failing:
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = site.pages.get(self.path, "").encode()
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if self.path in site.not_modified or self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def site():
+    site = LocalSite()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(site))
+    site.port = server.server_port
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+def scrape(site, paths, cache):
+    return asyncio.run(scrape_urls([site.url(path) for path in paths], cache=cache))
+
+
+def test_fetch_revalidate_and_dedup(site, tmp_path):
+    cache = ScrapeCache(str(tmp_path / "scrape_cache.sqlite3"), fresh_seconds=0)
+
+    first = scrape(site, ["/a", "/b"], cache)
+    assert [result["cache"] for result in first] == ["fetched", "fetched"]
+    assert first[0]["text"] == first[1]["text"] == "Home\nWire story about the harbour."
+    # The syndicated copy is stored once
+    stats = cache.stats()
+    assert (stats["pages"], stats["texts"], stats["deduplicated"]) == (2, 1, 1)
+
+    second = scrape(site, ["/a", "/b"], cache)
+    assert [result["cache"] for result in second] == ["revalidated", "revalidated"]
+    assert [result["text"] for result in second] == [result["text"] for result in first]
+    assert all(etag is not None for _, etag in site.requests[2:])
+
+    site.pages["/a"] = "<p>Updated story.</p>"
+    third = scrape(site, ["/a"], cache)
+    assert third[0]["cache"] == "fetched"
+    assert third[0]["text"] == "Updated story."
+    assert cache.stats()["texts"] == 2
+
+
+def test_fresh_pages_are_not_requested(site, tmp_path):
+    cache = ScrapeCache(str(tmp_path / "scrape_cache.sqlite3"), fresh_seconds=3600)
+    scrape(site, ["/other"], cache)
+    requests = len(site.requests)
+
+    result = scrape(site, ["/other"], cache)
+
+    assert result[0]["cache"] == "fresh"
+    assert result[0]["text"] == "Another story."
+    assert len(site.requests) == requests
+
+
+def test_failed_fetch_falls_back_to_the_cached_copy(site, tmp_path):
+    cache = ScrapeCache(str(tmp_path / "scrape_cache.sqlite3"), fresh_seconds=0)
+    scrape(site, ["/other"], cache)
+    site.failing.add("/other")
+
+    result = scrape(site, ["/other"], cache)
+
+    assert result[0]["cache"] == "stale"
+    assert result[0]["text"] == "Another story."
+    assert "error" not in result[0]
+
+
+def test_not_modified_without_a_cached_copy_is_an_error(site, tmp_path):
+    site.not_modified.add("/a")
+
+    uncached = scrape(site, ["/a"], None)
+    assert "error" in uncached[0] and "text" not in uncached[0]
+
+    cache = ScrapeCache(str(tmp_path / "scrape_cache.sqlite3"))
+    tool = BatchScrapeTool(scrape_cache=cache)
+    output = tool._run([site.url("/a"), site.url("/other")])
+    assert f"URL: {site.url('/a')}\nError: HTTP 304 without a cached copy" in output
+    assert "Another story." in output
+    assert cache.stats()["pages"] == 1
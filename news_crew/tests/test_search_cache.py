@@ -0,0 +1,83 @@
+from typing import Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from tools.search_cache import CachedSearchTool, SearchCache
+
+
+class StandInSearchInput(BaseModel):
+    search_query: str = Field(..., description="The query")
+
+
+class StandInSearchTool(BaseTool):
+    """Local search backend that records every query it receives"""
+
+    name: str = "StandInSearch"
+    description: str = "Search a fixed local index"
+    args_schema: Type[BaseModel] = StandInSearchInput
+    calls: list = []
+
+    def _run(self, search_query: str, **kwargs) -> str:
+        self.calls.append((search_query, kwargs))
+        return f"results for {search_query} ({len(self.calls)})"
+
+
+def make_tool(tmp_path, **cache_options):
+    backend = StandInSearchTool(calls=[])
+    cache = SearchCache(str(tmp_path / "search_cache.sqlite3"), **cache_options)
+    return CachedSearchTool(backend, search_cache=cache, search_settings={"type": "keyword"}), backend, cache
+
+
+def test_repeated_search_is_answered_from_the_cache(tmp_path):
+    tool, backend, cache = make_tool(tmp_path)
+
+    first = tool._run("Climate  Change", start_published_date="2026-01-01")
+    second = tool._run("climate change", start_published_date="2026-01-01")
+
+    assert second == first
+    assert len(backend.calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_different_date_window_misses(tmp_path):
+    tool, backend, cache = make_tool(tmp_path)
+
+    tool._run("climate change", start_published_date="2026-01-01")
+    tool._run("climate change", start_published_date="2026-02-01")
+
+    assert len(backend.calls) == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_expired_entries_are_searched_again(tmp_path):
+    tool, backend, cache = make_tool(tmp_path, ttl_seconds=0)
+
+    tool._run("climate change")
+    tool._run("climate change")
+
+    assert len(backend.calls) == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_is_shared_through_the_file(tmp_path):
+    tool, backend, _ = make_tool(tmp_path)
+    tool._run("climate change")
+
+    other_tool, other_backend, other_cache = make_tool(tmp_path)
+    assert other_tool._run("climate change") == "results for climate change (1)"
+    assert other_backend.calls == []
+    assert other_cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    tool, backend, cache = make_tool(tmp_path, max_entries=2)
+
+    for query in ("first", "second", "third"):
+        tool._run(query)
+    tool._run("first")
+
+    assert [call[0] for call in backend.calls] == ["first", "second", "third", "first"]
+    assert cache.stats()["entries"] == 2
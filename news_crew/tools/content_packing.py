@@ -0,0 +1,254 @@
+# Boilerplate stripping, near-duplicate removal and token-budgeted packing of source text
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Tokens the packed text may take, estimated at CHARS_PER_TOKEN characters per
+# token (close enough for English prose with OpenAI tokenizers)
+DEFAULT_TOKEN_BUDGET = 6000
+CHARS_PER_TOKEN = 4
+
+# Passages whose estimated Jaccard similarity of word shingles reaches the
+# threshold are near duplicates; only the first one is kept
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+SHINGLE_WORDS = 4
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+
+# Lines of page chrome rather than article text
+BOILERPLATE_PATTERN = re.compile(
+    r"\b(cookies?|privacy (policy|settings)|terms (of|and) (use|service|conditions)|subscribe|newsletter|"
+    r"sign (in|up)|log ?in|all rights reserved|advertisement|share (this|on)|follow us|skip to|"
+    r"accept all|read more|related (articles|stories)|click here|javascript)\b",
+    re.IGNORECASE
+)
+# Lines longer than this are kept even if they mention a boilerplate phrase
+BOILERPLATE_MAX_WORDS = 25
+# Lines shorter than this that do not end a sentence are menu entries and the like
+MIN_LINE_WORDS = 4
+# Lines repeated in this many sources are site chrome
+REPEATED_LINE_SOURCES = 3
+# Lines the agent structured itself (headings, list items, bold labels, quotes) are not page text
+MARKDOWN_LINE_PATTERN = re.compile(r"^(#{1,6}\s|[-*+]\s|\d+[.)]\s|>|\*\*[^*]+\*\*)")
+# Query words too common to mark a line as on topic
+QUERY_STOPWORDS = {"the", "and", "for", "with", "from", "about", "since", "what", "whats", "how", "why",
+                   "who", "are", "was", "were", "has", "have", "its", "into", "over", "latest", "news"}
+
+# ``URL: https://...``, ``**Source:** https://...``, ``- **Link**: <https://...>`` or a bare URL line
+SOURCE_PATTERN = re.compile(
+    r"^(?:[-*]\s*|\d+\.\s*)?(?:\*\*)?(?:URL|Source|Link)(?:\*\*)?:(?:\*\*)?\s*<?(https?://[^\s>]+)"
+    r"|^<?(https?://[^\s>]+)>?$",
+    re.IGNORECASE
+)
+SEPARATOR_PATTERN = re.compile(r"^(-{3,}|={3,}|\*{3,})$")
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE_PRIME)
+    for i in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _words(text: str) -> List[str]:
+    return WORD_PATTERN.findall(text.casefold())
+
+
+def query_terms(query: str) -> Set[str]:
+    """Words of the query that mark a line as on topic: no stopwords, numbers or one- and two-letter words"""
+    return {word for word in _words(query) if len(word) > 2 and not word.isdigit() and word not in QUERY_STOPWORDS}
+
+
+def is_boilerplate(line: str) -> bool:
+    """True for navigation, cookie banners, share buttons and similar page chrome"""
+    words = line.split()
+    if len(words) <= BOILERPLATE_MAX_WORDS and BOILERPLATE_PATTERN.search(line):
+        return True
+    # Headings, dates and figures are short but worth keeping
+    if line.startswith("#") or any(character.isdigit() for character in line):
+        return False
+    return len(words) < MIN_LINE_WORDS and not line.rstrip().endswith((".", "!", "?", ":", '"'))
+
+
+def minhash(words: List[str]) -> List[int]:
+    """MinHash signature of the word shingles of a passage"""
+    count = max(1, len(words) - SHINGLE_WORDS + 1)
+    shingles = {
+        int.from_bytes(hashlib.blake2b(" ".join(words[i:i + SHINGLE_WORDS]).encode(), digest_size=8).digest(), "big")
+        for i in range(count)
+    }
+    return [min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles) for a, b in _PERMUTATIONS]
+
+
+def _similarity(left: List[int], right: List[int]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / len(left)
+
+
+def split_sources(text: str) -> List[Tuple[Optional[str], List[str]]]:
+    """
+    Split text into (source URL, passages) pairs.
+
+    A new source starts at a ``URL:`` / ``Source:`` line or a bare URL line;
+    passages are the non-empty lines in between, separators excluded.
+    """
+    sources: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or SEPARATOR_PATTERN.match(line):
+            continue
+        match = SOURCE_PATTERN.match(line)
+        if match:
+            sources.append((match.group(1) or match.group(2), []))
+        elif line.lower().rstrip(":") in ("content", "content (truncated)"):
+            continue
+        else:
+            sources[-1][1].append(line)
+    return [(url, passages) for url, passages in sources if url is not None or passages]
+
+
+class ContentPacker:
+    """
+    Shrinks gathered source text to what fits a token budget.
+
+    ``pack`` drops page boilerplate, collapses near-duplicate passages (the same
+    wire story from several outlets) with MinHash and locality-sensitive hashing,
+    then keeps the passages most relevant to the query until the budget is
+    used, in their original order and grouped by source. ``stats`` holds the
+    counts and token totals of the last call.
+
+    Boilerplate is only stripped when the text does not fit the budget anyway,
+    and only from page text: lines under a source URL that the agent did not
+    format itself. Lines that mention a query term are always kept.
+    """
+
+    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET,
+                 duplicate_threshold: float = DEFAULT_DUPLICATE_THRESHOLD,
+                 strip_boilerplate: bool = True):
+        self.token_budget = token_budget
+        self.duplicate_threshold = duplicate_threshold
+        self.strip_boilerplate = strip_boilerplate
+        self.query = ""
+        self.stats: Dict[str, Any] = {}
+
+    def _deduplicate(self, passages: List[Dict[str, Any]]) -> int:
+        buckets: Dict[Tuple[int, Tuple[int, ...]], List[Dict[str, Any]]] = {}
+        removed = 0
+        for passage in passages:
+            words = _words(passage["text"])
+            if len(words) < SHINGLE_WORDS:
+                continue
+            signature = minhash(words)
+            bands = [(band, tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]))
+                     for band in range(MINHASH_BANDS)]
+            original = next((candidate for key in bands for candidate in buckets.get(key, ())
+                             if _similarity(signature, candidate["signature"]) >= self.duplicate_threshold), None)
+            if original is not None:
+                passage["duplicate"] = True
+                if passage["source"] and passage["source"] != original["source"]:
+                    original["also"].append(passage["source"])
+                removed += 1
+                continue
+            passage["signature"] = signature
+            for key in bands:
+                buckets.setdefault(key, []).append(passage)
+        return removed
+
+    def _rank(self, passages: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        """Passages by BM25-style relevance to the query, earlier passages first on ties"""
+        terms = set(_words(query))
+        if not terms:
+            return list(passages)
+        counts = [Counter(_words(passage["text"])) for passage in passages]
+        document_frequency = Counter(term for count in counts for term in terms if term in count)
+        average_length = sum(sum(count.values()) for count in counts) / max(1, len(counts))
+        scores = []
+        for count in counts:
+            length = sum(count.values())
+            score = 0.0
+            for term in terms:
+                frequency = count.get(term, 0)
+                if frequency:
+                    idf = math.log(1 + (len(counts) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+                    score += idf * frequency * 2.2 / (frequency + 1.2 * (0.25 + 0.75 * length / max(1.0, average_length)))
+            scores.append(score)
+        order = sorted(range(len(passages)), key=lambda i: (-scores[i], i))
+        return [passages[i] for i in order]
+
+    def pack(self, text: str, query: Optional[str] = None) -> str:
+        """Return the packed form of ``text``, ranked against ``query`` (default: ``self.query``)"""
+        query = self.query if query is None else query
+        sources = split_sources(text)
+        passages = [{"source": url, "text": line, "also": []}
+                    for url, lines in sources for line in lines]
+        total = len(passages)
+
+        boilerplate = 0
+        if self.strip_boilerplate and estimate_tokens(text) > self.token_budget:
+            terms = query_terms(query)
+            line_sources = Counter(line for url, lines in sources if url is not None for line in set(lines))
+
+            def is_chrome(passage: Dict[str, Any]) -> bool:
+                line = passage["text"]
+                if passage["source"] is None or MARKDOWN_LINE_PATTERN.match(line) or terms.intersection(_words(line)):
+                    return False
+                return is_boilerplate(line) or line_sources[line] >= REPEATED_LINE_SOURCES
+
+            kept = [passage for passage in passages if not is_chrome(passage)]
+            boilerplate = len(passages) - len(kept)
+            passages = kept
+
+        duplicates = self._deduplicate(passages)
+        passages = [passage for passage in passages if not passage.get("duplicate")]
+
+        used, selected = 0, set()
+        for passage in self._rank(passages, query):
+            cost = estimate_tokens(passage["text"]) + 1
+            if used + cost <= self.token_budget:
+                selected.add(id(passage))
+                used += cost
+
+        groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for passage in passages:
+            if id(passage) in selected:
+                groups.setdefault(passage["source"], []).append(passage)
+        sections = []
+        for url, group in groups.items():
+            lines = []
+            if url:
+                also = sorted({other for passage in group for other in passage["also"]})
+                lines.append(f"URL: {url}" + (f" (also reported by: {', '.join(also)})" if also else ""))
+            lines.extend(passage["text"] for passage in group)
+            sections.append("\n".join(lines))
+        packed = "\n\n---\n\n".join(sections)
+
+        tokens_in, tokens_out = estimate_tokens(text), estimate_tokens(packed)
+        self.stats = {
+            "sources": len(sources),
+            "passages": total,
+            "boilerplate_removed": boilerplate,
+            "duplicates_removed": duplicates,
+            "passages_kept": len(selected),
+            "token_budget": self.token_budget,
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
+            "tokens_saved": max(0, tokens_in - tokens_out),
+        }
+        return packed
+
+    def capture_inputs(self, inputs: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Crew before-kickoff callback: remember the question to rank passages against"""
+        self.query = str((inputs or {}).get("question", ""))
+        return inputs
+
+    def guardrail(self, task_output) -> Tuple[bool, Any]:
+        """Task guardrail that replaces the task's output with its packed form"""
+        packed = self.pack(task_output.raw or "")
+        # Never hand the next task nothing because everything looked like boilerplate
+        return True, packed if packed.strip() else task_output.raw
@@ -0,0 +1,147 @@
+# On-disk cache of scraped article text, revalidated with conditional requests
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Where scraped pages live, how long they are served without asking the site
+# again and how many pages are kept
+DEFAULT_SCRAPE_CACHE_PATH = os.path.join(os.getenv("NEWS_CACHE_DIR", ".cache"), "scrape_cache.sqlite3")
+DEFAULT_FRESH_SECONDS = 900
+DEFAULT_MAX_PAGES = 2000
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ScrapeCache:
+    """
+    SQLite-backed cache of extracted page text keyed by URL.
+
+    A page fetched less than ``fresh_seconds`` ago is served as is. An older one
+    is revalidated with ``If-None-Match`` / ``If-Modified-Since`` and served from
+    the cache on ``304 Not Modified``. Texts are stored once per content hash, so
+    syndicated copies of an article under different URLs share one entry. Fetch
+    and extract timings are kept per page and summed in ``stats()``.
+    """
+
+    def __init__(self, path: str = DEFAULT_SCRAPE_CACHE_PATH, fresh_seconds: float = DEFAULT_FRESH_SECONDS,
+                 max_pages: int = DEFAULT_MAX_PAGES):
+        self.path = os.path.abspath(path)
+        self.fresh_seconds = fresh_seconds
+        self.max_pages = max_pages
+        self.counters = {"fresh": 0, "revalidated": 0, "fetched": 0, "deduplicated": 0, "stale": 0}
+        self.timings = {"fetch_seconds": 0.0, "extract_seconds": 0.0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, text_hash TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                "truncated INTEGER NOT NULL DEFAULT 0, fetched_at REAL NOT NULL, validated_at REAL NOT NULL, "
+                "fetch_seconds REAL, extract_seconds REAL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS texts (hash TEXT PRIMARY KEY, text TEXT NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS pages_text_hash ON pages (text_hash)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def lookup(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Cached entries of ``urls``, with their text and a ``fresh`` flag.
+
+        Entries that are not fresh still carry the validators (``etag``,
+        ``last_modified``) to send with the conditional request.
+        """
+        if not urls:
+            return {}
+        now = time.time()
+        placeholders = ", ".join("?" * len(urls))
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT p.url, t.text, p.etag, p.last_modified, p.truncated, p.validated_at "
+                f"FROM pages p JOIN texts t ON t.hash = p.text_hash WHERE p.url IN ({placeholders})",
+                list(urls)
+            ).fetchall()
+        return {
+            url: {"text": text, "etag": etag, "last_modified": last_modified, "truncated": bool(truncated),
+                  "fresh": now - validated_at <= self.fresh_seconds}
+            for url, text, etag, last_modified, truncated, validated_at in rows
+        }
+
+    def record(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Store the outcome of a batch of fetches, as returned by ``scrape_urls``.
+
+        Fetched pages are stored (their text once per content hash), revalidated
+        pages get a new validation time, and every outcome is counted.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for result in results:
+                source = result.get("cache")
+                if source == "revalidated":
+                    conn.execute("UPDATE pages SET validated_at = ? WHERE url = ?", (now, result["url"]))
+                elif source == "fetched":
+                    digest = text_hash(result["full_text"])
+                    previous = conn.execute("SELECT text_hash FROM pages WHERE url = ?", (result["url"],)).fetchone()
+                    inserted = conn.execute("INSERT OR IGNORE INTO texts (hash, text) VALUES (?, ?)",
+                                            (digest, result["full_text"])).rowcount
+                    # Already stored for another URL, i.e. a syndicated copy
+                    if not inserted and (previous is None or previous[0] != digest):
+                        result["deduplicated"] = True
+                    conn.execute(
+                        "INSERT OR REPLACE INTO pages (url, text_hash, etag, last_modified, truncated, fetched_at, "
+                        "validated_at, fetch_seconds, extract_seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (result["url"], digest, result.get("etag"), result.get("last_modified"),
+                         int(result.get("body_truncated", False)), now, now,
+                         result.get("fetch_seconds"), result.get("extract_seconds"))
+                    )
+            conn.execute(
+                "DELETE FROM pages WHERE url IN ("
+                "SELECT url FROM pages ORDER BY validated_at DESC LIMIT -1 OFFSET ?)", (self.max_pages,))
+            conn.execute("DELETE FROM texts WHERE hash NOT IN (SELECT text_hash FROM pages)")
+            conn.execute("COMMIT")
+
+        with self._lock:
+            for result in results:
+                if result.get("cache") in self.counters:
+                    self.counters[result["cache"]] += 1
+                if result.get("deduplicated"):
+                    self.counters["deduplicated"] += 1
+                for timing in self.timings:
+                    self.timings[timing] += result.get(timing) or 0.0
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM pages")
+            conn.execute("DELETE FROM texts")
+
+    def page_timings(self, url: str) -> Optional[Dict[str, float]]:
+        """Fetch and extract timings of the last full fetch of ``url``"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT fetch_seconds, extract_seconds FROM pages WHERE url = ?", (url,)).fetchone()
+        return {"fetch_seconds": row[0], "extract_seconds": row[1]} if row else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Outcome counters and timings of this process, and the current size of the store"""
+        with self._connect() as conn:
+            pages = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            texts, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM texts").fetchone()
+        lookups = sum(self.counters[key] for key in ("fresh", "revalidated", "fetched", "stale"))
+        served = self.counters["fresh"] + self.counters["revalidated"]
+        return {
+            **self.counters,
+            **{timing: round(seconds, 3) for timing, seconds in self.timings.items()},
+            "hit_rate": served / lookups if lookups else 0.0,
+            "pages": pages,
+            "texts": texts,
+            "bytes": size,
+        }
@@ -0,0 +1,241 @@
+# Concurrent scraping of many URLs in one tool call
+import asyncio
+import re
+import threading
+import time
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Type
+from urllib.parse import urlparse
+
+import aiohttp
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from tools.scrape_cache import ScrapeCache
+
+# Connection pool and politeness limits
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_PER_HOST_LIMIT = 2
+DEFAULT_TIMEOUT_SECONDS = 15
+# Bytes downloaded per page at most, and characters of extracted text returned per page
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_MAX_CHARS = 20_000
+READ_CHUNK_BYTES = 64 * 1024
+
+USER_AGENT = "Mozilla/5.0 (compatible; NewsResearchAssistant/1.0)"
+
+# Elements whose text is never article content
+SKIPPED_TAGS = {"script", "style", "noscript", "template", "svg", "head", "iframe"}
+BLOCK_TAGS = {"p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6", "tr", "section", "article",
+              "header", "footer", "blockquote", "pre"}
+
+
+class _TextExtractor(HTMLParser):
+    """Collect visible text, with line breaks at block elements"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def extract_text(html: str) -> str:
+    """Visible text of an HTML page, one paragraph per line"""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(parser.parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str, connection_slots: asyncio.Semaphore,
+                 host_slots: asyncio.Semaphore, timeout: aiohttp.ClientTimeout, max_bytes: int,
+                 cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    result: Dict[str, Any] = {"url": url}
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    # The timeout starts once the request has a slot for its site and a connection,
+    # so time spent queued behind other pages does not count against it
+    async with host_slots, connection_slots:
+        started = time.perf_counter()
+        try:
+            result.update(await _get(session, url, headers, timeout, max_bytes))
+        except asyncio.TimeoutError:
+            result["error"] = "Timed out"
+        except aiohttp.ClientError as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = round(time.perf_counter() - started, 3)
+
+    if result.get("status") == 304 and not cached:
+        # Not Modified is only an answer to our conditional request; without a copy there is no text
+        result["error"] = "HTTP 304 without a cached copy"
+    elif result.get("status") == 304:
+        result.update(cache="revalidated", full_text=cached["text"], body_truncated=cached["truncated"])
+    elif "error" in result and cached:
+        # Better an older copy of the page than none
+        result.update(cache="stale", full_text=cached["text"], body_truncated=cached["truncated"])
+        del result["error"]
+    return result
+
+
+async def _get(session: aiohttp.ClientSession, url: str, headers: Dict[str, str],
+               timeout: aiohttp.ClientTimeout, max_bytes: int) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    started = time.perf_counter()
+    async with session.get(url, headers=headers, timeout=timeout) as response:
+        result["status"] = response.status
+        if response.status == 304:
+            return result
+        if response.status >= 400:
+            result["error"] = f"HTTP {response.status}"
+            return result
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                result["body_truncated"] = True
+                break
+        result["etag"] = response.headers.get("ETag")
+        result["last_modified"] = response.headers.get("Last-Modified")
+        charset, content_type = response.charset or "utf-8", response.content_type or ""
+    result["fetch_seconds"] = round(time.perf_counter() - started, 4)
+
+    started = time.perf_counter()
+    try:
+        page = bytes(body[:max_bytes]).decode(charset, errors="replace")
+    except LookupError:
+        page = bytes(body[:max_bytes]).decode("utf-8", errors="replace")
+    is_html = "html" in content_type or page.lstrip()[:1] == "<"
+    result["full_text"] = extract_text(page) if is_html else page
+    result["extract_seconds"] = round(time.perf_counter() - started, 4)
+    result["cache"] = "fetched"
+    return result
+
+
+async def scrape_urls(urls: List[str], max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                      per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                      timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+                      max_bytes: int = DEFAULT_MAX_BYTES,
+                      max_chars: int = DEFAULT_MAX_CHARS,
+                      cache: Optional[ScrapeCache] = None) -> List[Dict[str, Any]]:
+    """
+    Fetch and extract all URLs concurrently over one pooled keep-alive session, in input order.
+
+    With a ``cache``, fresh pages are answered without a request, older ones are
+    revalidated with conditional requests, a failed fetch falls back to the
+    cached copy, and every fetched page is stored. Each result has ``url`` and
+    either ``text`` or ``error``, plus ``cache`` (fresh, revalidated, fetched
+    or stale), ``truncated`` and the fetch and extract timings.
+    """
+    cached = cache.lookup(urls) if cache is not None else {}
+    results: Dict[str, Dict[str, Any]] = {
+        url: {"url": url, "cache": "fresh", "full_text": entry["text"], "body_truncated": entry["truncated"]}
+        for url, entry in cached.items() if entry["fresh"]
+    }
+    pending = [url for url in urls if url not in results]
+
+    if pending:
+        host_slots = {host: asyncio.Semaphore(per_host_limit) for host in {urlparse(url).netloc for url in pending}}
+        # Mirrors the connector's pool limit, which would otherwise queue requests inside the timeout
+        connection_slots = asyncio.Semaphore(max_connections)
+        connector = aiohttp.TCPConnector(limit=max_connections, limit_per_host=per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        async with aiohttp.ClientSession(connector=connector, headers={"User-Agent": USER_AGENT}) as session:
+            fetched = await asyncio.gather(*(
+                _fetch(session, url, connection_slots, host_slots[urlparse(url).netloc], timeout, max_bytes,
+                       cached.get(url))
+                for url in pending
+            ))
+        results.update((result["url"], result) for result in fetched)
+
+    ordered = [results[url] for url in urls]
+    if cache is not None:
+        cache.record(ordered)
+    for result in ordered:
+        if "full_text" in result:
+            text = result.pop("full_text")
+            result["text"] = text[:max_chars]
+            result["truncated"] = result.pop("body_truncated", False) or len(text) > max_chars
+    return ordered
+
+
+def _run_coroutine(coroutine):
+    """Run a coroutine to completion, also when called from inside a running event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    outcome: Dict[str, Any] = {}
+
+    def target():
+        try:
+            outcome["value"] = asyncio.run(coroutine)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+class BatchScrapeInput(BaseModel):
+    urls: List[str] = Field(..., description="List of website URLs to scrape in one call")
+
+
+class BatchScrapeTool(BaseTool):
+    name: str = "BatchScrapeTool"
+    description: str = (
+        "Scrape many websites at once. Pass a list of URLs; their pages are fetched concurrently "
+        "and the extracted text of every page is returned in one result. Prefer this over scraping "
+        "URLs one at a time."
+    )
+    args_schema: Type[BaseModel] = BatchScrapeInput
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    max_bytes: int = DEFAULT_MAX_BYTES
+    max_chars: int = DEFAULT_MAX_CHARS
+    # ScrapeCache shared across calls; None fetches every page every time
+    scrape_cache: Any = None
+
+    def _run(self, urls: List[str]) -> str:
+        # Drop duplicates and anything that is not an http(s) URL, keeping the order
+        unique = [url for url in dict.fromkeys(u.strip() for u in urls)
+                  if urlparse(url).scheme in ("http", "https")]
+        if not unique:
+            return "No valid http(s) URLs were given."
+
+        results = _run_coroutine(scrape_urls(unique, self.max_connections, self.per_host_limit,
+                                             self.timeout_seconds, self.max_bytes, self.max_chars,
+                                             self.scrape_cache))
+        sections = []
+        for result in results:
+            if "error" in result:
+                sections.append(f"URL: {result['url']}\nError: {result['error']}")
+            else:
+                note = " (truncated)" if result.get("truncated") else ""
+                sections.append(f"URL: {result['url']}\nContent{note}:\n{result['text']}")
+        return "\n\n---\n\n".join(sections)
@@ -0,0 +1,139 @@
+# On-disk TTL cache for search tools, shared by every user and run on this host
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from crewai.tools import BaseTool
+
+# Where cached results live, how long they stay fresh and how many are kept
+DEFAULT_CACHE_PATH = os.path.join(os.getenv("NEWS_CACHE_DIR", ".cache"), "search_cache.sqlite3")
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share a cache entry"""
+    return " ".join(str(query or "").casefold().split())
+
+
+class SearchCache:
+    """SQLite-backed search result cache with a TTL, LRU eviction and hit/miss counters"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = os.path.abspath(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a fresh cached value, or None (expired entries count as misses)"""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT value, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] <= self.ttl_seconds:
+                conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            else:
+                row = None
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value, then drop expired entries and the least recently used beyond max_entries"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO results (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                         (key, value, now, now))
+            conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this process and the current size of the store"""
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM results").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+class CachedSearchTool(BaseTool):
+    """Wraps a search tool (EXA, or any stand-in backend) and answers repeated searches from the cache"""
+
+    name: str = "EXASearchTool"
+    description: str = "Search the internet"
+    search_tool: Any = None
+    search_cache: Any = None
+    # Backend settings that change the results, so they are part of the cache key
+    search_settings: Dict[str, Any] = {}
+
+    def __init__(self, search_tool, search_cache: Optional[SearchCache] = None,
+                 search_settings: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(
+            name=search_tool.name,
+            description=search_tool.description,
+            args_schema=search_tool.args_schema,
+            search_tool=search_tool,
+            search_cache=search_cache or SearchCache(),
+            search_settings=search_settings or {},
+            **kwargs
+        )
+
+    def cache_key(self, search_query: str, start_published_date: Optional[str] = None,
+                  end_published_date: Optional[str] = None,
+                  include_domains: Optional[List[str]] = None, **kwargs) -> str:
+        return self.search_cache.make_key({
+            "query": normalize_query(search_query),
+            "start_published_date": start_published_date,
+            "end_published_date": end_published_date,
+            "include_domains": sorted(include_domains) if include_domains else None,
+            "settings": self.search_settings,
+            **kwargs,
+        })
+
+    def _run(self, search_query: str, **kwargs) -> str:
+        key = self.cache_key(search_query, **kwargs)
+        cached = self.search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self.search_tool._run(search_query=search_query, **kwargs)
+        # Agents only ever see the text form of the result, so that is what is stored
+        value = result if isinstance(result, str) else str(result)
+        self.search_cache.put(key, value)
+        return value
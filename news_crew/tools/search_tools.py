@@ -1,15 +1,42 @@
 # This file imports and configures search tools
 from crewai_tools import EXASearchTool, ScrapeWebsiteTool
 
-def create_exa_tool(api_key, content=True, summary=True, type="keyword"):
-    """Create and configure an EXA search tool"""
-    return EXASearchTool(
+from tools.scrape_tools import (DEFAULT_MAX_BYTES, DEFAULT_MAX_CHARS, DEFAULT_MAX_CONNECTIONS, DEFAULT_PER_HOST_LIMIT,
+                                 DEFAULT_TIMEOUT_SECONDS, BatchScrapeTool)
+from tools.scrape_cache import DEFAULT_FRESH_SECONDS, DEFAULT_MAX_PAGES, ScrapeCache
+from tools.search_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, CachedSearchTool, SearchCache
+
+def create_exa_tool(api_key, content=True, summary=True, type="keyword",
+                    cache=True, cache_ttl=DEFAULT_TTL_SECONDS, cache_max_entries=DEFAULT_MAX_ENTRIES):
+    """Create and configure an EXA search tool, behind an on-disk result cache unless cache=False"""
+    exa_tool = EXASearchTool(
         api_key=api_key,
         content=content,
         summary=summary,
         type=type
     )
+    if not cache:
+        return exa_tool
+    return CachedSearchTool(
+        exa_tool,
+        search_cache=SearchCache(ttl_seconds=cache_ttl, max_entries=cache_max_entries),
+        search_settings={"content": content, "summary": summary, "type": type}
+    )
 
 def create_scrape_tool():
     """Create a website scraping tool"""
-    return ScrapeWebsiteTool()
\ No newline at end of file
+    return ScrapeWebsiteTool()
+
+def create_batch_scrape_tool(max_connections=DEFAULT_MAX_CONNECTIONS, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                             timeout_seconds=DEFAULT_TIMEOUT_SECONDS, max_bytes=DEFAULT_MAX_BYTES,
+                             max_chars=DEFAULT_MAX_CHARS, cache=True,
+                             cache_fresh_seconds=DEFAULT_FRESH_SECONDS, cache_max_pages=DEFAULT_MAX_PAGES):
+    """Create a tool that scrapes a list of websites concurrently in one call, behind an on-disk page cache unless cache=False"""
+    return BatchScrapeTool(
+        max_connections=max_connections,
+        per_host_limit=per_host_limit,
+        timeout_seconds=timeout_seconds,
+        max_bytes=max_bytes,
+        max_chars=max_chars,
+        scrape_cache=ScrapeCache(fresh_seconds=cache_fresh_seconds, max_pages=cache_max_pages) if cache else None
+    )